@@ -0,0 +1,379 @@
+"""Async facade over the `tools.py` wrappers.
+
+`AsyncPrimitiveErc3APIClient` exposes the same methods and normalized return types as
+`PrimitiveErc3APIClient` (`PagedResult`, `TimeEntries`, `TimeSummary` lists, ...) as coroutines, so
+an orchestrator can overlap API I/O with LLM calls and with other tasks.
+
+The upstream `Erc3Client` is blocking, so each coroutine runs exactly one sync wrapper call on a
+bounded worker pool (`max_concurrency`). Both APIs therefore share a single normalization
+implementation and cannot drift apart. Point `base_url` at a local stub server, or pass a
+preconfigured sync `client`, to exercise the async path without the real API.
+
+`AsyncMemoryErc3Client.create(...)` runs the `MemoryErc3Client` prefetch on the event loop: all
+registry and time fetches are awaited concurrently and joined in the same fixed order as the sync
+concurrent prefetch, so the resulting `UserContext` is identical. Both async clients own a worker
+pool: `close()` them, or use them as `async with` context managers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from policy import (
+    AgentLink,
+    BillableFilter,
+    Company,
+    DealPhase,
+    Employee,
+    EmployeeID,
+    Outcome,
+    Project,
+    ProjectID,
+    SkillFilter,
+    SkillLevel,
+    TimeEntriesRequest,
+    TimeEntries,
+    TimeEntry,
+    TimeEntryID,
+    TimeSummary,
+    UserContext,
+    WikiArticle,
+    WikiSearchSnippet,
+)
+from snapshot_cache import SnapshotCache
+from tools import MemoryErc3Client, PagedResult, PrefetchPolicy, PrimitiveErc3APIClient, WikiListResult
+from transport import PooledTransport
+from wiki_cache import WikiPageCache
+
+R = TypeVar("R")
+
+
+class AsyncPrimitiveErc3APIClient:
+    """Coroutine versions of the `PrimitiveErc3APIClient` wrappers."""
+
+    def __init__(
+            self,
+            base_url: Optional[str] = None,
+            strict: bool = False,
+            transport: Optional[PooledTransport] = None,
+            client: Optional[PrimitiveErc3APIClient] = None,
+            max_concurrency: int = 8,
+            wiki_cache: Optional[WikiPageCache] = None,
+    ):
+        if client is None:
+            if base_url is None:
+                raise ValueError("Either base_url or client is required")
+            client = PrimitiveErc3APIClient(base_url=base_url, strict=strict, transport=transport, wiki_cache=wiki_cache)
+        self.sync = client
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="erc3-async")
+
+    async def __aenter__(self) -> AsyncPrimitiveErc3APIClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def run(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Run one blocking call on the client's worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    # -----------------------------
+    # Core
+    # -----------------------------
+
+    async def who_am_i(self) -> UserContext:
+        return await self.run(self.sync.who_am_i)
+
+    async def provide_agent_response(
+            self, message: str, outcome: Outcome, links: Optional[List[AgentLink]] = None
+    ) -> None:
+        await self.run(self.sync.provide_agent_response, message=message, outcome=outcome, links=links)
+
+    # -----------------------------
+    # Employees
+    # -----------------------------
+
+    async def list_employees(self, offset: int, limit: int) -> PagedResult[Employee]:
+        return await self.run(self.sync.list_employees, offset=offset, limit=limit)
+
+    async def search_employees(
+            self,
+            offset: int,
+            limit: int,
+            query: Optional[str] = None,
+            location: Optional[str] = None,
+            department: Optional[str] = None,
+            manager: Optional[str] = None,
+            skills: Optional[List[SkillFilter]] = None,
+            wills: Optional[List[SkillFilter]] = None,
+    ) -> PagedResult[Employee]:
+        return await self.run(
+            self.sync.search_employees,
+            offset=offset,
+            limit=limit,
+            query=query,
+            location=location,
+            department=department,
+            manager=manager,
+            skills=skills,
+            wills=wills,
+        )
+
+    async def get_employee(self, employee_id: EmployeeID) -> Optional[Employee]:
+        return await self.run(self.sync.get_employee, employee_id)
+
+    async def update_employee_info(
+            self,
+            employee: EmployeeID,
+            notes: Optional[str] = None,
+            salary: Optional[int] = None,
+            skills: Optional[List[SkillLevel]] = None,
+            wills: Optional[List[SkillLevel]] = None,
+            location: Optional[str] = None,
+            department: Optional[str] = None,
+            changed_by: Optional[EmployeeID] = None,
+    ) -> Optional[Employee]:
+        return await self.run(
+            self.sync.update_employee_info,
+            employee=employee,
+            notes=notes,
+            salary=salary,
+            skills=skills,
+            wills=wills,
+            location=location,
+            department=department,
+            changed_by=changed_by,
+        )
+
+    # -----------------------------
+    # Wiki
+    # -----------------------------
+
+    async def list_wiki(self) -> WikiListResult:
+        return await self.run(self.sync.list_wiki)
+
+    async def load_wiki(self, file: str) -> WikiArticle:
+        return await self.run(self.sync.load_wiki, file)
+
+    async def load_wiki_many(
+            self,
+            paths: Sequence[str],
+            wiki_sha1: Optional[str] = None,
+            max_workers: int = 8,
+            refresh: bool = False,
+    ) -> List[WikiArticle]:
+        return await self.run(
+            self.sync.load_wiki_many, paths, wiki_sha1=wiki_sha1, max_workers=max_workers, refresh=refresh
+        )
+
+    async def search_wiki(self, query_regex: str) -> List[WikiSearchSnippet]:
+        return await self.run(self.sync.search_wiki, query_regex)
+
+    async def update_wiki(self, file: str, content: str, changed_by: Optional[EmployeeID] = None) -> None:
+        await self.run(self.sync.update_wiki, file=file, content=content, changed_by=changed_by)
+
+    # -----------------------------
+    # Customers
+    # -----------------------------
+
+    async def list_customers(self, offset: int, limit: int) -> PagedResult[Company]:
+        return await self.run(self.sync.list_customers, offset=offset, limit=limit)
+
+    async def search_customers(
+            self,
+            offset: int,
+            limit: int,
+            query: Optional[str] = None,
+            deal_phase: Optional[List[DealPhase]] = None,
+            account_managers: Optional[List[EmployeeID]] = None,
+            locations: Optional[List[str]] = None,
+    ) -> PagedResult[Company]:
+        return await self.run(
+            self.sync.search_customers,
+            offset=offset,
+            limit=limit,
+            query=query,
+            deal_phase=deal_phase,
+            account_managers=account_managers,
+            locations=locations,
+        )
+
+    async def get_customer(self, customer_id: str) -> Optional[Company]:
+        return await self.run(self.sync.get_customer, customer_id)
+
+    # -----------------------------
+    # Projects
+    # -----------------------------
+
+    async def list_projects(self, offset: int, limit: int) -> PagedResult[Project]:
+        return await self.run(self.sync.list_projects, offset=offset, limit=limit)
+
+    async def search_projects(
+            self,
+            offset: int,
+            limit: int,
+            query: Optional[str] = None,
+            customer_id: Optional[str] = None,
+            status: Optional[List[DealPhase]] = None,
+            team: Optional[Dict[str, Any]] = None,
+            include_archived: bool = False,
+    ) -> PagedResult[Project]:
+        return await self.run(
+            self.sync.search_projects,
+            offset=offset,
+            limit=limit,
+            query=query,
+            customer_id=customer_id,
+            status=status,
+            team=team,
+            include_archived=include_archived,
+        )
+
+    async def get_project(self, project_id: ProjectID) -> Optional[Project]:
+        return await self.run(self.sync.get_project, project_id)
+
+    async def update_project_team(
+            self, project_id: ProjectID, team: List[Dict[str, Any]], changed_by: Optional[EmployeeID] = None
+    ) -> None:
+        await self.run(self.sync.update_project_team, project_id=project_id, team=team, changed_by=changed_by)
+
+    async def update_project_status(
+            self, project_id: ProjectID, status: DealPhase, changed_by: Optional[EmployeeID] = None
+    ) -> None:
+        await self.run(self.sync.update_project_status, project_id=project_id, status=status, changed_by=changed_by)
+
+    # -----------------------------
+    # Time tracking
+    # -----------------------------
+
+    async def log_time_entry(self, request: TimeEntry) -> TimeEntry:
+        return await self.run(self.sync.log_time_entry, request)
+
+    async def update_time_entry(self, request: TimeEntry) -> None:
+        await self.run(self.sync.update_time_entry, request)
+
+    async def get_time_entry(self, entry_id: TimeEntryID) -> Optional[TimeEntry]:
+        return await self.run(self.sync.get_time_entry, entry_id)
+
+    async def search_time_entries(self, limit: int, offset: int, request: TimeEntriesRequest) -> TimeEntries:
+        return await self.run(self.sync.search_time_entries, limit=limit, offset=offset, request=request)
+
+    async def time_summary_by_project(
+            self,
+            date_from: str,
+            date_to: str,
+            customers: Optional[List[str]] = None,
+            projects: Optional[List[str]] = None,
+            employees: Optional[List[str]] = None,
+            billable: BillableFilter = "",
+    ) -> List[TimeSummary]:
+        return await self.run(
+            self.sync.time_summary_by_project,
+            date_from=date_from,
+            date_to=date_to,
+            customers=customers,
+            projects=projects,
+            employees=employees,
+            billable=billable,
+        )
+
+    async def time_summary_by_employee(
+            self,
+            date_from: str,
+            date_to: str,
+            customers: Optional[List[str]] = None,
+            projects: Optional[List[str]] = None,
+            employees: Optional[List[str]] = None,
+            billable: BillableFilter = "",
+    ) -> List[TimeSummary]:
+        return await self.run(
+            self.sync.time_summary_by_employee,
+            date_from=date_from,
+            date_to=date_to,
+            customers=customers,
+            projects=projects,
+            employees=employees,
+            billable=billable,
+        )
+
+
+class AsyncMemoryErc3Client(MemoryErc3Client):
+    """`MemoryErc3Client` whose prefetch runs on the event loop.
+
+    Build with `await AsyncMemoryErc3Client.create(...)`; the instance then behaves like a regular
+    `MemoryErc3Client`, with `aio` exposing the async wrappers over the same underlying client.
+    `close()` (or `async with`) shuts down the `aio` worker pool.
+    """
+
+    aio: AsyncPrimitiveErc3APIClient
+
+    @classmethod
+    async def create(
+            cls,
+            base_url: str,
+            date_from: str,
+            date_to: str,
+            policy: Optional[PrefetchPolicy] = None,
+            cache: Optional[SnapshotCache] = None,
+            transport: Optional[PooledTransport] = None,
+            wiki_cache: Optional[WikiPageCache] = None,
+    ) -> AsyncMemoryErc3Client:
+        self = cls.__new__(cls)
+        self._configure(base_url, date_from, date_to, policy, transport, wiki_cache)
+        self.aio = AsyncPrimitiveErc3APIClient(client=self, max_concurrency=self.policy.max_workers)
+        try:
+            self.user_context = await self.aio.who_am_i()
+
+            cache_key, cached = await self.aio.run(self._lookup_snapshot, cache)
+            if cached is not None:
+                self._load_snapshot(cached)
+            else:
+                await self._prefetch_async(date_from=date_from, date_to=date_to)
+
+            await self.aio.run(self._finish_prefetch, cache, cache_key, cached)
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    async def __aenter__(self) -> AsyncMemoryErc3Client:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.aio.close()
+
+    async def _prefetch_async(self, *, date_from: str, date_to: str) -> None:
+        summary_kwargs = self._summary_kwargs(date_from=date_from, date_to=date_to)
+
+        calls = [
+            self.aio.run(self._fetch_all_employees),
+            self.aio.run(self._fetch_all_customers),
+            self.aio.run(self._fetch_all_projects),
+            self.aio.run(self._fetch_time_entries, date_from=date_from, date_to=date_to),
+        ]
+        if self._needs_remote_summaries():
+            calls.append(self.aio.time_summary_by_project(**summary_kwargs))
+            calls.append(self.aio.time_summary_by_employee(**summary_kwargs))
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        # Deterministic join: the first failure in call order is re-raised.
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        self.user_context.employees = results[0]
+        self.user_context.customers = results[1]
+        self.user_context.projects = results[2]
+        self._assign_time_entries(results[3])
+        self._assign_time_summaries((results[4], results[5]) if len(results) > 4 else None)
@@ -0,0 +1,131 @@
+"""Micro-benchmark: strict (`model_from`) vs fast-path (`ModelConverter`) DTO conversion.
+
+Synthetic upstream DTOs mirror the `erc3.erc3.dtos` shapes for employees and time entries.
+
+Usage:
+    python bench_conversion.py [--rows 10000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+from typing import Any, Callable, List, Optional
+
+from pydantic import BaseModel
+
+from conversion import ModelConverter, model_from
+from policy import Employee, TimeEntry
+
+
+class _SkillDTO(BaseModel):
+    name: str
+    level: int
+
+
+class _EmployeeDTO(BaseModel):
+    id: str
+    name: str
+    email: str
+    salary: int
+    location: str
+    department: str
+    notes: Optional[str] = None
+    skills: List[_SkillDTO] = []
+    wills: List[_SkillDTO] = []
+
+
+class _TimeEntryDTO(BaseModel):
+    id: str
+    employee: str
+    customer: Optional[str] = None
+    project: Optional[str] = None
+    date: str
+    hours: float
+    work_category: str
+    notes: str
+    billable: bool
+    status: str
+    logged_by: Optional[str] = None
+    changed_by: str
+
+
+def _employees(rows: int) -> List[_EmployeeDTO]:
+    return [
+        _EmployeeDTO(
+            id=f"emp_{i:05d}",
+            name=f"Employee {i}",
+            email=f"employee{i}@example.com",
+            salary=50_000 + i,
+            location=("Vienna", "Rotterdam", "Munich")[i % 3],
+            department=("Production", "Sales", "HR")[i % 3],
+            notes=None,
+            skills=[_SkillDTO(name=f"skill_{k}", level=(i + k) % 10 + 1) for k in range(5)],
+            wills=[_SkillDTO(name=f"will_{k}", level=(i * k) % 10 + 1) for k in range(3)],
+        )
+        for i in range(rows)
+    ]
+
+
+def _time_entries(rows: int) -> List[_TimeEntryDTO]:
+    return [
+        _TimeEntryDTO(
+            id=f"te_{i:06d}",
+            employee=f"emp_{i % 500:05d}",
+            customer=f"cust_{i % 40:03d}",
+            project=f"proj_{i % 120:03d}",
+            date=f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            hours=float(i % 8 + 1),
+            work_category="customer_project",
+            notes="synthetic",
+            billable=i % 3 != 0,
+            status="approved",
+            logged_by=f"emp_{i % 500:05d}",
+            changed_by=f"emp_{i % 500:05d}",
+        )
+        for i in range(rows)
+    ]
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    # Like `timeit`, keep the cyclic GC out of the measurement.
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - started)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fast = ModelConverter()
+    cases = [
+        ("Employee", Employee, _employees(args.rows)),
+        ("TimeEntry", TimeEntry, _time_entries(args.rows)),
+    ]
+
+    print(f"{'model':<10} {'rows':>7} {'strict_s':>10} {'fast_s':>10} {'speedup':>8}")
+    for label, model_cls, dtos in cases:
+        strict_s = _best_of(args.repeat, lambda: [model_from(model_cls, d) for d in dtos])
+        fast_s = _best_of(args.repeat, lambda: fast.convert_many(model_cls, dtos))
+
+        # Both paths must produce the same normalized payload.
+        assert fast.convert_many(model_cls, dtos) == [model_from(model_cls, d) for d in dtos]
+
+        print(f"{label:<10} {len(dtos):>7} {strict_s:>10.4f} {fast_s:>10.4f} {strict_s / fast_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""DTO -> `policy.py` model conversion for `PrimitiveErc3APIClient`.
+
+The strict path (`model_from`) dumps each upstream DTO to a dict and then validates that dict into
+the local model, so every entity is copied and walked twice. `ModelConverter` adds a page-level
+fast path: for each (DTO class, model class) pair it compiles once
+- a field mapping check (the DTO must expose every required model field),
+- an extractor that exposes DTO fields without copying nested objects, and
+- a `TypeAdapter(List[model])`,
+and then validates a whole page in a single pydantic-core call with `from_attributes=True`.
+Entities are still validated (exactly once), so the result is identical to the strict path.
+
+Measured with `bench_conversion.py`: constructing models from Python-level field plans via
+`model_construct` is slower than pydantic-core validation, which is why the trusted path keeps
+validation and only removes the dump/copy and per-item dispatch.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+try:
+    from pydantic import TypeAdapter
+except ImportError:  # pydantic v1: strict path only
+    TypeAdapter = None  # type: ignore[assignment,misc]
+
+TModel = TypeVar("TModel", bound=BaseModel)
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    if obj is None:
+        return {}
+    if isinstance(obj, dict):
+        return obj  # type: ignore[return-value]
+    model_dump = getattr(obj, "model_dump", None)
+    if callable(model_dump):
+        return model_dump()  # type: ignore[return-value]
+    to_dict_method = getattr(obj, "dict", None)
+    if callable(to_dict_method):
+        return to_dict_method()  # type: ignore[return-value]
+    raise TypeError(f"Unsupported DTO object type: {type(obj).__name__}")
+
+
+def model_from(model_cls: Type[TModel], dto_obj: Any) -> TModel:
+    payload = to_dict(dto_obj)
+    model_validate = getattr(model_cls, "model_validate", None)
+    if callable(model_validate):
+        return model_validate(payload)
+    return model_cls.parse_obj(payload)  # pydantic v1
+
+
+class _PagePlan:
+    """Compiled conversion of one DTO class into one policy model."""
+
+    __slots__ = ("extract", "adapter")
+
+    def __init__(self, extract: Optional[Callable[[Any], Any]], adapter: Any):
+        self.extract = extract
+        self.adapter = adapter
+
+
+def _compile_plan(dto_cls: type, model_cls: Type[BaseModel]) -> Optional[_PagePlan]:
+    model_fields = getattr(model_cls, "model_fields", None)
+    if TypeAdapter is None or model_fields is None:
+        return None
+
+    model_cls.model_rebuild()  # resolve forward references between policy models
+    required = {name for name, field in model_cls.model_fields.items() if field.is_required()}
+
+    if issubclass(dto_cls, dict):
+        extract = None
+    else:
+        dto_fields = getattr(dto_cls, "model_fields", None)
+        if dto_fields is not None:
+            # pydantic v2 DTO: field values live in `__dict__`; a shallow view avoids `model_dump()`
+            # and leaves nested DTOs to be read by attribute.
+            if not required.issubset(dto_fields):
+                return None
+            extract = vars
+        else:
+            extract = None  # plain objects are read by attribute
+
+    return _PagePlan(extract=extract, adapter=TypeAdapter(List[model_cls]))
+
+
+class ModelConverter:
+    """Converts upstream DTOs into `policy.py` models.
+
+    - `strict=True` always uses `model_from` (dump + per-item validation); intended for tests.
+    - `strict=False` validates whole pages through a compiled per-DTO-class plan, falling back to
+      `model_from` for heterogeneous pages or when no plan can be compiled.
+    """
+
+    def __init__(self, strict: bool = False):
+        self.strict = strict
+        self._plans: Dict[Tuple[type, Type[BaseModel]], Optional[_PagePlan]] = {}
+        self._lock = threading.Lock()
+
+    def convert(self, model_cls: Type[TModel], dto_obj: Any) -> TModel:
+        return self.convert_many(model_cls, [dto_obj])[0]
+
+    def convert_many(self, model_cls: Type[TModel], dto_objs: Optional[List[Any]]) -> List[TModel]:
+        items = list(dto_objs or [])
+        if self.strict or not items:
+            return [model_from(model_cls, obj) for obj in items]
+
+        dto_cls = type(items[0])
+        if dto_cls is type(None) or any(type(obj) is not dto_cls for obj in items):
+            return [model_from(model_cls, obj) for obj in items]
+
+        plan = self._plan(dto_cls, model_cls)
+        if plan is None:
+            return [model_from(model_cls, obj) for obj in items]
+
+        if plan.extract is not None:
+            items = [plan.extract(obj) for obj in items]
+        return plan.adapter.validate_python(items, from_attributes=True)
+
+    def _plan(self, dto_cls: type, model_cls: Type[BaseModel]) -> Optional[_PagePlan]:
+        key = (dto_cls, model_cls)
+        try:
+            return self._plans[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._plans:
+                self._plans[key] = _compile_plan(dto_cls, model_cls)
+            return self._plans[key]
@@ -0,0 +1,195 @@
+"""Generic paged-fetch engine for `PrimitiveErc3APIClient` list/search methods.
+
+`PagedFetcher` walks any `(offset, limit) -> (items, next_offset)` endpoint and:
+- learns the server's effective page size per endpoint: oversized limits that the server rejects
+  (HTTP 4xx other than auth/not-found/rate-limit, or a validation error on the request's `limit`)
+  are stepped down,
+  and silently capped pages (`next_offset - offset < limit`) shrink the limit. Any other error
+  (connection, timeout, auth, 5xx, or a response that fails model conversion) is raised at once
+  and nothing is learned;
+- after the first page, optionally issues the following offset windows concurrently
+  (`fanout` pages per wave), assuming contiguous offset paging;
+- merges pages strictly in offset order and stops at the first page without `next_offset`, so the
+  result is identical to a serial `next_offset` walk. If the server's `next_offset` disagrees with
+  the speculated window, the speculative pages are discarded and paging resumes from the server's
+  `next_offset`;
+- records per-endpoint timing and page statistics in `stats`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from pydantic import BaseModel, Field, ValidationError
+
+T = TypeVar("T")
+
+PageFetch = Callable[[int, int], Tuple[List[T], Optional[int]]]
+
+# Limits tried (in order, below the configured one) when the server rejects the first page.
+_FALLBACK_LIMITS: Sequence[int] = (500, 100, 50, 20, 10, 5, 1)
+
+# 4xx statuses that say nothing about the page size.
+_NON_LIMIT_STATUSES = frozenset({401, 403, 404, 408, 429})
+
+
+def _status_code(exc: Exception) -> Optional[int]:
+    for source in (exc, getattr(exc, "response", None)):
+        for attr in ("status_code", "status"):
+            status = getattr(source, attr, None)
+            if isinstance(status, int):
+                return status
+    return None
+
+
+def _rejects_limit_field(exc: ValidationError) -> bool:
+    # Request models validate `limit` by name; converting a response page into `policy.py` models
+    # reports item/field locations instead, and must not be mistaken for a page-size rejection.
+    return any("limit" in error.get("loc", ()) for error in exc.errors())
+
+
+def rejects_page_size(exc: Exception) -> bool:
+    """True when `exc` means the request itself (its `limit`) was rejected, not that the call failed."""
+    if isinstance(exc, ValidationError):
+        return _rejects_limit_field(exc)
+    status = _status_code(exc)
+    return status is not None and 400 <= status < 500 and status not in _NON_LIMIT_STATUSES
+
+
+class EndpointPagingStats(BaseModel):
+    """Accumulated paging statistics for one endpoint."""
+
+    endpoint: str = Field(..., description="Endpoint label, e.g. list_employees")
+    scans: int = Field(0, description="Number of full scans")
+    pages: int = Field(0, description="Pages merged into results")
+    speculative_pages_discarded: int = Field(0, description="Concurrent pages fetched past the end or out of step")
+    items: int = Field(0, description="Items returned")
+    seconds: float = Field(0.0, description="Wall-clock seconds spent in scans")
+    page_limit: int = Field(0, description="Learned effective page size")
+
+
+class PagedFetcher:
+    """Adaptive, optionally concurrent offset pager with deterministic merge order."""
+
+    def __init__(
+            self,
+            page_limit: int = 999,
+            fanout: int = 1,
+            rejects_limit: Callable[[Exception], bool] = rejects_page_size,
+    ):
+        if page_limit <= 0:
+            raise ValueError("page_limit must be positive")
+        self.page_limit = page_limit
+        self.fanout = max(1, fanout)
+        self.rejects_limit = rejects_limit
+        self.stats: Dict[str, EndpointPagingStats] = {}
+        self._learned: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def fetch_all(self, endpoint: str, fetch_page: PageFetch) -> List[T]:
+        results: List[T] = []
+        for items in self.iter_pages(endpoint, fetch_page):
+            results.extend(items)
+        return results
+
+    def iter_pages(self, endpoint: str, fetch_page: PageFetch) -> Iterator[List[T]]:
+        """Yield page item lists in offset order."""
+        started = time.perf_counter()
+        pages = items_total = discarded = 0
+
+        items, next_offset, limit = self._first_page(endpoint, fetch_page)
+        pages, items_total = 1, len(items)
+        yield items
+
+        pool: Optional[ThreadPoolExecutor] = None
+        if self.fanout > 1 and next_offset is not None:
+            pool = ThreadPoolExecutor(max_workers=self.fanout)
+        try:
+            while next_offset is not None:
+                if pool is None:
+                    offset = next_offset
+                    items, next_offset = fetch_page(offset, limit)
+                    self._check_progress(endpoint, offset, next_offset)
+                    pages += 1
+                    items_total += len(items)
+                    yield items
+                    continue
+
+                wave: List[Tuple[int, Future]] = [
+                    (next_offset + i * limit, pool.submit(fetch_page, next_offset + i * limit, limit))
+                    for i in range(self.fanout)
+                ]
+                expected = next_offset
+                for position, (offset, future) in enumerate(wave):
+                    if offset != expected:
+                        # Server paging diverged from the speculated windows: resync from `expected`.
+                        discarded += self._discard(wave[position:])
+                        break
+                    items, next_offset = future.result()
+                    self._check_progress(endpoint, offset, next_offset)
+                    pages += 1
+                    items_total += len(items)
+                    yield items
+                    if next_offset is None:
+                        discarded += self._discard(wave[position + 1:])
+                        break
+                    expected = next_offset
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+            self._record(endpoint, limit, pages, items_total, discarded, time.perf_counter() - started)
+
+    def _first_page(self, endpoint: str, fetch_page: PageFetch) -> Tuple[List[T], Optional[int], int]:
+        with self._lock:
+            learned = self._learned.get(endpoint)
+
+        if learned is not None:
+            items, next_offset = fetch_page(0, learned)
+            self._check_progress(endpoint, 0, next_offset)
+            return items, next_offset, learned
+
+        candidates = [self.page_limit] + [c for c in _FALLBACK_LIMITS if c < self.page_limit]
+        last_error: Optional[Exception] = None
+        for limit in candidates:
+            try:
+                items, next_offset = fetch_page(0, limit)
+            except Exception as exc:
+                if not self.rejects_limit(exc):
+                    raise
+                last_error = exc  # server rejected the page size; step down
+                continue
+            self._check_progress(endpoint, 0, next_offset)
+            if next_offset is not None and 0 < next_offset < limit:
+                limit = next_offset  # server caps pages below the requested limit
+            with self._lock:
+                self._learned[endpoint] = limit
+            return items, next_offset, limit
+
+        assert last_error is not None
+        raise last_error
+
+    @staticmethod
+    def _check_progress(endpoint: str, offset: int, next_offset: Optional[int]) -> None:
+        if next_offset is not None and next_offset <= offset:
+            raise RuntimeError(f"{endpoint}: next_offset {next_offset} does not advance past offset {offset}")
+
+    @staticmethod
+    def _discard(wave: List[Tuple[int, Future]]) -> int:
+        for _, future in wave:
+            future.cancel()
+        return len(wave)
+
+    def _record(self, endpoint: str, limit: int, pages: int, items: int, discarded: int, seconds: float) -> None:
+        with self._lock:
+            stats = self.stats.get(endpoint)
+            if stats is None:
+                stats = self.stats[endpoint] = EndpointPagingStats(endpoint=endpoint)
+            stats.scans += 1
+            stats.pages += pages
+            stats.items += items
+            stats.speculative_pages_discarded += discarded
+            stats.seconds += seconds
+            stats.page_limit = limit
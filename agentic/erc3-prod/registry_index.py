@@ -0,0 +1,183 @@
+"""In-memory indices over prefetched `UserContext` registries.
+
+`RegistryIndex` is built once after prefetch and turns the validator's hot-path lookups into
+dict hits (O(1)) or bisect range scans (O(log n + k)) instead of linear scans over
+`UserContext.employees/customers/projects/time_entries`.
+
+All multi-valued results are returned in a deterministic order (registry order for secondary
+indices, `(level, id)` order for skill/will range queries).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from policy import (
+    Company,
+    CompanyID,
+    Employee,
+    EmployeeID,
+    Project,
+    ProjectID,
+    SkillFilter,
+    TeamRole,
+    TimeEntry,
+    UserContext,
+    Workload,
+)
+
+T = TypeVar("T")
+
+_MAX_LEVEL = 10
+
+
+def _group_by(items: Iterable[T], key_of) -> Dict[str, List[T]]:
+    groups: Dict[str, List[T]] = {}
+    for item in items:
+        key = key_of(item)
+        if key is None:
+            continue
+        groups.setdefault(key, []).append(item)
+    return groups
+
+
+class _LevelIndex:
+    """Inverted index: name -> employees sorted by (level, employee_id)."""
+
+    def __init__(self, employees: Sequence[Employee], levels_of):
+        pairs: Dict[str, List[Tuple[int, EmployeeID]]] = {}
+        for employee in employees:
+            for entry in levels_of(employee):
+                pairs.setdefault(entry.name, []).append((entry.level, employee.id))
+        self._levels: Dict[str, List[int]] = {}
+        self._ids: Dict[str, List[EmployeeID]] = {}
+        for name, rows in pairs.items():
+            rows.sort()
+            self._levels[name] = [level for level, _ in rows]
+            self._ids[name] = [employee_id for _, employee_id in rows]
+
+    def names(self) -> List[str]:
+        return sorted(self._levels)
+
+    def range(self, name: str, min_level: int, max_level: int = 0) -> List[EmployeeID]:
+        """Employee IDs with `min_level <= level <= max_level` (`max_level=0` means unbounded)."""
+        levels = self._levels.get(name)
+        if levels is None:
+            return []
+        upper = _MAX_LEVEL if max_level <= 0 else max_level
+        lo = bisect_left(levels, min_level)
+        hi = bisect_right(levels, upper)
+        return self._ids[name][lo:hi]
+
+
+class RegistryIndex:
+    """Persistent lookup structure over one prefetched `UserContext`."""
+
+    def __init__(self, user_context: UserContext):
+        employees = user_context.employees or []
+        customers = user_context.customers or []
+        projects = user_context.projects or []
+        time_entries = user_context.time_entries or []
+
+        # Primary keys
+        self.employees_by_id: Dict[EmployeeID, Employee] = {e.id: e for e in employees}
+        self.customers_by_id: Dict[CompanyID, Company] = {c.id: c for c in customers}
+        self.projects_by_id: Dict[ProjectID, Project] = {p.id: p for p in projects}
+        self.time_entries_by_id: Dict[str, TimeEntry] = {t.id: t for t in time_entries if t.id is not None}
+
+        # Secondary indices
+        self.employees_by_location = _group_by(employees, lambda e: e.location)
+        self.employees_by_department = _group_by(employees, lambda e: e.department)
+        self.customers_by_location = _group_by(customers, lambda c: c.location)
+        self.customers_by_account_manager = _group_by(customers, lambda c: c.account_manager)
+        self.projects_by_customer = _group_by(projects, lambda p: p.customer)
+
+        # Inverted skill/will indices
+        self.skills = _LevelIndex(employees, lambda e: e.skills)
+        self.wills = _LevelIndex(employees, lambda e: e.wills)
+
+        # Project team indices
+        self.team_by_employee: Dict[EmployeeID, List[Tuple[Project, Workload]]] = {}
+        self.team_by_role: Dict[TeamRole, List[Tuple[Project, Workload]]] = {}
+        for project in projects:
+            for workload in project.team:
+                self.team_by_employee.setdefault(workload.employee, []).append((project, workload))
+                self.team_by_role.setdefault(workload.role, []).append((project, workload))
+
+    # -----------------------------
+    # Point lookups
+    # -----------------------------
+
+    def employee(self, employee_id: EmployeeID) -> Optional[Employee]:
+        return self.employees_by_id.get(employee_id)
+
+    def customer(self, customer_id: CompanyID) -> Optional[Company]:
+        return self.customers_by_id.get(customer_id)
+
+    def project(self, project_id: ProjectID) -> Optional[Project]:
+        return self.projects_by_id.get(project_id)
+
+    def time_entry(self, entry_id: str) -> Optional[TimeEntry]:
+        return self.time_entries_by_id.get(entry_id)
+
+    # -----------------------------
+    # Secondary lookups
+    # -----------------------------
+
+    def employees_at(self, location: str) -> List[Employee]:
+        return list(self.employees_by_location.get(location, []))
+
+    def employees_in(self, department: str) -> List[Employee]:
+        return list(self.employees_by_department.get(department, []))
+
+    def customers_at(self, location: str) -> List[Company]:
+        return list(self.customers_by_location.get(location, []))
+
+    def customers_managed_by(self, employee_id: EmployeeID) -> List[Company]:
+        return list(self.customers_by_account_manager.get(employee_id, []))
+
+    def projects_for_customer(self, customer_id: CompanyID) -> List[Project]:
+        return list(self.projects_by_customer.get(customer_id, []))
+
+    # -----------------------------
+    # Skills / wills
+    # -----------------------------
+
+    def employees_with_skill(self, name: str, min_level: int, max_level: int = 0) -> List[Employee]:
+        return [self.employees_by_id[i] for i in self.skills.range(name, min_level, max_level)]
+
+    def employees_with_will(self, name: str, min_level: int, max_level: int = 0) -> List[Employee]:
+        return [self.employees_by_id[i] for i in self.wills.range(name, min_level, max_level)]
+
+    def search_employees(
+            self,
+            skills: Optional[List[SkillFilter]] = None,
+            wills: Optional[List[SkillFilter]] = None,
+    ) -> List[Employee]:
+        """Employees matching all skill and will filters (AND), in registry order."""
+        matched: Optional[set] = None
+        for index, filters in ((self.skills, skills or []), (self.wills, wills or [])):
+            for f in filters:
+                ids = set(index.range(f.name, f.min_level, f.max_level))
+                matched = ids if matched is None else matched & ids
+        if matched is None:
+            return list(self.employees_by_id.values())
+        return [e for e in self.employees_by_id.values() if e.id in matched]
+
+    # -----------------------------
+    # Project teams
+    # -----------------------------
+
+    def projects_of(self, employee_id: EmployeeID, role: Optional[TeamRole] = None) -> List[Project]:
+        return [
+            project
+            for project, workload in self.team_by_employee.get(employee_id, [])
+            if role is None or workload.role == role
+        ]
+
+    def workloads_of(self, employee_id: EmployeeID) -> List[Tuple[Project, Workload]]:
+        return list(self.team_by_employee.get(employee_id, []))
+
+    def members_with_role(self, role: TeamRole) -> List[Tuple[Project, Workload]]:
+        return list(self.team_by_role.get(role, []))
@@ -0,0 +1,191 @@
+"""Cross-run registry snapshot cache for `MemoryErc3Client`.
+
+Registry snapshots are static for a given environment identity, so back-to-back runs can reuse the
+prefetched employees/customers/projects/time data instead of paging the API again. Entries are
+content-addressed by a digest of:
+- API `base_url`
+- `UserContext.wiki_sha1` and `UserContext.today` (the environment digest fields)
+- the requested `date_from`/`date_to`
+- the caller identity (`current_user`, `is_public`)
+- the time-summary source (`remote`, `local`, or `verified` = local diffed against remote), since the
+  payload stores the summaries produced under that policy
+
+Storage is a single SQLite file with LRU eviction bounded by entry count and total payload bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from policy import UserContext
+
+
+class SnapshotCacheKey(BaseModel):
+    """Identity of a prefetched registry snapshot."""
+
+    base_url: str = Field(..., description="API base URL the snapshot was fetched from")
+    wiki_sha1: Optional[str] = Field(None, description="Wiki digest reported by `who_am_i`")
+    today: Optional[str] = Field(None, description="Current date reported by `who_am_i`")
+    date_from: str = Field(..., description="Time-entry/summary range start (YYYY-MM-DD)")
+    date_to: str = Field(..., description="Time-entry/summary range end (YYYY-MM-DD)")
+    current_user: Optional[str] = Field(None, description="Caller employee ID, if authenticated")
+    is_public: bool = Field(..., description="True for public/unauthenticated mode")
+    summary_source: Literal["remote", "local", "verified"] = Field(
+        "remote", description="How the stored time summaries were produced (see `PrefetchPolicy`)"
+    )
+
+    @classmethod
+    def for_context(
+            cls,
+            base_url: str,
+            user_context: UserContext,
+            date_from: str,
+            date_to: str,
+            summary_source: str = "remote",
+    ) -> SnapshotCacheKey:
+        return cls(
+            base_url=base_url,
+            wiki_sha1=user_context.wiki_sha1,
+            today=user_context.today,
+            date_from=date_from,
+            date_to=date_to,
+            current_user=user_context.current_user,
+            is_public=user_context.is_public,
+            summary_source=summary_source,
+        )
+
+    def canonical_json(self) -> str:
+        payload = {
+            "base_url": self.base_url,
+            "wiki_sha1": self.wiki_sha1,
+            "today": self.today,
+            "date_from": self.date_from,
+            "date_to": self.date_to,
+            "current_user": self.current_user,
+            "is_public": self.is_public,
+            "summary_source": self.summary_source,
+        }
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    def digest(self) -> str:
+        return hashlib.sha256(self.canonical_json().encode("utf-8")).hexdigest()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshot_cache (
+    digest TEXT PRIMARY KEY,
+    base_url TEXT NOT NULL,
+    wiki_sha1 TEXT,
+    key_json TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    last_access INTEGER NOT NULL
+)
+"""
+
+
+class SnapshotCache:
+    """Persistent, size-bounded LRU cache of registry snapshot payloads.
+
+    Payloads are plain JSON-compatible dicts (entity lists dumped before reference population),
+    so loading never depends on in-memory object identity.
+
+    Invalidation:
+    - Keys include `wiki_sha1`, so a digest change is always a miss.
+    - `invalidate_digest()` is the explicit hook that drops stale entries for a base URL once a new
+      digest is observed; `invalidate()` drops a single key or the whole cache.
+    """
+
+    def __init__(
+            self,
+            path: str = "./.jbeval/snapshot-cache.sqlite",
+            max_entries: int = 32,
+            max_bytes: int = 256 * 1024 * 1024,
+    ):
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def get(self, key: SnapshotCacheKey) -> Optional[Dict[str, Any]]:
+        digest = key.digest()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM snapshot_cache WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE snapshot_cache SET last_access = ? WHERE digest = ?", (self._next_access(), digest)
+            )
+            self._connection.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: SnapshotCacheKey, payload: Dict[str, Any]) -> None:
+        blob = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO snapshot_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key.digest(), key.base_url, key.wiki_sha1, key.canonical_json(), blob, len(blob), self._next_access()),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def invalidate(self, key: Optional[SnapshotCacheKey] = None) -> int:
+        """Drop one entry, or every entry when `key` is None. Returns the number of dropped entries."""
+        with self._lock:
+            if key is None:
+                cursor = self._connection.execute("DELETE FROM snapshot_cache")
+            else:
+                cursor = self._connection.execute("DELETE FROM snapshot_cache WHERE digest = ?", (key.digest(),))
+            self._connection.commit()
+            return cursor.rowcount
+
+    def invalidate_digest(self, base_url: str, wiki_sha1: Optional[str]) -> int:
+        """Drop entries for `base_url` recorded under a wiki digest other than `wiki_sha1`."""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM snapshot_cache WHERE base_url = ? AND wiki_sha1 IS NOT ?", (base_url, wiki_sha1)
+            )
+            self._connection.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _next_access(self) -> int:
+        row = self._connection.execute("SELECT COALESCE(MAX(last_access), 0) FROM snapshot_cache").fetchone()
+        return int(row[0]) + 1
+
+    def _evict(self) -> None:
+        while True:
+            count, total = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM snapshot_cache"
+            ).fetchone()
+            if count <= self.max_entries and total <= self.max_bytes:
+                return
+            self._connection.execute(
+                "DELETE FROM snapshot_cache WHERE digest = "
+                "(SELECT digest FROM snapshot_cache ORDER BY last_access ASC LIMIT 1)"
+            )
@@ -0,0 +1,146 @@
+"""Async client tests against a local stub of the ERC3 API (no network).
+
+`StubErc3Server` answers the `Erc3Client` calls made by the wrappers from a small fixed dataset and
+honours `offset`/`limit`, so paging, prefetch joins and normalization run exactly as against the
+real API.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("erc3.erc3.client")
+
+import tools  # noqa: E402
+from async_tools import AsyncMemoryErc3Client, AsyncPrimitiveErc3APIClient  # noqa: E402
+from tools import MemoryErc3Client, PagedResult, PrefetchPolicy  # noqa: E402
+from wiki_cache import WikiPageCache  # noqa: E402
+
+DATE_FROM, DATE_TO = "2025-01-01", "2025-12-31"
+
+EMPLOYEES = [
+    {"id": f"e{i}", "name": f"Employee {i}", "email": f"e{i}@example.com", "salary": 1000 + i,
+     "location": "Vienna", "department": "Sales"}
+    for i in range(7)
+]
+CUSTOMERS = [
+    {"id": f"c{i}", "name": f"Customer {i}", "location": "AT", "deal_phase": "active", "high_level_status": "ok"}
+    for i in range(3)
+]
+PROJECTS = [
+    {"id": f"p{i}", "name": f"Project {i}", "customer": f"c{i % 3}", "status": "active"}
+    for i in range(4)
+]
+TIME_ENTRIES = [
+    {"id": f"t{i}", "employee": f"e{i % 7}", "customer": f"c{i % 3}", "project": f"p{i % 4}",
+     "date": "2025-03-01", "hours": 1.5, "work_category": "dev", "notes": "", "billable": i % 2 == 0,
+     "status": "draft", "logged_by": f"e{i % 7}", "changed_by": f"e{i % 7}"}
+    for i in range(11)
+]
+SUMMARIES = [
+    {"employee": "e0", "customer": "c0", "project": "p0", "total_hours": 3.0, "billable_hours": 1.5,
+     "non_billable_hours": 1.5, "distinct_employees": 1}
+]
+
+
+class StubErc3Server:
+    """Stands in for `Erc3Client`; `calls` records every request in arrival order."""
+
+    page_size = 3  # server-side page cap, smaller than the requested limit
+
+    def __init__(self, base_url: str, **_: object):
+        self.base_url = base_url
+        self.calls = []
+
+    def _page(self, rows, offset, limit):
+        end = offset + min(limit, self.page_size)
+        return rows[offset:end], (end if end < len(rows) else None)
+
+    def who_am_i(self):
+        self.calls.append("who_am_i")
+        return {"current_user": "e0", "is_public": False, "today": "2025-06-01", "wiki_sha1": "sha-1"}
+
+    def list_employees(self, offset, limit):
+        self.calls.append("list_employees")
+        items, next_offset = self._page(EMPLOYEES, offset, limit)
+        return SimpleNamespace(employees=items, next_offset=next_offset)
+
+    def list_customers(self, offset, limit):
+        self.calls.append("list_customers")
+        items, next_offset = self._page(CUSTOMERS, offset, limit)
+        return SimpleNamespace(companies=items, next_offset=next_offset)
+
+    def list_projects(self, offset, limit):
+        self.calls.append("list_projects")
+        items, next_offset = self._page(PROJECTS, offset, limit)
+        return SimpleNamespace(projects=items, next_offset=next_offset)
+
+    def search_time_entries(self, offset, limit, **_):
+        self.calls.append("search_time_entries")
+        items, next_offset = self._page(TIME_ENTRIES, offset, limit)
+        return SimpleNamespace(entries=items, next_offset=next_offset, total_hours=0.0, total_billable=0.0,
+                               total_non_billable=0.0)
+
+    def time_summary_by_project(self, **_):
+        self.calls.append("time_summary_by_project")
+        return SimpleNamespace(summaries=SUMMARIES)
+
+    def time_summary_by_employee(self, **_):
+        self.calls.append("time_summary_by_employee")
+        return SimpleNamespace(summaries=SUMMARIES)
+
+
+@pytest.fixture(autouse=True)
+def stub_server(monkeypatch):
+    monkeypatch.setattr(tools, "Erc3Client", StubErc3Server)
+
+
+def _ids(client):
+    context = client.user_context
+    return (
+        [e.id for e in context.employees],
+        [c.id for c in context.customers],
+        [p.id for p in context.projects],
+        [t.id for t in context.time_entries],
+        [s.model_dump() for s in context.time_summaries_by_project],
+    )
+
+
+def test_async_wrappers_return_normalized_types():
+    async def scenario():
+        async with AsyncPrimitiveErc3APIClient(base_url="http://stub") as client:
+            return await asyncio.gather(client.list_employees(offset=0, limit=999),
+                                        client.list_employees(offset=3, limit=999))
+
+    first, second = asyncio.run(scenario())
+    assert isinstance(first, PagedResult)
+    assert [e.id for e in first.items] == ["e0", "e1", "e2"] and first.next_offset == 3
+    assert [e.id for e in second.items] == ["e3", "e4", "e5"] and second.next_offset == 6
+
+
+def test_async_prefetch_matches_sync_prefetch():
+    policy = PrefetchPolicy(concurrent=True)
+    sync_client = MemoryErc3Client("http://stub", DATE_FROM, DATE_TO, policy=policy)
+
+    async def scenario():
+        async with await AsyncMemoryErc3Client.create("http://stub", DATE_FROM, DATE_TO, policy=policy) as client:
+            return client
+
+    async_client = asyncio.run(scenario())
+    assert _ids(async_client) == _ids(sync_client)
+    assert async_client._client.calls[0] == "who_am_i"
+    assert async_client.aio._executor._shutdown
+
+
+def test_create_uses_injected_wiki_cache_and_close_releases_pool():
+    cache = WikiPageCache()
+
+    async def scenario():
+        return await AsyncMemoryErc3Client.create("http://stub", DATE_FROM, DATE_TO, wiki_cache=cache)
+
+    client = asyncio.run(scenario())
+    assert client.wiki_cache is cache
+    assert not client.aio._executor._shutdown
+    client.close()
+    assert client.aio._executor._shutdown
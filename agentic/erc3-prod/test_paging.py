@@ -0,0 +1,54 @@
+"""`PagedFetcher` page-size learning: only request-side rejections step the limit down."""
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from paging import PagedFetcher, rejects_page_size
+
+ROWS = list(range(10))
+
+
+class ListRequest(BaseModel):
+    offset: int = Field(0, ge=0)
+    limit: int = Field(..., ge=1, le=5)
+
+
+class Row(BaseModel):
+    id: int
+
+
+def _fetch(offset, limit):
+    request = ListRequest(offset=offset, limit=limit)
+    end = request.offset + request.limit
+    return ROWS[request.offset:end], (end if end < len(ROWS) else None)
+
+
+def test_request_validation_error_steps_the_limit_down():
+    pager = PagedFetcher(page_limit=999)
+    assert pager.fetch_all("rows", _fetch) == ROWS
+    assert pager.stats["rows"].page_limit == 5
+
+
+def test_response_conversion_error_is_raised_without_learning():
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append(limit)
+        return [Row.model_validate({"id": "not-a-number"})], None
+
+    pager = PagedFetcher(page_limit=999)
+    with pytest.raises(ValidationError):
+        pager.fetch_all("rows", fetch)
+    assert calls == [999]
+    assert "rows" not in pager._learned
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(status_code)
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize("status, expected", [(400, True), (422, True), (401, False), (429, False), (500, False)])
+def test_rejects_page_size_by_status(status, expected):
+    assert rejects_page_size(_HTTPError(status)) is expected
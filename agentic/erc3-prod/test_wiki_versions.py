@@ -0,0 +1,54 @@
+"""Wiki diff -> rule invalidation, including rules whose anchor encloses the changed subsection."""
+
+from policy import WikiArticle
+from wiki_versions import WikiVersionStore, invalidated_rules, split_sections
+
+PAGE = "hr/performance.md"
+
+V1 = """# Performance reviews
+Intro.
+
+## Rating scale
+Ratings run from 1 to 5.
+
+### Calibration
+Managers calibrate within a department.
+
+## Review cadence
+Reviews happen twice a year.
+"""
+
+RULES = [
+    {"id": "rating", "source": {"page": PAGE, "anchor": "## Rating scale"}},
+    {"id": "cadence", "source": {"page": PAGE, "anchor": "## Review cadence"}},
+    {"id": "reviews", "source": {"page": PAGE, "anchor": "# Performance reviews"}},
+]
+
+
+def _delta(tmp_path, new_content):
+    store = WikiVersionStore(str(tmp_path / "wiki-versions.sqlite"))
+    store.record("v1", [WikiArticle(path=PAGE, content=V1)])
+    store.record("v2", [WikiArticle(path=PAGE, content=new_content)])
+    return store.diff("v1", "v2")
+
+
+def test_split_sections_records_parent_chain():
+    parents = {anchor: chain for anchor, _, chain, _ in split_sections(V1)}
+    assert parents["### Calibration"] == ("# Performance reviews", "## Rating scale")
+    assert parents["## Review cadence"] == ("# Performance reviews",)
+
+
+def test_nested_subsection_edit_invalidates_enclosing_rules(tmp_path):
+    delta = _delta(tmp_path, V1.replace("within a department", "across the company"))
+    assert [(s.anchor, s.change) for s in delta.sections()] == [("### Calibration", "changed")]
+    assert invalidated_rules(delta, RULES) == ["rating", "reviews"]
+
+
+def test_removed_subsection_invalidates_enclosing_rules(tmp_path):
+    delta = _delta(tmp_path, V1.replace("### Calibration\nManagers calibrate within a department.\n", ""))
+    assert invalidated_rules(delta, RULES) == ["rating", "reviews"]
+
+
+def test_sibling_section_edit_leaves_other_rules_valid(tmp_path):
+    delta = _delta(tmp_path, V1.replace("twice a year", "once a year"))
+    assert invalidated_rules(delta, RULES) == ["cadence", "reviews"]
@@ -0,0 +1,255 @@
+"""Compact columnar store for prefetched time entries.
+
+`TimeEntryColumns` keeps one `array` per `TimeEntry` field instead of one Pydantic object per row:
+- ID-like and categorical strings (ids, employees, customers, projects, work categories, statuses,
+  notes) are interned into a shared string table and stored as `int32` codes (`-1` = None).
+- `date` is stored as an `int32` `YYYYMMDD` key, so date-window filters are integer compares.
+- `hours` is `float64`, `billable` is `int8`.
+
+Employees, customers and projects are addressed through posting lists (`array('I')` row indices)
+instead of per-entity `TimeEntry` lists. Rows are materialized back into `TimeEntry` objects only
+on demand.
+
+Aggregations run over whole columns; when NumPy is installed the column buffers are viewed
+zero-copy and reduced with `bincount`, otherwise a tight pure-Python loop is used. Both paths add
+hours in row order, so results are identical.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from policy import BillableFilter, TimeEntry
+
+try:
+    import numpy as np
+except ImportError:  # optional acceleration
+    np = None  # type: ignore[assignment]
+
+_NONE = -1
+
+# (total_hours, billable_hours, non_billable_hours)
+HoursSplit = Tuple[float, float, float]
+
+
+def _date_key(date: str) -> int:
+    return int(date[0:4]) * 10000 + int(date[5:7]) * 100 + int(date[8:10])
+
+
+def _date_str(key: int) -> str:
+    return f"{key // 10000:04d}-{key // 100 % 100:02d}-{key % 100:02d}"
+
+
+class TimeEntryColumns:
+    """Array-backed, append-only container of time entries."""
+
+    _STRING_COLUMNS = ("id", "employee", "customer", "project", "work_category", "notes", "status",
+                       "logged_by", "changed_by")
+
+    def __init__(self):
+        self._strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+        self.id = array("i")
+        self.employee = array("i")
+        self.customer = array("i")
+        self.project = array("i")
+        self.work_category = array("i")
+        self.notes = array("i")
+        self.status = array("i")
+        self.logged_by = array("i")
+        self.changed_by = array("i")
+        self.date = array("i")
+        self.hours = array("d")
+        self.billable = array("b")
+
+        self._by_employee: Dict[int, array] = {}
+        self._by_customer: Dict[int, array] = {}
+        self._by_project: Dict[int, array] = {}
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[TimeEntry]) -> TimeEntryColumns:
+        columns = cls()
+        columns.extend(entries)
+        return columns
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> TimeEntryColumns:
+        columns = cls()
+        for record in records:
+            columns._append_values(record.get)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    # -----------------------------
+    # Interning
+    # -----------------------------
+
+    def _intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(value)
+            self._codes[value] = code
+        return code
+
+    def text(self, code: int) -> Optional[str]:
+        """Interned string for a column code (None for the null code)."""
+        return None if code == _NONE else self._strings[code]
+
+    # -----------------------------
+    # Appending
+    # -----------------------------
+
+    def append(self, entry: TimeEntry) -> None:
+        self._append_values(lambda name: getattr(entry, name))
+
+    def extend(self, entries: Iterable[TimeEntry]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def _append_values(self, get) -> None:
+        row = len(self.hours)
+        for name in self._STRING_COLUMNS:
+            value = get(name)
+            getattr(self, name).append(self._intern(None if value is None else str(value)))
+        self.date.append(_date_key(get("date")))
+        self.hours.append(float(get("hours")))
+        self.billable.append(1 if get("billable") else 0)
+
+        for postings, code in ((self._by_employee, self.employee[row]),
+                               (self._by_customer, self.customer[row]),
+                               (self._by_project, self.project[row])):
+            if code != _NONE:
+                postings.setdefault(code, array("I")).append(row)
+
+    # -----------------------------
+    # Materialization
+    # -----------------------------
+
+    def record(self, row: int) -> Dict[str, Any]:
+        values: Dict[str, Any] = {name: self.text(getattr(self, name)[row]) for name in self._STRING_COLUMNS}
+        values["date"] = _date_str(self.date[row])
+        values["hours"] = self.hours[row]
+        values["billable"] = bool(self.billable[row])
+        return values
+
+    def records(self, rows: Optional[Sequence[int]] = None) -> Iterator[Dict[str, Any]]:
+        for row in (range(len(self)) if rows is None else rows):
+            yield self.record(row)
+
+    def materialize(self, rows: Optional[Sequence[int]] = None) -> List[TimeEntry]:
+        return [TimeEntry(**record) for record in self.records(rows)]
+
+    # -----------------------------
+    # Row selection
+    # -----------------------------
+
+    def rows_for_employee(self, employee_id: str) -> array:
+        return self._postings(self._by_employee, employee_id)
+
+    def rows_for_customer(self, customer_id: str) -> array:
+        return self._postings(self._by_customer, customer_id)
+
+    def rows_for_project(self, project_id: str) -> array:
+        return self._postings(self._by_project, project_id)
+
+    def _postings(self, postings: Dict[int, array], value: str) -> array:
+        code = self._codes.get(value)
+        return array("I") if code is None else postings.get(code, array("I"))
+
+    def select(
+            self,
+            date_from: Optional[str] = None,
+            date_to: Optional[str] = None,
+            employees: Optional[Sequence[str]] = None,
+            customers: Optional[Sequence[str]] = None,
+            projects: Optional[Sequence[str]] = None,
+            billable: BillableFilter = "",
+    ) -> array:
+        """Row indices (ascending) matching all filters; empty/None filters match everything."""
+        lo = _date_key(date_from) if date_from else None
+        hi = _date_key(date_to) if date_to else None
+        want_billable = {"": None, "billable": 1, "non_billable": 0}[billable]
+
+        candidates: Optional[set] = None
+        for postings, values in ((self._by_employee, employees),
+                                 (self._by_customer, customers),
+                                 (self._by_project, projects)):
+            if not values:
+                continue
+            rows = set()
+            for value in values:
+                rows.update(self._postings(postings, value))
+            candidates = rows if candidates is None else candidates & rows
+
+        scan: Iterable[int] = range(len(self)) if candidates is None else sorted(candidates)
+        date, flag = self.date, self.billable
+        return array("I", (
+            row for row in scan
+            if (lo is None or date[row] >= lo)
+            and (hi is None or date[row] <= hi)
+            and (want_billable is None or flag[row] == want_billable)
+        ))
+
+    # -----------------------------
+    # Aggregation
+    # -----------------------------
+
+    def totals(self, rows: Optional[Sequence[int]] = None) -> HoursSplit:
+        split = self._group_hours(None, rows)
+        return split.get(None, (0.0, 0.0, 0.0))
+
+    def hours_by_employee(self, rows: Optional[Sequence[int]] = None) -> Dict[Optional[str], HoursSplit]:
+        return self._group_hours(self.employee, rows)
+
+    def hours_by_customer(self, rows: Optional[Sequence[int]] = None) -> Dict[Optional[str], HoursSplit]:
+        return self._group_hours(self.customer, rows)
+
+    def hours_by_project(self, rows: Optional[Sequence[int]] = None) -> Dict[Optional[str], HoursSplit]:
+        return self._group_hours(self.project, rows)
+
+    def _group_hours(self, key: Optional[array], rows: Optional[Sequence[int]]) -> Dict[Optional[str], HoursSplit]:
+        """Group (total, billable, non-billable) hours by a code column (`None` = single group)."""
+        if np is not None:
+            return self._group_hours_numpy(key, rows)
+
+        totals: Dict[int, List[float]] = {}
+        hours, flag = self.hours, self.billable
+        for row in (range(len(self)) if rows is None else rows):
+            code = _NONE if key is None else key[row]
+            acc = totals.get(code)
+            if acc is None:
+                acc = totals[code] = [0.0, 0.0, 0.0]
+            acc[0] += hours[row]
+            acc[1 if flag[row] else 2] += hours[row]
+        return {self.text(code): (t, b, n) for code, (t, b, n) in sorted(totals.items())}
+
+    def _group_hours_numpy(self, key: Optional[array], rows: Optional[Sequence[int]]) -> Dict[Optional[str], HoursSplit]:
+        if len(self) == 0:
+            return {}
+        hours = np.frombuffer(self.hours, dtype=np.float64)
+        flag = np.frombuffer(self.billable, dtype=np.int8).astype(bool)
+        codes = np.zeros(len(self), dtype=np.int64) if key is None else np.frombuffer(key, dtype=np.int32) + 1
+        if rows is not None:
+            index = np.frombuffer(array("I", rows), dtype=np.uint32)
+            hours, flag, codes = hours[index], flag[index], codes[index]
+            if len(index) == 0:
+                return {}
+
+        total = np.bincount(codes, weights=hours)
+        billable = np.bincount(codes, weights=np.where(flag, hours, 0.0), minlength=len(total))
+        non_billable = np.bincount(codes, weights=np.where(flag, 0.0, hours), minlength=len(total))
+        present = np.bincount(codes, minlength=len(total)) > 0
+
+        result: Dict[Optional[str], HoursSplit] = {}
+        for shifted in np.nonzero(present)[0]:
+            code = int(shifted) - 1
+            name = None if key is None else self.text(code)
+            result[name] = (float(total[shifted]), float(billable[shifted]), float(non_billable[shifted]))
+        return result
@@ -0,0 +1,130 @@
+"""Local time-summary engine over prefetched time entries.
+
+Computes `TimeSummary` rows with the same filters as the remote `time_summary_by_project` /
+`time_summary_by_employee` endpoints (date range, customers, projects, employees, billable) from a
+`TimeEntryColumns` store, so summary queries need no network round-trip.
+
+Grouping:
+- by project: one row per `(customer, project)`; `employee` is empty.
+- by employee: one row per `employee`; `customer` and `project` are empty.
+Rows are ordered by their group key. Hours are summed in entry order, so results are deterministic.
+
+`diff_summaries` compares a local result against the remote one (order-insensitive, keyed by the
+group columns) and is used for the optional once-per-snapshot verification in `MemoryErc3Client`.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from policy import BillableFilter, TimeSummary
+from time_columns import TimeEntryColumns
+
+_HOURS_TOLERANCE = 1e-6
+
+_GroupKey = Tuple[str, str, str]  # (employee, customer, project)
+
+
+def _summarize(
+        columns: TimeEntryColumns,
+        group_of,
+        date_from: str,
+        date_to: str,
+        customers: Optional[Sequence[str]],
+        projects: Optional[Sequence[str]],
+        employees: Optional[Sequence[str]],
+        billable: BillableFilter,
+) -> List[TimeSummary]:
+    rows = columns.select(
+        date_from=date_from,
+        date_to=date_to,
+        employees=employees,
+        customers=customers,
+        projects=projects,
+        billable=billable,
+    )
+
+    totals: Dict[_GroupKey, List[float]] = {}
+    people: Dict[_GroupKey, Set[int]] = {}
+    hours, flag, employee_codes = columns.hours, columns.billable, columns.employee
+    for row in rows:
+        key = group_of(row)
+        acc = totals.get(key)
+        if acc is None:
+            acc = totals[key] = [0.0, 0.0, 0.0]
+            people[key] = set()
+        acc[0] += hours[row]
+        acc[1 if flag[row] else 2] += hours[row]
+        if employee_codes[row] >= 0:
+            people[key].add(employee_codes[row])
+
+    return [
+        TimeSummary(
+            employee=key[0],
+            customer=key[1],
+            project=key[2],
+            total_hours=acc[0],
+            billable_hours=acc[1],
+            non_billable_hours=acc[2],
+            distinct_employees=len(people[key]),
+        )
+        for key, acc in sorted(totals.items())
+    ]
+
+
+def summarize_by_project(
+        columns: TimeEntryColumns,
+        date_from: str,
+        date_to: str,
+        customers: Optional[Sequence[str]] = None,
+        projects: Optional[Sequence[str]] = None,
+        employees: Optional[Sequence[str]] = None,
+        billable: BillableFilter = "",
+) -> List[TimeSummary]:
+    customer, project = columns.customer, columns.project
+    return _summarize(
+        columns,
+        lambda row: ("", columns.text(customer[row]) or "", columns.text(project[row]) or ""),
+        date_from, date_to, customers, projects, employees, billable,
+    )
+
+
+def summarize_by_employee(
+        columns: TimeEntryColumns,
+        date_from: str,
+        date_to: str,
+        customers: Optional[Sequence[str]] = None,
+        projects: Optional[Sequence[str]] = None,
+        employees: Optional[Sequence[str]] = None,
+        billable: BillableFilter = "",
+) -> List[TimeSummary]:
+    employee = columns.employee
+    return _summarize(
+        columns,
+        lambda row: (columns.text(employee[row]) or "", "", ""),
+        date_from, date_to, customers, projects, employees, billable,
+    )
+
+
+def diff_summaries(label: str, local: Iterable[TimeSummary], remote: Iterable[TimeSummary]) -> List[str]:
+    """Human-readable differences between local and remote summaries (empty list = equivalent)."""
+
+    def keyed(summaries: Iterable[TimeSummary]) -> Dict[_GroupKey, TimeSummary]:
+        return {(s.employee or "", s.customer or "", s.project or ""): s for s in summaries}
+
+    local_by_key, remote_by_key = keyed(local), keyed(remote)
+    diffs: List[str] = []
+    for key in sorted(set(local_by_key) | set(remote_by_key)):
+        mine, theirs = local_by_key.get(key), remote_by_key.get(key)
+        if mine is None or theirs is None:
+            diffs.append(f"{label} {key}: {'missing locally' if mine is None else 'missing remotely'}")
+            continue
+        for field in ("total_hours", "billable_hours", "non_billable_hours"):
+            if abs(getattr(mine, field) - getattr(theirs, field)) > _HOURS_TOLERANCE:
+                diffs.append(f"{label} {key}: {field} local={getattr(mine, field)} remote={getattr(theirs, field)}")
+        if mine.distinct_employees != theirs.distinct_employees:
+            diffs.append(
+                f"{label} {key}: distinct_employees local={mine.distinct_employees} "
+                f"remote={theirs.distinct_employees}"
+            )
+    return diffs
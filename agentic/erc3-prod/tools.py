@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+import json
+import sqlite3
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from erc3.erc3.client import Erc3Client
 from pydantic import BaseModel, Field
 
+from conversion import ModelConverter, model_from as _model_from, to_dict as _to_dict
+from paging import PagedFetcher
 from policy import (
     AgentLink,
     BillableFilter,
@@ -26,6 +34,13 @@ from policy import (
     TimeEntriesRequest,
     TimeEntries,
 )
+from registry_index import RegistryIndex
+from snapshot_cache import SnapshotCache, SnapshotCacheKey
+from time_columns import TimeEntryColumns
+from time_summary import diff_summaries, summarize_by_employee, summarize_by_project
+from transport import PooledTransport
+from wiki_cache import WikiPageCache
+from wiki_mirror import WikiMirror, diff_search_results
 
 TModel = TypeVar("TModel", bound=BaseModel)
 
@@ -40,26 +55,19 @@ class WikiListResult(BaseModel):
     sha1: str = Field(..., description="Wiki digest hash")
 
 
-def _to_dict(obj: Any) -> Dict[str, Any]:
-    if obj is None:
-        return {}
-    if isinstance(obj, dict):
-        return obj  # type: ignore[return-value]
-    model_dump = getattr(obj, "model_dump", None)
-    if callable(model_dump):
-        return model_dump()  # type: ignore[return-value]
-    to_dict = getattr(obj, "dict", None)
-    if callable(to_dict):
-        return to_dict()  # type: ignore[return-value]
-    raise TypeError(f"Unsupported DTO object type: {type(obj).__name__}")
+def _to_json(model: BaseModel) -> str:
+    model_dump_json = getattr(model, "model_dump_json", None)
+    if callable(model_dump_json):
+        return model_dump_json()
+    return model.json()  # pydantic v1
 
 
-def _model_from(model_cls: Type[TModel], dto_obj: Any) -> TModel:
-    payload = _to_dict(dto_obj)
-    model_validate = getattr(model_cls, "model_validate", None)
-    if callable(model_validate):
-        return model_validate(payload)
-    return model_cls.parse_obj(payload)  # pydantic v1
+def _page_of(page: PagedResult) -> Tuple[List[Any], Optional[int]]:
+    return page.items, page.next_offset
+
+
+def _entries_page_of(page: TimeEntries) -> Tuple[List[TimeEntry], Optional[int]]:
+    return page.entries, page.next_offset
 
 
 class PrimitiveErc3APIClient:
@@ -68,10 +76,26 @@ class PrimitiveErc3APIClient:
     This layer is intentionally thin and deterministic:
     - It does not implement business logic.
     - It normalizes DTOs into local `policy.py` entities for downstream validation/SQL.
+    - Page items (list/search results) use the `ModelConverter` fast path unless `strict=True`;
+      single-entity reads and write responses are always fully validated.
+    - An injected `PooledTransport` is shared by every wrapper it is passed to, so keep-alive
+      connections are reused across clients, tasks and concurrent prefetch calls.
+    - `load_wiki_many` serves pages from `wiki_cache` (keyed by path and wiki digest); inject one
+      `WikiPageCache` into several clients to share loaded pages between them.
     """
 
-    def __init__(self, base_url: str):
-        self._client = Erc3Client(base_url=base_url)
+    def __init__(
+            self,
+            base_url: str,
+            strict: bool = False,
+            transport: Optional[PooledTransport] = None,
+            wiki_cache: Optional[WikiPageCache] = None,
+    ):
+        self.transport = transport
+        client_kwargs = transport.client_kwargs(Erc3Client) if transport is not None else {}
+        self._client = Erc3Client(base_url=base_url, **client_kwargs)
+        self._converter = ModelConverter(strict=strict)
+        self.wiki_cache = wiki_cache if wiki_cache is not None else WikiPageCache()
 
     # -----------------------------
     # Core
@@ -92,7 +116,7 @@ class PrimitiveErc3APIClient:
 
     def list_employees(self, offset: int, limit: int) -> PagedResult[Employee]:
         resp = self._client.list_employees(offset=offset, limit=limit)
-        employees = [_model_from(Employee, e) for e in (resp.employees or [])]
+        employees = self._converter.convert_many(Employee, resp.employees)
         return PagedResult[Employee](items=employees, next_offset=resp.next_offset)
 
     def search_employees(
@@ -116,7 +140,7 @@ class PrimitiveErc3APIClient:
             skills=[_to_dict(s) for s in (skills or [])],
             wills=[_to_dict(w) for w in (wills or [])],
         )
-        employees = [_model_from(Employee, e) for e in (resp.employees or [])]
+        employees = self._converter.convert_many(Employee, resp.employees)
         return PagedResult[Employee](items=employees, next_offset=resp.next_offset)
 
     def get_employee(self, employee_id: EmployeeID) -> Optional[Employee]:
@@ -162,9 +186,41 @@ class PrimitiveErc3APIClient:
         resp = self._client.load_wiki(file=file)
         return WikiArticle(path=resp.file, content=resp.content)
 
+    def load_wiki_many(
+            self,
+            paths: Sequence[str],
+            wiki_sha1: Optional[str] = None,
+            max_workers: int = 8,
+            refresh: bool = False,
+    ) -> List[WikiArticle]:
+        """Load several pages concurrently, in request order, through `wiki_cache`.
+
+        Pages cached for `wiki_sha1` are not re-fetched unless `refresh=True`. Without a digest the
+        current one is taken from `list_wiki`.
+        """
+        if wiki_sha1 is None:
+            wiki_sha1 = self.list_wiki().sha1
+
+        loaded: Dict[str, WikiArticle] = {}
+        missing: List[str] = []
+        for path in dict.fromkeys(paths):
+            cached = None if refresh else self.wiki_cache.get(path, wiki_sha1)
+            if cached is None:
+                missing.append(path)
+            else:
+                loaded[path] = cached
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as pool:
+                for path, article in zip(missing, pool.map(self.load_wiki, missing)):
+                    self.wiki_cache.put(path, wiki_sha1, article)
+                    loaded[path] = article
+
+        return [loaded[path] for path in paths]
+
     def search_wiki(self, query_regex: str) -> List[WikiSearchSnippet]:
         resp = self._client.search_wiki(query_regex=query_regex)
-        return [_model_from(WikiSearchSnippet, r) for r in (resp.results or [])]
+        return self._converter.convert_many(WikiSearchSnippet, resp.results)
 
     def update_wiki(
             self,
@@ -173,6 +229,7 @@ class PrimitiveErc3APIClient:
             changed_by: Optional[EmployeeID] = None,
     ) -> None:
         self._client.update_wiki(file=file, content=content, changed_by=changed_by)
+        self.wiki_cache.discard(file)
 
     # -----------------------------
     # Customers
@@ -180,7 +237,7 @@ class PrimitiveErc3APIClient:
 
     def list_customers(self, offset: int, limit: int) -> PagedResult[Company]:
         resp = self._client.list_customers(offset=offset, limit=limit)
-        companies = [_model_from(Company, c) for c in (resp.companies or [])]
+        companies = self._converter.convert_many(Company, resp.companies)
         return PagedResult[Company](items=companies, next_offset=resp.next_offset)
 
     def search_customers(
@@ -200,7 +257,7 @@ class PrimitiveErc3APIClient:
             account_managers=account_managers or [],
             locations=locations or [],
         )
-        companies = [_model_from(Company, c) for c in (resp.companies or [])]
+        companies = self._converter.convert_many(Company, resp.companies)
         return PagedResult[Company](items=companies, next_offset=resp.next_offset)
 
     def get_customer(self, customer_id: str) -> Optional[Company]:
@@ -215,7 +272,7 @@ class PrimitiveErc3APIClient:
 
     def list_projects(self, offset: int, limit: int) -> PagedResult[Project]:
         resp = self._client.list_projects(offset=offset, limit=limit)
-        projects = [_model_from(Project, p) for p in (resp.projects or [])]
+        projects = self._converter.convert_many(Project, resp.projects)
         return PagedResult[Project](items=projects, next_offset=resp.next_offset)
 
     def search_projects(
@@ -237,7 +294,7 @@ class PrimitiveErc3APIClient:
             team=team,
             include_archived=include_archived,
         )
-        projects = [_model_from(Project, p) for p in (resp.projects or [])]
+        projects = self._converter.convert_many(Project, resp.projects)
         return PagedResult[Project](items=projects, next_offset=resp.next_offset)
 
     def get_project(self, project_id: ProjectID) -> Optional[Project]:
@@ -298,7 +355,7 @@ class PrimitiveErc3APIClient:
         request_kwargs["offset"] = offset
 
         resp = self._client.search_time_entries(**request_kwargs)
-        entries = [_model_from(TimeEntry, e) for e in (resp.entries or [])]
+        entries = self._converter.convert_many(TimeEntry, resp.entries)
         return TimeEntries(
             entries=entries,
             next_offset=resp.next_offset,
@@ -324,7 +381,7 @@ class PrimitiveErc3APIClient:
             employees=employees or [],
             billable=billable,
         )
-        return [_model_from(TimeSummary, s) for s in (resp.summaries or [])]
+        return self._converter.convert_many(TimeSummary, resp.summaries)
 
     def time_summary_by_employee(
             self,
@@ -343,7 +400,38 @@ class PrimitiveErc3APIClient:
             employees=employees or [],
             billable=billable,
         )
-        return [_model_from(TimeSummary, s) for s in (resp.summaries or [])]
+        return self._converter.convert_many(TimeSummary, resp.summaries)
+
+
+class PrefetchPolicy(BaseModel):
+    """Prefetch configuration for `MemoryErc3Client`."""
+
+    page_limit: int = Field(999, description="Requested page size for registry paging")
+    page_fanout: int = Field(
+        1,
+        description="Offset windows fetched concurrently per paged endpoint after the first page (1 = serial)",
+    )
+    concurrent: bool = Field(
+        False,
+        description="Run the registry and time-summary fetches concurrently after `who_am_i`",
+    )
+    max_workers: int = Field(6, description="Upper bound on concurrent prefetch calls (concurrent mode only)")
+    columnar_time_entries: bool = Field(
+        False,
+        description="Keep time entries in a `TimeEntryColumns` store instead of per-row `TimeEntry` objects",
+    )
+    local_time_summaries: bool = Field(
+        False,
+        description="Compute time summaries locally from prefetched time entries instead of remote calls",
+    )
+    verify_time_summaries: bool = Field(
+        False,
+        description="With local summaries: also fetch the remote ones once, diff, and prefer remote on mismatch",
+    )
+    local_wiki_search: bool = Field(
+        False,
+        description="Answer `search_wiki` from a local wiki mirror (loaded once per wiki digest)",
+    )
 
 
 class MemoryErc3Client(PrimitiveErc3APIClient):
@@ -357,30 +445,222 @@ class MemoryErc3Client(PrimitiveErc3APIClient):
     Notes:
     - Time summaries require a date range. This class makes `date_from`/`date_to` mandatory
       to avoid guessing and to keep runs reproducible.
+    - With `PrefetchPolicy.concurrent`, the six prefetch calls overlap on a bounded thread pool.
+      Results are joined in a fixed order before reference population, so the resulting
+      `UserContext` is identical to the sequential path.
+    - Paging goes through `pager` (`paging.PagedFetcher`): the effective page size is learned per
+      endpoint, `PrefetchPolicy.page_fanout > 1` fetches the following offset windows
+      concurrently, pages are merged in offset order, and `pager.stats` holds per-endpoint timing.
+    - With a `SnapshotCache`, registries are served from disk when the snapshot identity
+      (base_url, wiki_sha1, today, date range, caller, summary source) was already fetched; `who_am_i` is
+      always called first because it provides that identity. Every successful write through this
+      client drops that entry, so the next run re-fetches the changed registries.
+    - `index` (`RegistryIndex`) is built once after prefetch and backs reference population and
+      O(1)/O(log n) lookups by id, location, department, account manager, skills/wills and team.
+    - With `PrefetchPolicy.columnar_time_entries`, time entries live only in `time_entry_columns`
+      (pages are appended and dropped); `user_context.time_entries` and the per-entity
+      `time_entries` fan-out lists stay empty, and entity rows are reached through the store's
+      posting lists (`rows_for_employee/customer/project`).
+    - With `PrefetchPolicy.local_time_summaries`, both time summaries are aggregated locally from the
+      prefetched entries (`time_summary.py`), and `local_time_summary_by_*` answers ad-hoc summary
+      queries inside the prefetched date range without network calls. `verify_time_summaries`
+      diffs the local result against the remote endpoints once per snapshot; differences are kept
+      in `time_summary_diff` and the remote summaries are used instead.
+    - With `PrefetchPolicy.local_wiki_search`, `search_wiki` is answered from `wiki`
+      (`wiki_mirror.WikiMirror`), loaded lazily via `list_wiki`/`load_wiki` and reloaded when
+      `wiki_sha1` changes or after `update_wiki`. `verify_wiki_search` diffs it against the remote.
     """
 
-    def __init__(self, base_url: str, date_from: str, date_to: str):
-        super().__init__(base_url=base_url)
-        self.page_limit = 999
+    _SNAPSHOT_FIELDS: Dict[str, Type[BaseModel]] = {
+        "employees": Employee,
+        "customers": Company,
+        "projects": Project,
+        "time_entries": TimeEntry,
+        "time_summaries_by_project": TimeSummary,
+        "time_summaries_by_employee": TimeSummary,
+    }
+
+    def __init__(
+            self,
+            base_url: str,
+            date_from: str,
+            date_to: str,
+            policy: Optional[PrefetchPolicy] = None,
+            cache: Optional[SnapshotCache] = None,
+            transport: Optional[PooledTransport] = None,
+            wiki_cache: Optional[WikiPageCache] = None,
+    ):
+        self._configure(base_url, date_from, date_to, policy, transport, wiki_cache)
 
         self.user_context: UserContext = self.who_am_i()
 
+        cache_key, cached = self._lookup_snapshot(cache)
+        if cached is not None:
+            self._load_snapshot(cached)
+        elif self.policy.concurrent:
+            self._prefetch_concurrent(date_from=date_from, date_to=date_to)
+        else:
+            self._prefetch_sequential(date_from=date_from, date_to=date_to)
+
+        self._finish_prefetch(cache, cache_key, cached)
+
+    def _configure(
+            self,
+            base_url: str,
+            date_from: str,
+            date_to: str,
+            policy: Optional[PrefetchPolicy],
+            transport: Optional[PooledTransport],
+            wiki_cache: Optional[WikiPageCache] = None,
+    ) -> None:
+        """Instance setup that performs no remote calls (shared with the async prefetch)."""
+        super().__init__(base_url=base_url, transport=transport, wiki_cache=wiki_cache)
+        self.base_url = base_url
+        self.policy = policy or PrefetchPolicy()
+        self.page_limit = self.policy.page_limit
+        self.pager = PagedFetcher(page_limit=self.policy.page_limit, fanout=self.policy.page_fanout)
+
+        self.date_from = date_from
+        self.date_to = date_to
+
+        self.time_entry_columns: Optional[TimeEntryColumns] = None
+        self.time_summary_diff: List[str] = []
+        self._summary_columns: Optional[TimeEntryColumns] = None
+        self.wiki: Optional[WikiMirror] = None
+        self.snapshot_cache: Optional[SnapshotCache] = None
+        self.snapshot_cache_key: Optional[SnapshotCacheKey] = None
+
+    def _lookup_snapshot(
+            self, cache: Optional[SnapshotCache]
+    ) -> Tuple[Optional[SnapshotCacheKey], Optional[Dict[str, Any]]]:
+        if cache is None:
+            return None, None
+        cache_key = SnapshotCacheKey.for_context(
+            self.base_url, self.user_context, self.date_from, self.date_to, summary_source=self._summary_origin()
+        )
+        cache.invalidate_digest(base_url=self.base_url, wiki_sha1=self.user_context.wiki_sha1)
+        return cache_key, cache.get(cache_key)
+
+    def _finish_prefetch(
+            self,
+            cache: Optional[SnapshotCache],
+            cache_key: Optional[SnapshotCacheKey],
+            cached: Optional[Dict[str, Any]],
+    ) -> None:
+        self.snapshot_cache = cache
+        self.snapshot_cache_key = cache_key
+        if cache is not None and cached is None:
+            # Stored before reference population: the payload must stay acyclic.
+            cache.put(cache_key, self._snapshot_payload())
+
+        self.index = RegistryIndex(self.user_context)
+        self._populate_references()
+        self._populate_time_summaries()
+
+    def _invalidate_snapshot(self) -> None:
+        """Drop the cached snapshot this client was built from (called after every successful write)."""
+        if self.snapshot_cache is not None and self.snapshot_cache_key is not None:
+            self.snapshot_cache.invalidate(self.snapshot_cache_key)
+
+    def _prefetch_sequential(self, *, date_from: str, date_to: str) -> None:
         self.user_context.employees = self._fetch_all_employees()
         self.user_context.customers = self._fetch_all_customers()
         self.user_context.projects = self._fetch_all_projects()
-        self.user_context.time_entries = self._fetch_all_time_entries(date_from=date_from, date_to=date_to)
+        self._assign_time_entries(self._fetch_time_entries(date_from=date_from, date_to=date_to))
+
+        remote: Optional[Tuple[List[TimeSummary], List[TimeSummary]]] = None
+        if self._needs_remote_summaries():
+            summary_kwargs = self._summary_kwargs(date_from=date_from, date_to=date_to)
+            remote = (self.time_summary_by_project(**summary_kwargs), self.time_summary_by_employee(**summary_kwargs))
+        self._assign_time_summaries(remote)
+
+    def _prefetch_concurrent(self, *, date_from: str, date_to: str) -> None:
+        summary_kwargs = self._summary_kwargs(date_from=date_from, date_to=date_to)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.policy.max_workers)) as pool:
+            employees = pool.submit(self._fetch_all_employees)
+            customers = pool.submit(self._fetch_all_customers)
+            projects = pool.submit(self._fetch_all_projects)
+            time_entries = pool.submit(self._fetch_time_entries, date_from=date_from, date_to=date_to)
+            remote_futures = None
+            if self._needs_remote_summaries():
+                remote_futures = (
+                    pool.submit(self.time_summary_by_project, **summary_kwargs),
+                    pool.submit(self.time_summary_by_employee, **summary_kwargs),
+                )
+
+            # Deterministic join: assignment order is fixed regardless of completion order,
+            # and the first failure (in this order) is re-raised.
+            self.user_context.employees = employees.result()
+            self.user_context.customers = customers.result()
+            self.user_context.projects = projects.result()
+            self._assign_time_entries(time_entries.result())
+            remote = None
+            if remote_futures is not None:
+                remote = (remote_futures[0].result(), remote_futures[1].result())
+
+        self._assign_time_summaries(remote)
+
+    def _fetch_time_entries(self, *, date_from: str, date_to: str) -> Union[List[TimeEntry], TimeEntryColumns]:
+        if self.policy.columnar_time_entries:
+            return self._fetch_time_entry_columns(date_from=date_from, date_to=date_to)
+        return self._fetch_all_time_entries(date_from=date_from, date_to=date_to)
+
+    def _assign_time_entries(self, fetched: Union[List[TimeEntry], TimeEntryColumns]) -> None:
+        if isinstance(fetched, TimeEntryColumns):
+            self.time_entry_columns = fetched
+            self.user_context.time_entries = []
+        else:
+            self.user_context.time_entries = fetched
 
-        self._populate_references()
+    def _summary_origin(self) -> str:
+        if not self.policy.local_time_summaries:
+            return "remote"
+        return "verified" if self.policy.verify_time_summaries else "local"
 
-        self.user_context.time_summaries_by_project = self.time_summary_by_project(
-            date_from=date_from,
-            date_to=date_to,
-            customers=[],
-            projects=[],
-            employees=[],
-            billable="",
-        )
-        self.user_context.time_summaries_by_employee = self.time_summary_by_employee(
+    def _needs_remote_summaries(self) -> bool:
+        return not self.policy.local_time_summaries or self.policy.verify_time_summaries
+
+    def _assign_time_summaries(self, remote: Optional[Tuple[List[TimeSummary], List[TimeSummary]]]) -> None:
+        if not self.policy.local_time_summaries:
+            by_project, by_employee = remote
+        else:
+            by_project = self.local_time_summary_by_project(date_from=self.date_from, date_to=self.date_to)
+            by_employee = self.local_time_summary_by_employee(date_from=self.date_from, date_to=self.date_to)
+            if remote is not None:
+                self.time_summary_diff = (
+                        diff_summaries("by_project", by_project, remote[0])
+                        + diff_summaries("by_employee", by_employee, remote[1])
+                )
+                if self.time_summary_diff:
+                    by_project, by_employee = remote
+
+        self.user_context.time_summaries_by_project = by_project
+        self.user_context.time_summaries_by_employee = by_employee
+
+    def _snapshot_payload(self) -> Dict[str, Any]:
+        payload = {
+            name: [_to_dict(item) for item in getattr(self.user_context, name)]
+            for name in self._SNAPSHOT_FIELDS
+        }
+        if self.time_entry_columns is not None:
+            payload["time_entries"] = list(self.time_entry_columns.records())
+        payload["time_summary_diff"] = list(self.time_summary_diff)
+        return payload
+
+    def _load_snapshot(self, payload: Dict[str, Any]) -> None:
+        for name, model_cls in self._SNAPSHOT_FIELDS.items():
+            if name == "time_entries" and self.policy.columnar_time_entries:
+                self._assign_time_entries(TimeEntryColumns.from_records(payload[name]))
+                continue
+            setattr(self.user_context, name, self._converter.convert_many(model_cls, payload[name]))
+        # The key's `summary_source` matches this client's policy, so the stored summaries (and the
+        # verification diff, when verified) are the ones this policy would have produced.
+        self.time_summary_diff = list(payload.get("time_summary_diff", []))
+
+    @staticmethod
+    def _summary_kwargs(*, date_from: str, date_to: str) -> Dict[str, Any]:
+        return dict(
             date_from=date_from,
             date_to=date_to,
             customers=[],
@@ -389,46 +669,46 @@ class MemoryErc3Client(PrimitiveErc3APIClient):
             billable="",
         )
 
-        self._populate_time_summaries()
-
     def _fetch_all_employees(self) -> List[Employee]:
-        results: List[Employee] = []
-        offset: int = 0
-        while True:
-            page = self.list_employees(offset=offset, limit=self.page_limit)
-            results.extend(page.items)
-            if page.next_offset is None:
-                break
-            offset = page.next_offset
-        return results
+        return self.pager.fetch_all(
+            "list_employees",
+            lambda offset, limit: _page_of(self.list_employees(offset=offset, limit=limit)),
+        )
 
     def _fetch_all_customers(self) -> List[Company]:
-        results: List[Company] = []
-        offset: int = 0
-        while True:
-            page = self.list_customers(offset=offset, limit=self.page_limit)
-            results.extend(page.items)
-            if page.next_offset is None:
-                break
-            offset = page.next_offset
-        return results
+        return self.pager.fetch_all(
+            "list_customers",
+            lambda offset, limit: _page_of(self.list_customers(offset=offset, limit=limit)),
+        )
 
     def _fetch_all_projects(self) -> List[Project]:
-        results: List[Project] = []
-        offset: int = 0
-        while True:
-            page = self.list_projects(offset=offset, limit=self.page_limit)
-            results.extend(page.items)
-            if page.next_offset is None:
-                break
-            offset = page.next_offset
-        return results
+        return self.pager.fetch_all(
+            "list_projects",
+            lambda offset, limit: _page_of(self.list_projects(offset=offset, limit=limit)),
+        )
 
     def _fetch_all_time_entries(self, *, date_from: str, date_to: str) -> List[TimeEntry]:
-        results: List[TimeEntry] = []
-        offset: int = 0
+        request = self._time_entries_request(date_from=date_from, date_to=date_to)
+        return self.pager.fetch_all(
+            "search_time_entries",
+            lambda offset, limit: _entries_page_of(self.search_time_entries(limit=limit, offset=offset, request=request)),
+        )
+
+    def _fetch_time_entry_columns(self, *, date_from: str, date_to: str) -> TimeEntryColumns:
+        columns = TimeEntryColumns()
+        request = self._time_entries_request(date_from=date_from, date_to=date_to)
+
+        for entries in self.pager.iter_pages(
+                "search_time_entries",
+                lambda offset, limit: _entries_page_of(self.search_time_entries(limit=limit, offset=offset, request=request)),
+        ):
+            columns.extend(entries)
+
+        return columns
 
-        request = TimeEntriesRequest(
+    @staticmethod
+    def _time_entries_request(*, date_from: str, date_to: str) -> TimeEntriesRequest:
+        return TimeEntriesRequest(
             date_from=date_from,
             date_to=date_to,
             employee=None,
@@ -439,19 +719,10 @@ class MemoryErc3Client(PrimitiveErc3APIClient):
             status="",
         )
 
-        while True:
-            page = self.search_time_entries(limit=self.page_limit, offset=offset, request=request)
-            results.extend(page.entries)
-            if page.next_offset is None:
-                break
-            offset = page.next_offset
-
-        return results
-
     def _populate_references(self) -> None:
-        customers_by_id: Dict[str, Company] = {c.id: c for c in self.user_context.customers}
-        projects_by_id: Dict[str, Project] = {p.id: p for p in self.user_context.projects}
-        employees_by_id: Dict[str, Employee] = {e.id: e for e in self.user_context.employees}
+        customers_by_id = self.index.customers_by_id
+        projects_by_id = self.index.projects_by_id
+        employees_by_id = self.index.employees_by_id
 
         for project in self.user_context.projects:
             customer = customers_by_id.get(project.customer)
@@ -478,8 +749,8 @@ class MemoryErc3Client(PrimitiveErc3APIClient):
                     project.time_entries.append(time_entry)
 
     def _populate_time_summaries(self) -> None:
-        projects_by_id: Dict[str, Project] = {p.id: p for p in self.user_context.projects}
-        employees_by_id: Dict[str, Employee] = {e.id: e for e in self.user_context.employees}
+        projects_by_id = self.index.projects_by_id
+        employees_by_id = self.index.employees_by_id
 
         for summary in self.user_context.time_summaries_by_project:
             project = projects_by_id.get(summary.project)
@@ -491,4 +762,507 @@ class MemoryErc3Client(PrimitiveErc3APIClient):
             if employee is not None:
                 employee.time_summaries.append(summary)
 
+    # -----------------------------
+    # Local time summaries
+    # -----------------------------
+
+    def local_time_summary_by_project(
+            self,
+            date_from: str,
+            date_to: str,
+            customers: Optional[List[str]] = None,
+            projects: Optional[List[str]] = None,
+            employees: Optional[List[str]] = None,
+            billable: BillableFilter = "",
+    ) -> List[TimeSummary]:
+        return summarize_by_project(
+            self._summary_source(date_from, date_to), date_from, date_to, customers, projects, employees, billable
+        )
+
+    def local_time_summary_by_employee(
+            self,
+            date_from: str,
+            date_to: str,
+            customers: Optional[List[str]] = None,
+            projects: Optional[List[str]] = None,
+            employees: Optional[List[str]] = None,
+            billable: BillableFilter = "",
+    ) -> List[TimeSummary]:
+        return summarize_by_employee(
+            self._summary_source(date_from, date_to), date_from, date_to, customers, projects, employees, billable
+        )
+
+    def _summary_source(self, date_from: str, date_to: str) -> TimeEntryColumns:
+        if date_from < self.date_from or date_to > self.date_to:
+            raise ValueError(
+                f"Summary range {date_from}..{date_to} is outside the prefetched range {self.date_from}..{self.date_to}"
+            )
+        if self.time_entry_columns is not None:
+            return self.time_entry_columns
+        if self._summary_columns is None:
+            self._summary_columns = TimeEntryColumns.from_entries(self.user_context.time_entries or [])
+        return self._summary_columns
+
+    # -----------------------------
+    # Local wiki search
+    # -----------------------------
+
+    def search_wiki(self, query_regex: str) -> List[WikiSearchSnippet]:
+        if not self.policy.local_wiki_search:
+            return super().search_wiki(query_regex)
+        return self.wiki_mirror().search(query_regex)
+
+    def update_wiki(self, file: str, content: str, changed_by: Optional[EmployeeID] = None) -> None:
+        super().update_wiki(file=file, content=content, changed_by=changed_by)
+        self.wiki = None
+        self._invalidate_snapshot()
+
+    def wiki_mirror(self) -> WikiMirror:
+        sha1 = self.user_context.wiki_sha1
+        if self.wiki is None or (sha1 is not None and self.wiki.sha1 != sha1):
+            self.wiki = WikiMirror.from_client(self)
+        return self.wiki
+
+    def verify_wiki_search(self, queries: Sequence[str]) -> List[str]:
+        """Differences between local and remote `search_wiki` results (empty list = equivalent)."""
+        mirror = self.wiki_mirror()
+        diffs: List[str] = []
+        for query in queries:
+            diffs += diff_search_results(query, mirror.search(query), super().search_wiki(query))
+        return diffs
+
+    # -----------------------------
+    # Writes (invalidate the cached snapshot)
+    # -----------------------------
+
+    def update_employee_info(
+            self,
+            employee: EmployeeID,
+            notes: Optional[str] = None,
+            salary: Optional[int] = None,
+            skills: Optional[List[SkillLevel]] = None,
+            wills: Optional[List[SkillLevel]] = None,
+            location: Optional[str] = None,
+            department: Optional[str] = None,
+            changed_by: Optional[EmployeeID] = None,
+    ) -> Optional[Employee]:
+        updated = super().update_employee_info(
+            employee=employee,
+            notes=notes,
+            salary=salary,
+            skills=skills,
+            wills=wills,
+            location=location,
+            department=department,
+            changed_by=changed_by,
+        )
+        self._invalidate_snapshot()
+        return updated
+
+    def update_project_team(
+            self, project_id: ProjectID, team: List[Dict[str, Any]], changed_by: Optional[EmployeeID] = None
+    ) -> None:
+        super().update_project_team(project_id=project_id, team=team, changed_by=changed_by)
+        self._invalidate_snapshot()
+
+    def update_project_status(
+            self, project_id: ProjectID, status: DealPhase, changed_by: Optional[EmployeeID] = None
+    ) -> None:
+        super().update_project_status(project_id=project_id, status=status, changed_by=changed_by)
+        self._invalidate_snapshot()
+
+    def log_time_entry(self, request: TimeEntry) -> TimeEntry:
+        entry = super().log_time_entry(request)
+        self._invalidate_snapshot()
+        return entry
+
+    def update_time_entry(self, request: TimeEntry) -> None:
+        super().update_time_entry(request)
+        self._invalidate_snapshot()
+
     # Single-call convenience accessors
+
+
+# ============================================================
+# Streaming SQL snapshot (Process A3)
+# ============================================================
+
+
+class SnapshotAcquisitionPolicy(BaseModel):
+    """Configuration rail for streaming snapshot acquisition into the session SQLite DB."""
+
+    db_root: str = Field("./.jbeval/", description="Directory that holds session snapshot databases")
+    db_filename_format: str = Field(
+        "snapshot-{timestamp}-{run_id}.sqlite",
+        description="Snapshot DB filename; `{timestamp}` and `{run_id}` make it unique per run",
+    )
+    page_limit: int = Field(999, description="Requested page size for registry paging")
+    page_fanout: int = Field(
+        1,
+        description="Offset windows fetched concurrently per paged endpoint after the first page (1 = serial)",
+    )
+    insert_batch_size_rows: int = Field(500, description="Flush staged rows once this many are buffered")
+    max_buffer_rows: int = Field(5000, description="Hard guard on staged rows held in memory")
+    order_by_id_before_insert: bool = Field(
+        True,
+        description="Sort each staged batch by primary key before insert for deterministic row order",
+    )
+
+
+SNAPSHOT_SCHEMA: Dict[str, str] = {
+    "employees": """
+        CREATE TABLE employees (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            salary INTEGER NOT NULL,
+            location TEXT NOT NULL,
+            department TEXT NOT NULL,
+            notes TEXT
+        )""",
+    "employee_skills": """
+        CREATE TABLE employee_skills (
+            employee_id TEXT NOT NULL REFERENCES employees(id),
+            name TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            PRIMARY KEY (employee_id, name)
+        )""",
+    "employee_wills": """
+        CREATE TABLE employee_wills (
+            employee_id TEXT NOT NULL REFERENCES employees(id),
+            name TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            PRIMARY KEY (employee_id, name)
+        )""",
+    "customers": """
+        CREATE TABLE customers (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            location TEXT NOT NULL,
+            deal_phase TEXT NOT NULL,
+            high_level_status TEXT NOT NULL,
+            brief TEXT,
+            primary_contact_name TEXT,
+            primary_contact_email TEXT,
+            account_manager TEXT REFERENCES employees(id)
+        )""",
+    "projects": """
+        CREATE TABLE projects (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            customer TEXT NOT NULL REFERENCES customers(id),
+            status TEXT NOT NULL,
+            description TEXT
+        )""",
+    "project_team": """
+        CREATE TABLE project_team (
+            project_id TEXT NOT NULL REFERENCES projects(id),
+            position INTEGER NOT NULL,
+            employee_id TEXT NOT NULL REFERENCES employees(id),
+            time_slice REAL NOT NULL,
+            role TEXT NOT NULL,
+            PRIMARY KEY (project_id, position)
+        )""",
+    "time_entries": """
+        CREATE TABLE time_entries (
+            id TEXT PRIMARY KEY,
+            employee TEXT REFERENCES employees(id),
+            customer TEXT REFERENCES customers(id),
+            project TEXT REFERENCES projects(id),
+            date TEXT NOT NULL,
+            hours REAL NOT NULL,
+            work_category TEXT NOT NULL,
+            notes TEXT NOT NULL,
+            billable INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            logged_by TEXT,
+            changed_by TEXT
+        )""",
+    "time_summaries_by_project": """
+        CREATE TABLE time_summaries_by_project (
+            position INTEGER PRIMARY KEY,
+            employee TEXT,
+            customer TEXT,
+            project TEXT,
+            total_hours REAL NOT NULL,
+            billable_hours REAL NOT NULL,
+            non_billable_hours REAL NOT NULL,
+            distinct_employees INTEGER NOT NULL
+        )""",
+    "time_summaries_by_employee": """
+        CREATE TABLE time_summaries_by_employee (
+            position INTEGER PRIMARY KEY,
+            employee TEXT,
+            customer TEXT,
+            project TEXT,
+            total_hours REAL NOT NULL,
+            billable_hours REAL NOT NULL,
+            non_billable_hours REAL NOT NULL,
+            distinct_employees INTEGER NOT NULL
+        )""",
+    "snapshot_meta": """
+        CREATE TABLE snapshot_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )""",
+}
+
+# Number of leading columns forming the primary key (used for per-batch ordering).
+_SNAPSHOT_KEY_WIDTH: Dict[str, int] = {
+    "employees": 1,
+    "employee_skills": 2,
+    "employee_wills": 2,
+    "customers": 1,
+    "projects": 1,
+    "project_team": 2,
+    "time_entries": 1,
+    "time_summaries_by_project": 1,
+    "time_summaries_by_employee": 1,
+    "snapshot_meta": 1,
+}
+
+
+class _RowBuffer:
+    """Per-table staging area that flushes into SQLite in bounded batches."""
+
+    def __init__(self, connection: sqlite3.Connection, policy: SnapshotAcquisitionPolicy):
+        if policy.insert_batch_size_rows <= 0:
+            raise ValueError("insert_batch_size_rows must be positive")
+        if policy.insert_batch_size_rows > policy.max_buffer_rows:
+            raise ValueError("insert_batch_size_rows must not exceed max_buffer_rows")
+        self._connection = connection
+        self._policy = policy
+        self._rows: Dict[str, List[Tuple[Any, ...]]] = {}
+        self._staged = 0
+        self.inserted: Dict[str, int] = {}
+
+    def stage(self, table: str, row: Sequence[Any]) -> None:
+        if self._staged >= self._policy.max_buffer_rows:
+            raise RuntimeError(f"Snapshot buffer exceeded max_buffer_rows={self._policy.max_buffer_rows}")
+        self._rows.setdefault(table, []).append(tuple(row))
+        self._staged += 1
+        if self._staged >= self._policy.insert_batch_size_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        for table in sorted(self._rows):
+            rows = self._rows[table]
+            if not rows:
+                continue
+            if self._policy.order_by_id_before_insert:
+                width = _SNAPSHOT_KEY_WIDTH[table]
+                rows.sort(key=lambda r: tuple("" if v is None else v for v in r[:width]))
+            placeholders = ", ".join("?" for _ in rows[0])
+            self._connection.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+            self.inserted[table] = self.inserted.get(table, 0) + len(rows)
+        self._connection.commit()
+        self._rows = {}
+        self._staged = 0
+
+
+class SQLErc3Client(PrimitiveErc3APIClient):
+    """Streaming snapshot client that writes directly to a fresh session SQLite DB.
+
+    Design goals:
+    - Use `PrimitiveErc3APIClient` as the exclusive remote-call primitive.
+    - Fetch one page -> normalize to `policy.py` models -> stage rows -> flush in batches.
+    - Never hold a full entity snapshot in memory: staged rows are bounded by
+      `SnapshotAcquisitionPolicy.max_buffer_rows`, and each page is dropped after staging.
+    - Record acquisition provenance in `snapshot_meta`.
+
+    Notes:
+    - `who_am_i` is called first; its digest fields key the snapshot provenance.
+    - The DB is created fresh per run, so plain INSERTs are used (no upserts).
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            date_from: str,
+            date_to: str,
+            policy: Optional[SnapshotAcquisitionPolicy] = None,
+            transport: Optional[PooledTransport] = None,
+            wiki_cache: Optional[WikiPageCache] = None,
+    ):
+        super().__init__(base_url=base_url, transport=transport, wiki_cache=wiki_cache)
+        self.policy = policy or SnapshotAcquisitionPolicy()
+        self.base_url = base_url
+        self.pager = PagedFetcher(page_limit=self.policy.page_limit, fanout=self.policy.page_fanout)
+
+        self.user_context: UserContext = self.who_am_i()
+
+        self.db_path = self._new_db_path()
+        self.connection = sqlite3.connect(str(self.db_path))
+        for ddl in SNAPSHOT_SCHEMA.values():
+            self.connection.execute(ddl)
+        self.connection.commit()
+
+        self._buffer = _RowBuffer(self.connection, self.policy)
+
+        self._stream_employees()
+        self._stream_customers()
+        self._stream_projects()
+        self._stream_time_entries(date_from=date_from, date_to=date_to)
+        self._stream_time_summaries(date_from=date_from, date_to=date_to)
+        self._write_snapshot_meta(date_from=date_from, date_to=date_to)
+
+        self._buffer.flush()
+
+    def _new_db_path(self) -> Path:
+        root = Path(self.policy.db_root)
+        root.mkdir(parents=True, exist_ok=True)
+        filename = self.policy.db_filename_format.format(
+            timestamp=datetime.now().strftime("%Y%m%dT%H%M%S"),
+            run_id=uuid.uuid4().hex[:12],
+        )
+        path = root / filename
+        if path.exists():
+            raise FileExistsError(f"Snapshot DB already exists (filename must be unique per run): {path}")
+        return path
+
+    def close(self) -> None:
+        self.connection.close()
+
+    # -----------------------------
+    # Paged streaming
+    # -----------------------------
+
+    def _stream_employees(self) -> None:
+        for employees in self.pager.iter_pages(
+                "list_employees",
+                lambda offset, limit: _page_of(self.list_employees(offset=offset, limit=limit)),
+        ):
+            for employee in employees:
+                self._stage_employee(employee)
+
+    def _stream_customers(self) -> None:
+        for customers in self.pager.iter_pages(
+                "list_customers",
+                lambda offset, limit: _page_of(self.list_customers(offset=offset, limit=limit)),
+        ):
+            for customer in customers:
+                self._stage_customer(customer)
+
+    def _stream_projects(self) -> None:
+        for projects in self.pager.iter_pages(
+                "list_projects",
+                lambda offset, limit: _page_of(self.list_projects(offset=offset, limit=limit)),
+        ):
+            for project in projects:
+                self._stage_project(project)
+
+    def _stream_time_entries(self, *, date_from: str, date_to: str) -> None:
+        request = MemoryErc3Client._time_entries_request(date_from=date_from, date_to=date_to)
+
+        for entries in self.pager.iter_pages(
+                "search_time_entries",
+                lambda offset, limit: _entries_page_of(self.search_time_entries(limit=limit, offset=offset, request=request)),
+        ):
+            for entry in entries:
+                self._stage_time_entry(entry)
+
+    def _stream_time_summaries(self, *, date_from: str, date_to: str) -> None:
+        summary_kwargs = MemoryErc3Client._summary_kwargs(date_from=date_from, date_to=date_to)
+
+        for position, summary in enumerate(self.time_summary_by_project(**summary_kwargs)):
+            self._stage_time_summary("time_summaries_by_project", position, summary)
+
+        for position, summary in enumerate(self.time_summary_by_employee(**summary_kwargs)):
+            self._stage_time_summary("time_summaries_by_employee", position, summary)
+
+    def _write_snapshot_meta(self, *, date_from: str, date_to: str) -> None:
+        meta = {
+            "base_url": self.base_url,
+            "today": self.user_context.today,
+            "wiki_sha1": self.user_context.wiki_sha1,
+            "current_user": self.user_context.current_user,
+            "is_public": json.dumps(self.user_context.is_public),
+            "date_from": date_from,
+            "date_to": date_to,
+            "acquisition_policy": _to_json(self.policy),
+        }
+        for key, value in meta.items():
+            self._buffer.stage("snapshot_meta", (key, value))
+
+    # -----------------------------
+    # Row staging (policy model -> normalized rows)
+    # -----------------------------
+
+    def _stage_employee(self, employee: Employee) -> None:
+        self._buffer.stage(
+            "employees",
+            (
+                employee.id,
+                employee.name,
+                employee.email,
+                employee.salary,
+                employee.location,
+                employee.department,
+                employee.notes,
+            ),
+        )
+        for skill in employee.skills:
+            self._buffer.stage("employee_skills", (employee.id, skill.name, skill.level))
+        for will in employee.wills:
+            self._buffer.stage("employee_wills", (employee.id, will.name, will.level))
+
+    def _stage_customer(self, customer: Company) -> None:
+        self._buffer.stage(
+            "customers",
+            (
+                customer.id,
+                customer.name,
+                customer.location,
+                customer.deal_phase,
+                customer.high_level_status,
+                customer.brief,
+                customer.primary_contact_name,
+                customer.primary_contact_email,
+                customer.account_manager,
+            ),
+        )
+
+    def _stage_project(self, project: Project) -> None:
+        self._buffer.stage(
+            "projects",
+            (project.id, project.name, project.customer, project.status, project.description),
+        )
+        for position, workload in enumerate(project.team):
+            self._buffer.stage(
+                "project_team",
+                (project.id, position, workload.employee, workload.time_slice, workload.role),
+            )
+
+    def _stage_time_entry(self, entry: TimeEntry) -> None:
+        self._buffer.stage(
+            "time_entries",
+            (
+                entry.id,
+                entry.employee,
+                entry.customer,
+                entry.project,
+                entry.date,
+                entry.hours,
+                entry.work_category,
+                entry.notes,
+                int(entry.billable),
+                entry.status,
+                entry.logged_by,
+                entry.changed_by,
+            ),
+        )
+
+    def _stage_time_summary(self, table: str, position: int, summary: TimeSummary) -> None:
+        self._buffer.stage(
+            table,
+            (
+                position,
+                summary.employee,
+                summary.customer,
+                summary.project,
+                summary.total_hours,
+                summary.billable_hours,
+                summary.non_billable_hours,
+                summary.distinct_employees,
+            ),
+        )
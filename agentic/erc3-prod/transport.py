@@ -0,0 +1,167 @@
+"""Shared pooled HTTP transport for `Erc3Client` wrappers.
+
+One `PooledTransport` owns an `httpx.Client` with keep-alive, a bounded connection pool, default
+per-call timeouts and HTTP/2 when the `h2` package is installed. The same instance is meant to be
+injected into every `PrimitiveErc3APIClient` (and subclasses) of a process, so tasks and the
+concurrent prefetch calls reuse warm TCP/TLS connections instead of opening one per client.
+
+Metrics (`metrics()`):
+- `requests`: HTTP requests sent through the transport
+- `connections_opened`: new TCP connections (from the httpcore `trace` extension)
+- `reuse_ratio`: share of requests served on an already-open connection
+- `throttled_s`: total time requests waited on the rate limit
+
+`TransportPolicy.max_requests_per_second` puts a process-wide token bucket in front of every
+request, so all tasks sharing the transport stay under one API rate limit together.
+
+`httpx` is an optional dependency; it is imported lazily and only required when a transport is
+actually constructed.
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:  # HTTP/2 is optional
+    _HAS_H2 = False
+
+# Constructor keywords through which `Erc3Client` may accept a preconfigured HTTP client.
+_ERC3_CLIENT_KWARGS = ("http_client", "client", "session")
+
+
+class TransportPolicy(BaseModel):
+    """Pool, keep-alive and timeout configuration for `PooledTransport`."""
+
+    max_connections: int = Field(32, description="Upper bound on open connections")
+    max_keepalive_connections: int = Field(16, description="Idle connections kept alive for reuse")
+    keepalive_expiry_s: float = Field(30.0, description="Seconds an idle connection stays in the pool")
+    connect_timeout_s: float = Field(5.0, description="TCP/TLS connect timeout")
+    read_timeout_s: float = Field(30.0, description="Per-call response read timeout")
+    write_timeout_s: float = Field(10.0, description="Per-call request write timeout")
+    pool_timeout_s: float = Field(10.0, description="Wait for a free pooled connection")
+    http2: bool = Field(True, description="Negotiate HTTP/2 when the `h2` package is installed")
+    max_requests_per_second: Optional[float] = Field(None, description="Global request rate limit (None = unlimited)")
+    burst: int = Field(10, description="Requests allowed back-to-back before the rate limit applies")
+
+
+class RateLimiter:
+    """Thread-safe token bucket; `acquire()` blocks until a request may be sent."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class PooledTransport:
+    """Thread-safe pooled `httpx.Client` with request/connection metrics."""
+
+    def __init__(self, policy: Optional[TransportPolicy] = None):
+        if httpx is None:
+            raise ImportError("PooledTransport requires the `httpx` package")
+        self.policy = policy or TransportPolicy()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections_opened = 0
+        self._throttled_s = 0.0
+        self.rate_limiter = (
+            RateLimiter(self.policy.max_requests_per_second, self.policy.burst)
+            if self.policy.max_requests_per_second
+            else None
+        )
+
+        self.client = httpx.Client(
+            http2=self.policy.http2 and _HAS_H2,
+            limits=httpx.Limits(
+                max_connections=self.policy.max_connections,
+                max_keepalive_connections=self.policy.max_keepalive_connections,
+                keepalive_expiry=self.policy.keepalive_expiry_s,
+            ),
+            timeout=httpx.Timeout(
+                connect=self.policy.connect_timeout_s,
+                read=self.policy.read_timeout_s,
+                write=self.policy.write_timeout_s,
+                pool=self.policy.pool_timeout_s,
+            ),
+            event_hooks={"request": [self._on_request]},
+        )
+
+    def __enter__(self) -> PooledTransport:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.client.close()
+
+    # -----------------------------
+    # Injection
+    # -----------------------------
+
+    def client_kwargs(self, client_cls: type) -> Dict[str, Any]:
+        """Constructor kwargs that hand this transport's HTTP client to `client_cls`."""
+        parameters = inspect.signature(client_cls).parameters
+        for name in _ERC3_CLIENT_KWARGS:
+            if name in parameters:
+                return {name: self.client}
+        raise TypeError(
+            f"{client_cls.__name__} accepts none of {_ERC3_CLIENT_KWARGS}; "
+            "it cannot be given a shared transport"
+        )
+
+    # -----------------------------
+    # Metrics
+    # -----------------------------
+
+    def _on_request(self, request: Any) -> None:
+        waited = self.rate_limiter.acquire() if self.rate_limiter is not None else 0.0
+        with self._lock:
+            self._requests += 1
+            self._throttled_s += waited
+        request.extensions["trace"] = self._on_trace
+
+    def _on_trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self._connections_opened += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            requests, opened, throttled = self._requests, self._connections_opened, self._throttled_s
+        return {
+            "requests": requests,
+            "connections_opened": opened,
+            "reuse_ratio": (requests - opened) / requests if requests else 0.0,
+            "throttled_s": throttled,
+        }
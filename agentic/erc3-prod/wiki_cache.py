@@ -0,0 +1,65 @@
+"""Shared in-process cache of wiki page contents keyed by `(path, wiki_sha1)`.
+
+Pages are immutable for a given wiki digest, so a page loaded once can be served to every client
+and caller in the process until the digest changes. One `WikiPageCache` is typically injected into
+all `PrimitiveErc3APIClient` instances of a session; entries for other digests age out through LRU
+eviction bounded by entry count.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from policy import WikiArticle
+
+_PageKey = Tuple[str, str]  # (path, wiki_sha1)
+
+
+class WikiPageCache:
+    """Thread-safe LRU of `WikiArticle` by `(path, wiki_sha1)`."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[_PageKey, WikiArticle] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str, wiki_sha1: str) -> Optional[WikiArticle]:
+        key = (path, wiki_sha1)
+        with self._lock:
+            article = self._entries.get(key)
+            if article is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return article
+
+    def put(self, path: str, wiki_sha1: str, article: WikiArticle) -> None:
+        key = (path, wiki_sha1)
+        with self._lock:
+            self._entries[key] = article
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, path: str) -> None:
+        """Drop every cached version of `path` (e.g. after `update_wiki`)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                del self._entries[key]
+
+    def invalidate(self, wiki_sha1: Optional[str] = None) -> None:
+        """Drop entries of one digest, or everything when `wiki_sha1` is None."""
+        with self._lock:
+            if wiki_sha1 is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[1] == wiki_sha1]:
+                del self._entries[key]
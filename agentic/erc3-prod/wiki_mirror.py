@@ -0,0 +1,145 @@
+"""Local wiki mirror with a trigram index answering `search_wiki` without network calls.
+
+The wiki is static for a given `WikiListResult.sha1` (see `prd-wiki-acquisition.md`), so a mirror
+is loaded once per digest via `list_wiki`/`load_wiki` and searched locally.
+
+Search semantics follow the remote endpoint: the regex is applied to every line (`re.search`) and
+each match yields `WikiSearchSnippet(path, linum, content)` with the 1-based line number and the
+full line. Results are ordered by page path, then line number.
+
+Index:
+- Every line is lowercased and split into trigrams; each trigram maps to the line ids containing it.
+- Literal runs that every match must contain are extracted from the parsed regex (top-level
+  concatenation only). Their trigrams intersect posting lists into a candidate set, and only
+  candidates are checked with the regex. Patterns without such a literal (alternations, classes,
+  short literals) scan all lines, which is still local and exact.
+
+`diff_search_results` compares local and remote results (order-insensitive) for equivalence checks.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import re._parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+from policy import WikiArticle, WikiSearchSnippet
+
+_LITERAL = _sre_parse.LITERAL
+_MIN_LITERAL = 3
+
+_SnippetKey = Tuple[str, int, str]  # (path, linum, content)
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _required_literals(pattern: re.Pattern) -> List[str]:
+    """Literal substrings (lowercased) that every match of `pattern` must contain."""
+    if pattern.flags & re.IGNORECASE and not pattern.pattern.isascii():
+        return []  # str.lower() and re case folding may disagree outside ASCII
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    except re.error:
+        return []
+
+    literals: List[str] = []
+    run: List[str] = []
+    for op, av in parsed:
+        if op == _LITERAL:
+            run.append(chr(av))
+            continue
+        if len(run) >= _MIN_LITERAL:
+            literals.append("".join(run).lower())
+        run = []
+    if len(run) >= _MIN_LITERAL:
+        literals.append("".join(run).lower())
+    return literals
+
+
+class WikiMirror:
+    """In-memory copy of one wiki digest with a line-level trigram index."""
+
+    def __init__(self, sha1: str, articles: Iterable[WikiArticle]):
+        self.sha1 = sha1
+        self.articles: Dict[str, WikiArticle] = {a.path: a for a in sorted(articles, key=lambda a: a.path)}
+
+        # Line table: (path, linum, content); line ids are positions in this list.
+        self._lines: List[_SnippetKey] = []
+        self._postings: Dict[str, List[int]] = {}
+        for article in self.articles.values():
+            for linum, line in enumerate(article.content.splitlines(), start=1):
+                line_id = len(self._lines)
+                self._lines.append((article.path, linum, line))
+                for gram in _trigrams(line.lower()):
+                    self._postings.setdefault(gram, []).append(line_id)
+
+    @classmethod
+    def from_client(cls, client) -> WikiMirror:
+        """Load every page of the current wiki digest through a `PrimitiveErc3APIClient`."""
+        listing = client.list_wiki()
+        return cls(listing.sha1, client.load_wiki_many(listing.paths, wiki_sha1=listing.sha1))
+
+    @classmethod
+    def from_directory(cls, root: str, sha1: str, pattern: str = "*.md") -> WikiMirror:
+        """Build a mirror from local markdown files (e.g. `erc3/wiki`)."""
+        base = Path(root)
+        return cls(
+            sha1,
+            [
+                WikiArticle(path=file.relative_to(base).as_posix(), content=file.read_text(encoding="utf-8"))
+                for file in sorted(base.rglob(pattern))
+            ],
+        )
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def paths(self) -> List[str]:
+        return list(self.articles)
+
+    def load(self, path: str) -> Optional[WikiArticle]:
+        return self.articles.get(path)
+
+    def _candidates(self, pattern: re.Pattern) -> Iterable[int]:
+        candidates: Optional[Set[int]] = None
+        for literal in _required_literals(pattern):
+            for gram in _trigrams(literal):
+                rows = set(self._postings.get(gram, ()))
+                candidates = rows if candidates is None else candidates & rows
+                if not candidates:
+                    return []
+        if candidates is None:
+            return range(len(self._lines))
+        return sorted(candidates)
+
+    def search(self, query_regex: str) -> List[WikiSearchSnippet]:
+        pattern = re.compile(query_regex)
+        lines = self._lines
+        return [
+            WikiSearchSnippet(path=lines[i][0], linum=lines[i][1], content=lines[i][2])
+            for i in self._candidates(pattern)
+            if pattern.search(lines[i][2])
+        ]
+
+
+def diff_search_results(
+        query_regex: str,
+        local: Iterable[WikiSearchSnippet],
+        remote: Iterable[WikiSearchSnippet],
+) -> List[str]:
+    """Human-readable differences between local and remote search results (empty list = equivalent)."""
+
+    def keyed(snippets: Iterable[WikiSearchSnippet]) -> Set[_SnippetKey]:
+        return {(s.path, s.linum, s.content) for s in snippets}
+
+    local_keys, remote_keys = keyed(local), keyed(remote)
+    diffs = [f"{query_regex!r} {key}: missing locally" for key in sorted(remote_keys - local_keys)]
+    diffs += [f"{query_regex!r} {key}: missing remotely" for key in sorted(local_keys - remote_keys)]
+    return diffs
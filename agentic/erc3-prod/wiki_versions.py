@@ -0,0 +1,263 @@
+"""Wiki versioning store and typed wiki diff for incremental Wiki Rule Acquisition.
+
+Per `prd-api-acquisition.md` (2.3), a `wiki_sha1` change must restart rule acquisition from a wiki
+diff rather than from scratch. `WikiVersionStore` records, per wiki digest:
+- one content hash per page
+- one hash per markdown section (heading-delimited; the text before the first heading is the
+  section with anchor `""`). Repeated headings on one page are disambiguated by occurrence.
+  Each section also records its parent chain (the enclosing headings of lower level), because a
+  rule anchored at a heading covers every subsection nested under it.
+
+`ingest` compares a new digest against the previously recorded one and returns a `WikiDelta` of
+added/changed/removed pages and sections. `invalidated_rules` maps that delta onto rule IR records
+(`source.page` + `source.anchor`, see `prd-wiki-acquisition.md` 3.2) so only the affected rules
+are re-extracted: a rule is invalidated when its own section, or any section nested under its
+anchor, changes or is removed (or a subsection is added under it).
+
+Storage is a single SQLite file next to the other session artefacts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from policy import WikiArticle
+
+ChangeKind = Literal["added", "changed", "removed"]
+
+_SectionKey = Tuple[str, int]  # (anchor, occurrence)
+_Section = Tuple[str, int, Tuple[str, ...], str]  # (anchor, occurrence, parents, text)
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _heading_level(line: str) -> int:
+    return len(line) - len(line.lstrip("#"))
+
+
+def split_sections(content: str) -> List[_Section]:
+    """Split markdown into `(anchor, occurrence, parents, text)` sections at heading lines.
+
+    `parents` lists the enclosing heading lines, outermost first (a heading encloses the following
+    headings of a deeper level until the next heading of the same or a shallower level).
+    """
+    sections: List[_Section] = []
+    seen: Dict[str, int] = {}
+    stack: List[Tuple[int, str]] = []  # open (level, heading) pairs
+    anchor, parents, lines = "", (), []
+    in_fence = False
+
+    def close() -> None:
+        if anchor or any(line.strip() for line in lines):
+            occurrence = seen.get(anchor, 0)
+            seen[anchor] = occurrence + 1
+            sections.append((anchor, occurrence, parents, "\n".join(lines)))
+
+    for line in content.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and line.startswith("#"):
+            close()
+            level = _heading_level(line)
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            anchor, parents, lines = line.strip(), tuple(heading for _, heading in stack), []
+            stack.append((level, anchor))
+            continue
+        lines.append(line)
+    close()
+    return sections
+
+
+class SectionChange(BaseModel):
+    """One added/changed/removed section of a page."""
+
+    path: str = Field(..., description="Wiki page path")
+    anchor: str = Field(..., description="Heading line of the section ('' = text before the first heading)")
+    occurrence: int = Field(0, description="0-based index among sections with the same anchor on the page")
+    parents: List[str] = Field(
+        default_factory=list,
+        description="Enclosing heading lines, outermost first (old and new chains when the section moved)",
+    )
+    change: ChangeKind = Field(..., description="Kind of change")
+
+
+class PageChange(BaseModel):
+    """One added/changed/removed page with its section-level changes."""
+
+    path: str = Field(..., description="Wiki page path")
+    change: ChangeKind = Field(..., description="Kind of change")
+    sections: List[SectionChange] = Field(default_factory=list, description="Section-level changes")
+
+
+class WikiDelta(BaseModel):
+    """Typed difference between two recorded wiki digests."""
+
+    from_sha1: Optional[str] = Field(None, description="Previous digest (None = no previous version)")
+    to_sha1: str = Field(..., description="New digest")
+    pages: List[PageChange] = Field(default_factory=list, description="Changed pages, ordered by path")
+
+    def is_empty(self) -> bool:
+        return not self.pages
+
+    def sections(self) -> List[SectionChange]:
+        return [section for page in self.pages for section in page.sections]
+
+    def paths(self, *changes: ChangeKind) -> List[str]:
+        return [page.path for page in self.pages if not changes or page.change in changes]
+
+
+def invalidated_rules(delta: WikiDelta, rules: Iterable[Mapping[str, Any]]) -> List[str]:
+    """IDs of rule IR records whose `source.page`/`source.anchor` section, or any section nested under
+    that anchor, changed or was removed (or gained a new subsection)."""
+    removed_pages = set(delta.paths("removed"))
+    touched = set()
+    for section in delta.sections():
+        if section.change in ("changed", "removed"):
+            touched.add((section.path, section.anchor))
+        touched.update((section.path, parent) for parent in section.parents)
+
+    invalid: List[str] = []
+    for rule in rules:
+        source = rule.get("source") or {}
+        page, anchor = source.get("page"), (source.get("anchor") or "").strip()
+        if page in removed_pages or (page, anchor) in touched:
+            invalid.append(rule["id"])
+    return invalid
+
+
+class WikiVersionStore:
+    """SQLite store of page and section hashes per wiki digest."""
+
+    def __init__(self, path: str = "./.jbeval/wiki-versions.sqlite"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS versions ("
+                "sha1 TEXT PRIMARY KEY, seq INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "sha1 TEXT NOT NULL, path TEXT NOT NULL, page_hash TEXT NOT NULL, "
+                "PRIMARY KEY (sha1, path))"
+            )
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(sections)")}
+            if columns and "parents" not in columns:
+                # Stores written before parent chains were recorded cannot be diffed by nesting:
+                # drop them so the next ingest records the wiki from scratch.
+                for table in ("sections", "pages", "versions"):
+                    self._connection.execute(f"DELETE FROM {table}")
+                self._connection.execute("DROP TABLE sections")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sections ("
+                "sha1 TEXT NOT NULL, path TEXT NOT NULL, anchor TEXT NOT NULL, occurrence INTEGER NOT NULL, "
+                "parents TEXT NOT NULL, section_hash TEXT NOT NULL, PRIMARY KEY (sha1, path, anchor, occurrence))"
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    # -----------------------------
+    # Versions
+    # -----------------------------
+
+    def latest(self) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute("SELECT sha1 FROM versions ORDER BY seq DESC LIMIT 1").fetchone()
+        return None if row is None else row[0]
+
+    def has(self, sha1: str) -> bool:
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM versions WHERE sha1 = ?", (sha1,)).fetchone()
+        return row is not None
+
+    def record(self, sha1: str, articles: Iterable[WikiArticle]) -> None:
+        """Store page and section hashes for `sha1` (re-recording a digest replaces it)."""
+        page_rows, section_rows = [], []
+        for article in articles:
+            page_rows.append((sha1, article.path, _hash(article.content)))
+            for anchor, occurrence, parents, text in split_sections(article.content):
+                # The chain is part of the hash: moving a subsection under another heading is a change.
+                chain = json.dumps(parents, ensure_ascii=False)
+                section_rows.append((sha1, article.path, anchor, occurrence, chain, _hash(chain + "\n" + text)))
+
+        with self._lock, self._connection:
+            for table in ("pages", "sections", "versions"):
+                self._connection.execute(f"DELETE FROM {table} WHERE sha1 = ?", (sha1,))
+            seq = self._connection.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM versions").fetchone()[0]
+            self._connection.execute("INSERT INTO versions (sha1, seq) VALUES (?, ?)", (sha1, seq))
+            self._connection.executemany("INSERT INTO pages VALUES (?, ?, ?)", page_rows)
+            self._connection.executemany("INSERT INTO sections VALUES (?, ?, ?, ?, ?, ?)", section_rows)
+
+    def page_hashes(self, sha1: str) -> Dict[str, str]:
+        with self._lock:
+            rows = self._connection.execute("SELECT path, page_hash FROM pages WHERE sha1 = ?", (sha1,)).fetchall()
+        return dict(rows)
+
+    def section_hashes(self, sha1: str, path: str) -> Dict[_SectionKey, str]:
+        return {key: digest for key, (_, digest) in self._sections(sha1, path).items()}
+
+    def _sections(self, sha1: str, path: str) -> Dict[_SectionKey, Tuple[List[str], str]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT anchor, occurrence, parents, section_hash FROM sections WHERE sha1 = ? AND path = ?",
+                (sha1, path),
+            ).fetchall()
+        return {(anchor, occurrence): (json.loads(parents), digest) for anchor, occurrence, parents, digest in rows}
+
+    # -----------------------------
+    # Diff
+    # -----------------------------
+
+    def diff(self, from_sha1: Optional[str], to_sha1: str) -> WikiDelta:
+        old_pages = self.page_hashes(from_sha1) if from_sha1 is not None else {}
+        new_pages = self.page_hashes(to_sha1)
+
+        pages: List[PageChange] = []
+        for path in sorted(set(old_pages) | set(new_pages)):
+            old_hash, new_hash = old_pages.get(path), new_pages.get(path)
+            if old_hash == new_hash:
+                continue
+            change: ChangeKind = "added" if old_hash is None else "removed" if new_hash is None else "changed"
+            old_sections = self._sections(from_sha1, path) if old_hash is not None else {}
+            new_sections = self._sections(to_sha1, path) if new_hash is not None else {}
+            sections = [
+                SectionChange(
+                    path=path,
+                    anchor=key[0],
+                    occurrence=key[1],
+                    parents=list(dict.fromkeys(
+                        old_sections.get(key, ([], ""))[0] + new_sections.get(key, ([], ""))[0]
+                    )),
+                    change="added" if key not in old_sections else "removed" if key not in new_sections else "changed",
+                )
+                for key in sorted(set(old_sections) | set(new_sections))
+                if old_sections.get(key, (None, None))[1] != new_sections.get(key, (None, None))[1]
+            ]
+            pages.append(PageChange(path=path, change=change, sections=sections))
+        return WikiDelta(from_sha1=from_sha1, to_sha1=to_sha1, pages=pages)
+
+    def ingest(self, client, previous_sha1: Optional[str] = None) -> WikiDelta:
+        """Record the client's current wiki digest and diff it against `previous_sha1` (default: latest).
+
+        An unchanged digest returns an empty delta without loading any page.
+        """
+        previous = previous_sha1 if previous_sha1 is not None else self.latest()
+        listing = client.list_wiki()
+        if listing.sha1 == previous:
+            return WikiDelta(from_sha1=previous, to_sha1=listing.sha1)
+        if not self.has(listing.sha1):
+            self.record(listing.sha1, client.load_wiki_many(listing.paths, wiki_sha1=listing.sha1))
+        return self.diff(previous, listing.sha1)
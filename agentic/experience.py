@@ -0,0 +1,380 @@
+"""
+Experience store: deterministic patches distilled from validator diagnostics.
+
+Structure:
+  - A patch applies when all of its applies_when items are present in the query context;
+    its violation kind is kept apart so propose() contexts need not name one.
+  - Index: context key "name=value" -> patch ids (patches without conditions live under "*"),
+    plus violation kind -> patch ids, so matching touches only patches sharing a key with the context.
+  - Near-identical patches (same violation kind + normalized guidance) are consolidated:
+    a patch whose conditions are a superset of an existing one is absorbed into it,
+    a more general one replaces the existing patch and inherits its hit count. Both lookups go
+    through indexes (exact condition sets, context keys), not a scan over similar patches.
+  - Patches are held in an insertion-ordered dict keyed by patch_id; `patches` is a list view
+    built on demand, so upserts and retirements are O(1) plus their index keys.
+  - stats are counters updated in O(1) per violation; diagnostics keeps only the most recent
+    MAX_DIAGNOSTICS (kind, path) entries, so a store shared across a session stays bounded.
+
+Persistence:
+  - Append-only JSONL log of "stats" (counter deltas + diagnostics entries) / "upsert" / "retire"
+    events; load() replays it.
+  - Events are written in update order, so replay rebuilds exactly the same store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+
+from abstract import Violation, ViolationKind
+
+# Violation.details keys copied into applies_when; other details may carry entity data.
+CONTEXT_KEYS = ("tool", "op", "outcome", "rule_id", "clause", "field", "stage", "role")
+
+# Deterministic guidance per violation kind (patch templates).
+PATCH_TEMPLATES: Dict[ViolationKind, str] = {
+    ViolationKind.schema_error: "Emit a plan that validates against the SolutionPlan schema.",
+    ViolationKind.ctx_mismatch: "Use the identity and date from who_am_i, not values assumed from the task text.",
+    ViolationKind.trace_integrity_fail: "Record every API call in execution_trace exactly as executed.",
+    ViolationKind.missing_call: "Make every call that facts or claims reference, and record it in the trace.",
+    ViolationKind.resp_hash_mismatch: "Do not edit recorded API responses; re-run the call instead.",
+    ViolationKind.response_contract_fail: "Follow the response template: outcome, message format and links.",
+    ViolationKind.public_redaction_fail: "Redact restricted fields for public and guest users.",
+    ViolationKind.derived_replay_fail: "Derive facts only with replayable queries over recorded data.",
+    ViolationKind.unknown_op: "Use only operations known to the replay engine.",
+    ViolationKind.policy_clause_missing: "Reference the policy clause that justifies each claim.",
+    ViolationKind.policy_violation: "Check permissions for the current role before answering or writing.",
+    ViolationKind.link_not_grounded: "Link only entities that appear in recorded API responses.",
+    ViolationKind.minimality_missing: "Justify escape-hatch outcomes by ruling out the alternatives.",
+    ViolationKind.minimality_fail: "Prefer a grounded answer over an escape-hatch outcome when data allows it.",
+    ViolationKind.write_safety_fail: "Write only what the task asks for and only when permitted.",
+}
+
+CHARS_PER_TOKEN = 4
+
+# Above this many conditions, more-general patches are found by scanning instead of enumerating subsets.
+MAX_SUBSET_CONDITIONS = 8
+
+# Most recent diagnostics entries kept in memory (older ones only survive as stats counters).
+MAX_DIAGNOSTICS = 1000
+
+_WORDS = re.compile(r"[a-z0-9_]+")
+
+
+def _scalar(value: Any) -> bool:
+    return isinstance(value, (str, int, float, bool)) or value is None
+
+
+def _context_keys(context: Dict[str, Any]) -> List[str]:
+    return [f"{name}={json.dumps(value, sort_keys=True)}" for name, value in sorted(context.items()) if _scalar(value)]
+
+
+def _fingerprint(kind: Optional[str], guidance: str) -> str:
+    """
+    Consolidation key: violation kind + guidance with case, punctuation and spacing normalized.
+    """
+    return f"{kind}|{' '.join(_WORDS.findall(guidance.lower()))}"
+
+
+def _conditions_key(fingerprint: str, applies_when: Dict[str, Any]) -> str:
+    return fingerprint + "|" + json.dumps(applies_when, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _patch_id(kind: Optional[str], applies_when: Dict[str, Any], guidance: str) -> str:
+    canonical = json.dumps(
+        {"kind": kind, "when": applies_when, "guidance": guidance}, sort_keys=True, ensure_ascii=False
+    )
+    return "xp_" + hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class ExperiencePatch(BaseModel):
+    """
+    A structured patch / heuristic distilled from previous diagnostics.
+
+    Key idea:
+      - Experience is NOT raw entity data.
+      - It stores conditions + fix hints (deterministic knowledge) to help propose().
+      - Stored/updated by orchestrator deterministically based on validator diagnostics.
+      - Consumed by propose() (LLM) as a hint.
+    """
+    patch_id: str
+    applies_when: Dict[str, Any] = Field(..., description="Applies when")  # e.g. {"is_public": True, "outcome": "..."}
+    guidance: str  # NL guidance for propose (still safe, not a rule change)
+    severity: int = 1
+    kind: Optional[str] = Field(None, description="ViolationKind value the patch was learned from")
+    hits: int = Field(1, description="Violations consolidated into this patch")
+
+    def matches(self, context: Dict[str, Any]) -> bool:
+        return all(name in context and context[name] == value for name, value in self.applies_when.items())
+
+
+class ExperienceStore(BaseModel):
+    """
+    Experience store used to reduce human involvement.
+      - Update logic is deterministic based on diagnostics.
+      - 'guidance' may be NL, but it is curated by deterministic rules/templates.
+      - Safe to share across concurrently solved tasks.
+    """
+    stats: Dict[str, int] = Field(default_factory=dict)
+    diagnostics: List[Dict[str, Any]] = Field(default_factory=list)
+    hint_offset: int = Field(0, description="Rotation of ranked patches (speculative proposal variants)")
+
+    _by_id: Dict[str, ExperiencePatch] = PrivateAttr(default_factory=dict)
+    _by_key: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    _by_kind: Dict[Optional[str], Set[str]] = PrivateAttr(default_factory=dict)
+    _by_fingerprint: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    _by_conditions: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    _lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    _log_path: Optional[Path] = PrivateAttr(None)
+
+    def __init__(self, patches: Iterable[ExperiencePatch] = (), **data: Any):
+        super().__init__(**data)
+        for patch in patches:
+            self._upsert(ExperiencePatch.model_validate(patch))
+
+    @computed_field
+    @property
+    def patches(self) -> List[ExperiencePatch]:
+        """
+        All patches in insertion order (a new list per call).
+        """
+        with self._lock:
+            return list(self._by_id.values())
+
+    # -----------------------------
+    # Persistence (append-only)
+    # -----------------------------
+
+    @classmethod
+    def load(cls, path: str) -> ExperienceStore:
+        """
+        Replay the event log at `path` (if any); later updates are appended to it.
+        """
+        store = cls()
+        log = Path(path)
+        if log.exists():
+            with log.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        store._apply(json.loads(line))
+        store._log_path = log
+        return store
+
+    def _append(self, events: List[Dict[str, Any]]) -> None:
+        if self._log_path is None or not events:
+            return
+        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._log_path.open("a", encoding="utf-8") as handle:
+            for event in events:
+                handle.write(json.dumps(event, sort_keys=True, ensure_ascii=False) + "\n")
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        op = event["op"]
+        if op == "stats":
+            for name, delta in event["delta"].items():
+                self.stats[name] = self.stats.get(name, 0) + delta
+            self.diagnostics.extend(event.get("diagnostics", ()))
+            del self.diagnostics[:-MAX_DIAGNOSTICS]
+        elif op == "upsert":
+            self._upsert(ExperiencePatch.model_validate(event["patch"]))
+        elif op == "retire":
+            self._retire(event["patch_id"])
+        else:
+            raise ValueError(f"Unknown experience log op: {op!r}")
+
+    # -----------------------------
+    # Index maintenance
+    # -----------------------------
+
+    def _upsert(self, patch: ExperiencePatch) -> None:
+        # Replacing an existing id keeps its insertion position (and its index keys).
+        if patch.patch_id not in self._by_id:
+            for key in _context_keys(patch.applies_when) or ["*"]:
+                self._by_key.setdefault(key, set()).add(patch.patch_id)
+            self._by_kind.setdefault(patch.kind, set()).add(patch.patch_id)
+            fingerprint = _fingerprint(patch.kind, patch.guidance)
+            self._by_fingerprint.setdefault(fingerprint, set()).add(patch.patch_id)
+            self._by_conditions.setdefault(_conditions_key(fingerprint, patch.applies_when), set()).add(patch.patch_id)
+        self._by_id[patch.patch_id] = patch
+
+    def _retire(self, patch_id: str) -> None:
+        patch = self._by_id.pop(patch_id, None)
+        if patch is None:
+            return
+        for key in _context_keys(patch.applies_when) or ["*"]:
+            self._by_key[key].discard(patch_id)
+        self._by_kind[patch.kind].discard(patch_id)
+        fingerprint = _fingerprint(patch.kind, patch.guidance)
+        self._by_fingerprint[fingerprint].discard(patch_id)
+        self._by_conditions[_conditions_key(fingerprint, patch.applies_when)].discard(patch_id)
+
+    def add_patch(self, patch: ExperiencePatch) -> ExperiencePatch:
+        """
+        Insert or consolidate a patch; returns the patch that now carries it.
+        """
+        with self._lock:
+            events = self._consolidate(patch)
+            for event in events:
+                self._apply(event)
+            self._append(events)
+            return self._by_id[events[-1]["patch"]["patch_id"]]
+
+    def _consolidate(self, patch: ExperiencePatch) -> List[Dict[str, Any]]:
+        existing = self._by_id.get(patch.patch_id)
+        if existing is not None:
+            return [self._merged(existing, patch, existing.applies_when)]
+
+        fingerprint = _fingerprint(patch.kind, patch.guidance)
+        general = self._general_ids(fingerprint, patch.applies_when)
+        specific = self._specific_ids(fingerprint, patch.applies_when)
+        if general or specific:
+            other_id = min(general | specific)
+            other = self._by_id[other_id]
+            if other_id in general:
+                # Existing patch is at least as general: absorb the new one.
+                return [self._merged(other, patch, other.applies_when)]
+            # New patch generalizes the existing one: replace it.
+            return [{"op": "retire", "patch_id": other_id}, self._merged(patch, other, patch.applies_when)]
+        return [{"op": "upsert", "patch": patch.model_dump(mode="json")}]
+
+    def _general_ids(self, fingerprint: str, applies_when: Dict[str, Any]) -> Set[str]:
+        """
+        Ids of similar patches whose conditions are a subset of `applies_when`.
+        """
+        conditions = applies_when.items()
+        if len(applies_when) > MAX_SUBSET_CONDITIONS:
+            return {
+                other_id for other_id in self._by_fingerprint.get(fingerprint, ())
+                if self._by_id[other_id].applies_when.items() <= conditions
+            }
+        ids: Set[str] = set()
+        items = sorted(conditions)
+        for size in range(len(items) + 1):
+            for subset in combinations(items, size):
+                ids |= self._by_conditions.get(_conditions_key(fingerprint, dict(subset)), set())
+        return ids
+
+    def _specific_ids(self, fingerprint: str, applies_when: Dict[str, Any]) -> Set[str]:
+        """
+        Ids of similar patches whose conditions are a superset of `applies_when`.
+        """
+        pools = [self._by_fingerprint.get(fingerprint, set())]
+        pools += [self._by_key.get(key, set()) for key in _context_keys(applies_when)]
+        smallest = min(pools, key=len)
+        conditions = applies_when.items()
+        return {
+            other_id for other_id in smallest
+            if all(other_id in pool for pool in pools) and conditions <= self._by_id[other_id].applies_when.items()
+        }
+
+    @staticmethod
+    def _merged(keep: ExperiencePatch, other: ExperiencePatch, applies_when: Dict[str, Any]) -> Dict[str, Any]:
+        merged = keep.model_copy(update={
+            "applies_when": applies_when,
+            "severity": max(keep.severity, other.severity),
+            "hits": keep.hits + other.hits,
+        })
+        return {"op": "upsert", "patch": merged.model_dump(mode="json")}
+
+    # -----------------------------
+    # Updates from diagnostics
+    # -----------------------------
+
+    @staticmethod
+    def patch_for(violation: Violation) -> ExperiencePatch:
+        """
+        Patch template for one violation: kind + allow-listed context, no entity data.
+        """
+        applies_when: Dict[str, Any] = {}
+        for name in CONTEXT_KEYS:
+            value = violation.details.get(name)
+            if value is not None and _scalar(value):
+                applies_when[name] = value
+        guidance = PATCH_TEMPLATES.get(violation.kind, violation.kind.value)
+        return ExperiencePatch(
+            patch_id=_patch_id(violation.kind.value, applies_when, guidance),
+            applies_when=applies_when,
+            guidance=guidance,
+            kind=violation.kind.value,
+        )
+
+    def update_from(self, results: List[Violation]) -> None:
+        """
+        Deterministically update stats and patches from violations.
+        - This should never store sensitive data; store codes + structured hints only.
+        - In a mature system, maintain a ruleset mapping diag codes -> patch templates.
+        """
+        if not results:
+            return
+        delta: Dict[str, int] = {}
+        for violation in results:
+            delta[violation.kind.value] = delta.get(violation.kind.value, 0) + 1
+        diagnostics = [{"kind": violation.kind.value, "path": violation.path} for violation in results]
+        with self._lock:
+            stats_event = {"op": "stats", "delta": delta, "diagnostics": diagnostics}
+            self._apply(stats_event)
+            self._append([stats_event])
+            for violation in results:
+                self.add_patch(self.patch_for(violation))
+
+    # -----------------------------
+    # Query
+    # -----------------------------
+
+    def relevant(
+            self,
+            context: Dict[str, Any],
+            k: int = 8,
+            token_budget: int = 600,
+            kinds: Optional[Iterable[ViolationKind]] = None,
+    ) -> List[ExperiencePatch]:
+        """
+        Top-k patches matching `context` (optionally learned from `kinds` only),
+        bounded by an estimated prompt token budget.
+
+        Ranking: severity, hits, specificity (number of conditions), then patch_id.
+        """
+        with self._lock:
+            candidates: Set[str] = set(self._by_key.get("*", ()))
+            for key in _context_keys(context):
+                candidates |= self._by_key.get(key, set())
+            if kinds is not None:
+                candidates &= set().union(*(self._by_kind.get(kind.value, set()) for kind in kinds))
+            ranked = sorted(
+                (self._by_id[patch_id] for patch_id in candidates if self._by_id[patch_id].matches(context)),
+                key=lambda p: (-p.severity, -p.hits, -len(p.applies_when), p.patch_id),
+            )
+        if ranked and self.hint_offset:
+            shift = self.hint_offset % len(ranked)
+            ranked = ranked[shift:] + ranked[:shift]
+
+        selected: List[ExperiencePatch] = []
+        used = 0
+        for patch in ranked:
+            if len(selected) >= k:
+                break
+            cost = estimate_tokens(patch.guidance)
+            if used + cost > token_budget:
+                continue
+            selected.append(patch)
+            used += cost
+        return selected
+
+    def by_kind(self, kinds: Iterable[ViolationKind]) -> List[ExperiencePatch]:
+        """
+        Patches learned from the given violation kinds, in insertion order.
+        """
+        with self._lock:
+            ids: Set[str] = set().union(*(self._by_kind.get(kind.value, set()) for kind in kinds))
+            return [patch for patch_id, patch in self._by_id.items() if patch_id in ids]
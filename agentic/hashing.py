@@ -0,0 +1,185 @@
+"""
+Canonical hashing of API responses (APICall.response_hash) and paged results.
+
+Canonical form:
+  - JSON with sorted keys, no insignificant whitespace, UTF-8. Sets and frozensets are encoded as
+    lists ordered by each element's canonical encoding (never by iteration order, which depends on
+    PYTHONHASHSEED); other non-JSON values via str().
+  - Streamed into the hasher: containers are walked and their elements encoded in batches with the
+    C encoder, so large responses are never materialized as one string (byte-identical to
+    json.dumps with the same options).
+
+Digests are "<algorithm>:<hex>". The fastest available backend is used for new hashes:
+blake3 (optional `blake3` package), xxh3_128 (optional `xxhash` package), else hashlib blake2b.
+verify() accepts any of them (and bare sha256 hex digests), provided the backend is installed.
+
+No memoization:
+  - Recorded responses (APICall.response) are dicts, and a dict can be edited in place after it was
+    hashed, so an identity memo would either never fire or report stale digests. response_hash()
+    and verify() therefore always hash the current content; the streaming encoder keeps that cost
+    linear in the response size, and MerkleTree avoids rehashing unchanged pages of paged results.
+
+Paged results:
+  - MerkleTree hashes each page as a leaf; replacing or verifying one page costs O(log n)
+    instead of rehashing the whole registry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import blake3 as _blake3
+except ImportError:  # optional dependency
+    _blake3 = None
+
+try:
+    import xxhash as _xxhash
+except ImportError:  # optional dependency
+    _xxhash = None
+
+_BACKENDS: Dict[str, Callable[[], Any]] = {
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+    "sha256": hashlib.sha256,
+}
+if _xxhash is not None:
+    _BACKENDS["xxh3_128"] = _xxhash.xxh3_128
+if _blake3 is not None:
+    _BACKENDS["blake3"] = _blake3.blake3
+
+DEFAULT_ALGORITHM = "blake3" if _blake3 is not None else "xxh3_128" if _xxhash is not None else "blake2b"
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=_ENCODER.encode)
+    return str(value)
+
+
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_encode_default)
+_BATCH = 512  # list elements encoded per hasher update
+
+
+def _hasher(algorithm: str) -> Any:
+    factory = _BACKENDS.get(algorithm)
+    if factory is None:
+        raise ValueError(f"Hash algorithm {algorithm!r} is not available")
+    return factory()
+
+
+def canonical_hash(value: Any, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """
+    Digest of the canonical JSON encoding of `value`, streamed into the hasher.
+    """
+    hasher = _hasher(algorithm)
+    _feed(value, lambda text: hasher.update(text.encode("utf-8")))
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+
+def _feed(value: Any, write: Callable[[str], None]) -> None:
+    encode = _ENCODER.encode
+    if isinstance(value, (list, tuple)) and len(value) > _BATCH:
+        write("[")
+        for start in range(0, len(value), _BATCH):
+            if start:
+                write(",")
+            write(",".join(map(encode, value[start:start + _BATCH])))
+        write("]")
+    elif isinstance(value, dict) and value and all(isinstance(key, str) for key in value):
+        write("{")
+        for index, key in enumerate(sorted(value)):
+            write(("," if index else "") + encode(key) + ":")
+            _feed(value[key], write)
+        write("}")
+    else:
+        write(encode(value))
+
+
+def _split(digest: str) -> Tuple[str, str]:
+    algorithm, sep, hexdigest = digest.partition(":")
+    return (algorithm, hexdigest) if sep else ("sha256", digest)
+
+
+def response_hash(response: Any, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """
+    APICall.response_hash for a recorded response.
+    """
+    return canonical_hash(response, algorithm)
+
+
+def verify(response: Any, digest: str) -> bool:
+    """
+    True when the current content of `response` hashes to `digest` under the algorithm named in
+    the digest. Raises ValueError when that algorithm's backend is not installed.
+    """
+    algorithm, hexdigest = _split(digest)
+    return canonical_hash(response, algorithm).partition(":")[2] == hexdigest
+
+
+# ============================================================
+# Merkle hashing of paged results
+# ============================================================
+
+class MerkleTree:
+    """
+    Binary Merkle tree over page hashes. An odd node at any level is promoted unchanged.
+    """
+
+    def __init__(self, leaves: Iterable[str], algorithm: str = DEFAULT_ALGORITHM):
+        self.algorithm = algorithm
+        self.levels: List[List[str]] = [list(leaves)]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            self.levels.append([self._parent(level, i) for i in range(0, len(level), 2)])
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Any], algorithm: str = DEFAULT_ALGORITHM) -> MerkleTree:
+        return cls((canonical_hash(page, algorithm) for page in pages), algorithm)
+
+    def _combine(self, left: str, right: str) -> str:
+        hasher = _hasher(self.algorithm)
+        hasher.update(f"{left}|{right}".encode("ascii"))
+        return f"{self.algorithm}:{hasher.hexdigest()}"
+
+    def _parent(self, level: List[str], index: int) -> str:
+        return self._combine(level[index], level[index + 1]) if index + 1 < len(level) else level[index]
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    @property
+    def root(self) -> Optional[str]:
+        return self.levels[-1][0] if self.levels[0] else None
+
+    def replace(self, index: int, page: Any) -> str:
+        """
+        Re-hash one page and its path to the root; returns the new root.
+        """
+        self.levels[0][index] = canonical_hash(page, self.algorithm)
+        for depth in range(1, len(self.levels)):
+            index //= 2
+            self.levels[depth][index] = self._parent(self.levels[depth - 1], index * 2)
+        return self.root
+
+    def proof(self, index: int) -> List[Tuple[str, str]]:
+        """
+        Sibling path for leaf `index`: ("L" | "R", sibling hash) per level where a sibling exists.
+        """
+        path: List[Tuple[str, str]] = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append(("L" if sibling < index else "R", level[sibling]))
+            index //= 2
+        return path
+
+    def verify_page(self, page: Any, proof: List[Tuple[str, str]], root: Optional[str] = None) -> bool:
+        """
+        Check one page against the root using only its proof path.
+        """
+        node = canonical_hash(page, self.algorithm)
+        for side, sibling in proof:
+            node = self._combine(sibling, node) if side == "L" else self._combine(node, sibling)
+        return node == (root if root is not None else self.root)
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import copy
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
 
+from hashing import canonical_hash
 from spec import *
 
+# A primitive binding receives the node args and the outputs of its dependencies (by node id).
+PrimitiveBinding = Callable[[dict[str, str], dict[str, Any]], Any]
+
 
 # ============================================================================
 # Class 1: Ready-made general-purpose tools
@@ -39,9 +48,161 @@ class KernelTool:
         ...
 
 
+class _Uncacheable(Exception):
+    """Set on a memo entry whose result cannot be copied; waiters compute their own result."""
+
+
+class PrimitiveMemo:
+    """Per-run memo of read-only primitive results, invalidated through declared write sets.
+
+    Keys are (primitive_id, canonical args, dependency output keys, snapshot version). An output key
+    is the canonical hash of a JSON-native output (see `output_key`); a node with a dependency whose
+    output is not JSON-native is not memoized, since its value has no canonical form.
+    Resources are 'family' or 'family:item': writing 'employees:E1' drops readers of 'employees:E1'
+    and of 'employees'; writing 'employees' drops every 'employees' reader. Concurrent lookups of
+    one key share a single computation; failures are not cached. Stored results are private deep
+    copies and every hit returns a fresh copy, so callers may mutate what they receive; results that
+    cannot be deep-copied are returned but not cached.
+    """
+
+    def __init__(self, snapshot_version: str = ""):
+        self.snapshot_version = snapshot_version
+        self._entries: dict[str, Future] = {}
+        self._readers: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def key(self, primitive_id: str, args: dict[str, str], input_keys: dict[str, str]) -> str:
+        return canonical_hash([primitive_id, args, input_keys, self.snapshot_version])
+
+    @staticmethod
+    def output_key(value: Any) -> str | None:
+        """Canonical hash of a JSON-native value (dict with str keys, list, str, number, bool, None), else None."""
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                if not all(isinstance(name, str) for name in item):
+                    return None
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+            elif not (item is None or isinstance(item, (str, int, float, bool))):
+                return None
+        return canonical_hash(value)
+
+    @staticmethod
+    def resources(templates: list[str], args: dict[str, str]) -> list[str]:
+        """Fill '{arg}' placeholders; an unresolvable template widens to its whole family."""
+        resolved = []
+        for template in templates:
+            try:
+                resolved.append(template.format(**args))
+            except (KeyError, IndexError, ValueError):
+                resolved.append(template.split(":", 1)[0])
+        return resolved
+
+    def get_or_compute(self, key: str, reads: list[str], compute: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return (result, hit); `compute` runs at most once per key while the entry is valid."""
+        with self._lock:
+            entry = self._entries.get(key)
+            owner = entry is None
+            if owner:
+                self.misses += 1
+                entry = Future()
+                self._entries[key] = entry
+                for resource in reads:
+                    family, _, item = resource.partition(":")
+                    self._readers.setdefault(resource, set()).add(key)
+                    if item:
+                        self._readers.setdefault(f"{family}:*", set()).add(key)
+            else:
+                self.hits += 1
+
+        if not owner:
+            try:
+                return copy.deepcopy(entry.result()), True
+            except _Uncacheable:
+                with self._lock:
+                    self.hits -= 1
+                    self.misses += 1
+                return compute(), False
+        try:
+            result = compute()
+        except BaseException as exc:
+            self._drop(key, entry)
+            entry.set_exception(exc)
+            raise
+        try:
+            stored = copy.deepcopy(result)
+        except Exception:
+            self._drop(key, entry)
+            entry.set_exception(_Uncacheable())
+            return result, False
+        entry.set_result(stored)
+        return result, False
+
+    def _drop(self, key: str, entry: Future) -> None:
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+    def invalidate(self, writes: list[str]) -> int:
+        """Drop memo entries reading any written resource; returns the number dropped."""
+        with self._lock:
+            keys: set[str] = set()
+            for resource in writes:
+                family, _, item = resource.partition(":")
+                keys |= self._readers.pop(resource, set())
+                keys |= self._readers.pop(family, set()) if item else self._readers.pop(f"{family}:*", set())
+            dropped = sum(1 for key in keys if self._entries.pop(key, None) is not None)
+            self.invalidated += dropped
+            return dropped
+
+
 class MetaInterpreter:
     """Trusted generic engines that interpret policies and specs rather than domain-specific business logic."""
 
+    def __init__(
+            self,
+            bindings: dict[str, PrimitiveBinding] | None = None,
+            max_workers: int = 8,
+            effects: dict[str, PrimitiveEffects] | None = None,
+            snapshot_version: str = "",
+    ):
+        self.bindings: dict[str, PrimitiveBinding] = dict(bindings or {})
+        self.max_workers = max_workers
+        self.effects: dict[str, PrimitiveEffects] = dict(effects or {})
+        self.outputs: dict[str, Any] = {}
+        self.memo = PrimitiveMemo(snapshot_version)
+
+    @classmethod
+    def from_registry(
+            cls,
+            registry: PrimitiveRegistry,
+            bindings: dict[str, PrimitiveBinding],
+            max_workers: int = 8,
+            snapshot_version: str = "",
+    ) -> MetaInterpreter:
+        """Bind registry primitives by `binding_name` and take their declared `effects` from the registry."""
+        return cls(
+            bindings={item.id: bindings[item.binding_name] for item in registry.items if item.binding_name in bindings},
+            max_workers=max_workers,
+            effects={item.id: item.effects for item in registry.items if item.effects is not None},
+            snapshot_version=snapshot_version,
+        )
+
+    def _memoizable(self, node: FlowNode) -> bool:
+        effects = self.effects.get(node.primitive_id)
+        return effects is not None and not effects.writes
+
+    def start_run(self, snapshot_version: str = "") -> None:
+        """Begin a new run: flows executed from now on share a fresh primitive memo."""
+        self.memo = PrimitiveMemo(snapshot_version)
+        self.outputs = {}
+
     def verify_design(
             self,
             compiled_artifacts: CompiledArtifacts,
@@ -53,8 +214,199 @@ class MetaInterpreter:
         ...
 
     def execute_flow(self, flow_plan: FlowPlan, spec: ExecutionSpec) -> RunTrace:
-        """Execute a runtime flow deterministically under a fixed execution policy."""
-        ...
+        """Execute a runtime flow deterministically under a fixed execution policy.
+
+        Ready nodes (all `depends_on` finished ok) run concurrently on a bounded pool. Dependents of a
+        failed node are blocked; with `stop_on_first_failure` no further node starts after a failure.
+        Events are emitted in canonical topological order (ties by plan position), independent of
+        completion order; outputs are kept in `self.outputs` under each event's `output_ref`.
+
+        Primitives with declared effects and no writes are memoized across flows of the run
+        (see PrimitiveMemo); write primitives invalidate the entries their write set touches.
+        Output keys are only computed for nodes that a memoizable node depends on.
+        """
+        order, invalid = self._flow_order(flow_plan.nodes)
+        position = {node.id: index for index, node in enumerate(order)}
+        waiting = {node.id: set(node.depends_on) for node in order}
+        dependents: dict[str, list[str]] = {node.id: [] for node in order}
+        for node in order:
+            # A dependency listed twice is still one edge; otherwise the dependent is queued twice.
+            for dependency in dict.fromkeys(node.depends_on):
+                dependents[dependency].append(node.id)
+
+        keyed = {dependency for node in order if self._memoizable(node) for dependency in node.depends_on}
+
+        invalid_events = [self._blocked_event(node, reason) for node, reason in invalid]
+        events: dict[str, TraceEvent] = {}
+        outputs: dict[str, Any] = {}
+        output_keys: dict[str, str | None] = {}
+        memo_stats = MemoStats()
+        invalidated_before = self.memo.invalidated
+        ready = [node for node in order if not node.depends_on]
+        stopped = False
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            running: dict[Future, FlowNode] = {}
+            while True:
+                while ready and not stopped and len(running) < max(1, self.max_workers):
+                    node = ready.pop(0)
+                    inputs = {dependency: outputs[dependency] for dependency in node.depends_on}
+                    input_keys = {dependency: output_keys.get(dependency) for dependency in node.depends_on}
+                    future = pool.submit(self._run_node, flow_plan.id, node, inputs, input_keys, node.id in keyed)
+                    running[future] = node
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: position[running[f].id]):
+                    node = running.pop(future)
+                    event, output, output_key, hit = future.result()
+                    events[node.id] = event
+                    if hit is not None:
+                        memo_stats.hits += hit
+                        memo_stats.misses += not hit
+                    if event.status == "ok":
+                        outputs[node.id] = output
+                        output_keys[node.id] = output_key
+                        for dependent in dependents[node.id]:
+                            waiting[dependent].discard(node.id)
+                            if not waiting[dependent] and dependent not in events:
+                                ready.append(order[position[dependent]])
+                        ready.sort(key=lambda n: position[n.id])
+                    else:
+                        self._block_dependents(node.id, order, position, dependents, events)
+                        stopped = stopped or spec.stop_on_first_failure
+
+        for node in order:
+            if node.id not in events:
+                events[node.id] = self._blocked_event(node, "not started: execution stopped on failure")
+
+        for node_id, output in outputs.items():
+            self.outputs[events[node_id].output_ref] = output
+
+        memo_stats.invalidated = self.memo.invalidated - invalidated_before
+        canonical = [events[node.id] for node in order] + invalid_events
+        return RunTrace(
+            id=f"run-{flow_plan.id}",
+            plan_id=flow_plan.id,
+            events=canonical if spec.record_all_events else [e for e in canonical if e.status != "ok"],
+            success=all(event.status == "ok" for event in canonical),
+            final_score=0.0,
+            memo=memo_stats,
+        )
+
+    @staticmethod
+    def _flow_order(nodes: list[FlowNode]) -> tuple[list[FlowNode], list[tuple[FlowNode, str]]]:
+        """Canonical topological order (ties by plan position) plus nodes that can never run."""
+        position: dict[str, int] = {}
+        invalid: list[tuple[int, FlowNode, str]] = []
+        candidates: list[FlowNode] = []
+        for index, node in enumerate(nodes):
+            if node.id in position:
+                invalid.append((index, node, f"duplicate node id {node.id!r}"))
+            else:
+                position[node.id] = index
+                candidates.append(node)
+
+        waiting = {node.id: set(node.depends_on) for node in candidates}
+        order: list[FlowNode] = []
+        while True:
+            ready = sorted((node_id for node_id, deps in waiting.items() if not deps), key=position.get)
+            if not ready:
+                break
+            node_id = ready[0]
+            order.append(nodes[position[node_id]])
+            del waiting[node_id]
+            for deps in waiting.values():
+                deps.discard(node_id)
+
+        for node in candidates:
+            if node.id in waiting:
+                unknown = [dep for dep in node.depends_on if dep not in position]
+                reason = f"unknown dependency {unknown[0]!r}" if unknown else "dependency cycle or blocked dependency"
+                invalid.append((position[node.id], node, reason))
+        invalid.sort(key=lambda item: item[0])
+        return order, [(node, reason) for _, node, reason in invalid]
+
+    def _run_node(
+            self,
+            plan_id: str,
+            node: FlowNode,
+            inputs: dict[str, Any],
+            input_keys: dict[str, str | None],
+            want_key: bool,
+    ) -> tuple[TraceEvent, Any, str | None, bool | None]:
+        """Run one primitive binding (through the memo when read-only and keyable) and time it.
+
+        Returns (event, output, output key (when `want_key`), memo hit or None when the memo was not consulted).
+        """
+        binding = self.bindings.get(node.primitive_id)
+        effects = self.effects.get(node.primitive_id)
+        violations: list[str] = []
+        output, output_key, hit = None, None, None
+        started = time.perf_counter()
+        if binding is None:
+            violations.append(f"unknown primitive {node.primitive_id!r}")
+        else:
+            args = dict(node.args)
+            try:
+                if self._memoizable(node) and None not in input_keys.values():
+                    output, hit = self.memo.get_or_compute(
+                        self.memo.key(node.primitive_id, args, input_keys),
+                        self.memo.resources(effects.reads, args),
+                        lambda: binding(args, inputs),
+                    )
+                elif effects is None or not effects.writes:
+                    output = binding(args, inputs)
+                else:
+                    try:
+                        output = binding(args, inputs)
+                    finally:
+                        self.memo.invalidate(self.memo.resources(effects.writes, args))
+                if want_key:
+                    output_key = self.memo.output_key(output)
+            except Exception as exc:  # recorded as a failed event
+                violations.append(f"{type(exc).__name__}: {exc}")
+        cost_ms = int(round((time.perf_counter() - started) * 1000))
+        event = TraceEvent(
+            id=node.id,
+            primitive_id=node.primitive_id,
+            status="fail" if violations else "ok",
+            input_refs=[f"{plan_id}/{dependency}" for dependency in dict.fromkeys(node.depends_on)],
+            output_ref="" if violations else f"{plan_id}/{node.id}",
+            violations=violations,
+            cost_ms=cost_ms,
+        )
+        return event, output, output_key, hit
+
+    @staticmethod
+    def _blocked_event(node: FlowNode, reason: str) -> TraceEvent:
+        return TraceEvent(
+            id=node.id,
+            primitive_id=node.primitive_id,
+            status="blocked",
+            input_refs=[],
+            output_ref="",
+            violations=[reason],
+            cost_ms=0,
+        )
+
+    def _block_dependents(
+            self,
+            failed_id: str,
+            order: list[FlowNode],
+            position: dict[str, int],
+            dependents: dict[str, list[str]],
+            events: dict[str, TraceEvent],
+    ) -> None:
+        """Mark every transitive dependent of a failed node as blocked."""
+        stack = list(dependents[failed_id])
+        while stack:
+            node_id = stack.pop()
+            if node_id in events:
+                continue
+            events[node_id] = self._blocked_event(order[position[node_id]], f"upstream {failed_id!r} failed")
+            stack.extend(dependents[node_id])
 
     def promote_design(
             self,
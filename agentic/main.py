@@ -11,57 +11,44 @@ This file focuses on MAIN LOOP shape and data flow.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 
 from AgenticSolver.agentic.abstract import Decision, SolutionPlan, Violation
 from abstract import InputTask, OutputResponse
+from experience import ExperiencePatch, ExperienceStore
+from validation import ValidatorPipeline, default_stages
 
 
 # ============================================================
 # Task & Snapshot & Experience (orchestrator-owned)
 # ============================================================
+#
+# ExperiencePatch / ExperienceStore live in experience.py (indexed, append-only store).
 
 
-class ExperiencePatch(BaseModel):
+def propose(
+        task: InputTask,
+        experience: ExperienceStore,
+        cancel: Optional[threading.Event] = None,
+        client: Any = None,
+) -> SolutionPlan:
     """
-    A structured patch / heuristic distilled from previous diagnostics.
-
-    Key idea:
-      - Experience is NOT raw entity data.
-      - It stores conditions + fix hints (deterministic knowledge) to help propose().
-      - Stored/updated by orchestrator deterministically based on validator diagnostics.
-      - Consumed by propose() (LLM) as a hint.
-    """
-    patch_id: str
-    applies_when: Dict[str, Any] = Field(..., description="Applies when")  # e.g. {"is_public": True, "outcome": "..."}
-    guidance: str  # NL guidance for propose (still safe, not a rule change)
-    severity: int = 1
-
-
-class ExperienceStore(BaseModel):
-    """
-    Experience store used to reduce human involvement.
-      - Update logic is deterministic based on diagnostics.
-      - 'guidance' may be NL, but it is curated by deterministic rules/templates.
-    """
-    patches: List[ExperiencePatch] = Field(default_factory=list)
-    stats: Dict[str, int] = Field(default_factory=dict)
-    diagnostics: List[Dict[str, Any]] = Field(default_factory=list)
-
-    def update_from(self, results: List[Violation]) -> None:
-        """
-        Deterministically update stats and patches from violations.
-        - This should never store sensitive data; store codes + structured hints only.
-        - In a mature system, maintain a ruleset mapping diag codes -> patch templates.
-        """
-        pass
+    LLM-driven propose function (Codex/Codex CLI).
 
+    Shared state:
+      - `client` is the session's prefetched API client/snapshot (e.g. MemoryErc3Client built on
+        the shared PooledTransport, see scheduler.py). API calls of the plan go through it;
+        None means propose() creates its own.
 
-def propose(task: InputTask, experience: ExperienceStore) -> SolutionPlan:
-    """
-    LLM-driven propose function (Codex/Codex CLI).
+    Cancellation:
+      - `cancel` is set when the proposal is no longer needed (e.g. another speculative variant
+        was accepted). Pass it to the LLM call (plugins/codex.py run(..., cancel=cancel)), which
+        kills the running process and raises CodexCancelled.
 
     Determinism responsibility:
       - Not deterministic. It may vary across runs.
@@ -74,6 +61,11 @@ def propose(task: InputTask, experience: ExperienceStore) -> SolutionPlan:
     pass
 
 
+# Process-wide validator; replace with default_stages(replay=FactReplayEngine(...), known_rules=...)
+# once the session snapshot and compiled policy are available.
+validator = ValidatorPipeline(default_stages())
+
+
 def execute_and_validate(task: InputTask, plan: SolutionPlan) -> Decision:
     """
     Deterministic inverse_solve validator.
@@ -87,34 +79,150 @@ def execute_and_validate(task: InputTask, plan: SolutionPlan) -> Decision:
       - This function MUST be deterministic (pure relative to its inputs). It MUST NOT call LLM.
       - validation is based on trace + replay.
     """
-    violations: List[violations] = []
+    # Stages: schema -> ExecutionTrace integrity -> DerivedFacts replay -> policy compliance
+    #         -> minimality for escape-hatch outcomes (see validation.py).
+    report = validator.run(task, plan)
+    response = OutputResponse(message=str(plan.response_template.get("message", "")))
+    return Decision(ok=report.ok, response=response, plan=plan, verification=report.violations)
+
+
+class ProposalCancelled(Exception):
+    """
+    Raised by gated_propose() when its cancel token is set before the LLM call starts.
+    """
+
+
+def gated_propose(
+        task: InputTask,
+        experience: ExperienceStore,
+        llm_gate: Optional[AbstractContextManager] = None,
+        cancel: Optional[threading.Event] = None,
+        client: Any = None,
+) -> SolutionPlan:
+    """
+    propose() under an optional LLM gate (e.g. a session-wide concurrency slot, see scheduler.py).
+    A cancelled proposal never enters the gate, and gives its slot back as soon as it gets one.
+    """
+    if cancel is not None and cancel.is_set():
+        raise ProposalCancelled("proposal cancelled before the LLM call")
+    with llm_gate if llm_gate is not None else nullcontext():
+        if cancel is not None and cancel.is_set():
+            raise ProposalCancelled("proposal cancelled while waiting for the LLM gate")
+        return propose(task, experience, cancel, client)
 
-    # Stage 1: ExecutionTrace integrity
 
-    # Stage 3: DerivedFacts replay (verification)
+# ============================================================
+# Speculative proposals
+# ============================================================
+
+class SpeculationPolicy(BaseModel):
+    """
+    First-round speculation: K proposals run concurrently and are validated as they arrive.
 
-    # Stage 4: Policy compliance for referenced clauses
+    Trade-off:
+      - Spends up to K x LLM calls in round 1 for lower tail latency.
+      - The accepted plan is the first one (by completion) whose decision is ok;
+        its Decision is deterministic given that plan (execute_and_validate is pure).
+    """
+    proposals: int = Field(3, description="Number of concurrent round-1 proposals (K)")
+    max_workers: int = Field(6, description="Upper bound on concurrent propose/validate calls")
 
-    # Stage 6: Minimality checks for escape-hatch outcomes
 
-    ok = len(violations) == 0
-    return Decision(ok=ok, violations=violations)
+def hinted_experience(experience: ExperienceStore, variant: int) -> ExperienceStore:
+    """
+    Deterministic hint variation for speculative proposal `variant`.
+      - variant 0 sees the store unchanged.
+      - variant i rotates the ranked relevant patches by i, so prompts bounded by a
+        patch/token budget surface different hints first (the index itself is shared).
+    """
+    if variant == 0:
+        return experience
+    return experience.model_copy(update={"hint_offset": variant})
+
+
+def speculative_round(
+        task: InputTask,
+        experience: ExperienceStore,
+        policy: SpeculationPolicy,
+        llm_gate: Optional[AbstractContextManager] = None,
+        client: Any = None,
+) -> Tuple[Optional[Decision], List[Decision]]:
+    """
+    Run K proposals concurrently, validating each as soon as it arrives.
+
+    Returns:
+        (accepted decision or None, failed decisions ordered by variant index)
+
+    Failures:
+      - A variant whose propose/validate call raises (LLM timeout, budget exhaustion, ...) is
+        recorded and the remaining variants continue.
+      - Only when every variant raised is the first error (by variant index) re-raised.
+
+    Once a decision is ok, the shared cancel token is set: queued variants never start, variants
+    waiting for `llm_gate` skip their LLM call, and running ones are cancelled through propose().
+    """
+    cancel = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=max(1, policy.max_workers))
+    proposing: Dict[Future, int] = {
+        pool.submit(gated_propose, task, hinted_experience(experience, variant), llm_gate, cancel, client): variant
+        for variant in range(max(1, policy.proposals))
+    }
+    validating: Dict[Future, int] = {}
+    failed: Dict[int, Decision] = {}
+    errors: Dict[int, BaseException] = {}
+    try:
+        pending: Set[Future] = set(proposing)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Completion order within one wakeup is arbitrary: handle it by variant index.
+            for future in sorted(done, key=lambda f: proposing.get(f, validating.get(f, 0))):
+                variant = proposing[future] if future in proposing else validating[future]
+                try:
+                    result = future.result()
+                except Exception as exc:  # this variant failed; the others keep running
+                    errors[variant] = exc
+                    continue
+                if future in proposing:
+                    validation = pool.submit(execute_and_validate, task, result)
+                    validating[validation] = variant
+                    pending.add(validation)
+                    continue
+                if result.ok:
+                    return result, [failed[i] for i in sorted(failed)]
+                failed[variant] = result
+        if errors and not failed:
+            raise errors[min(errors)]
+        return None, [failed[i] for i in sorted(failed)]
+    finally:
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 # ============================================================
 # Main loop orchestrator
 # ============================================================
 
-def main(task: InputTask, experience: ExperienceStore) -> OutputResponse:
+def solve(
+        task: InputTask,
+        experience: ExperienceStore,
+        speculation: Optional[SpeculationPolicy] = None,
+        llm_gate: Optional[AbstractContextManager] = None,
+        max_rounds: int = 4,
+        client: Any = None,
+) -> Optional[Decision]:
     """
     Orchestrator main loop.
 
     Args:
         task: input task
         experience: experience store
+        speculation: when set, round 1 runs K speculative proposals concurrently
+        llm_gate: entered around every propose() call (budgets / global LLM concurrency)
+        max_rounds: propose/validate rounds before giving up
+        client: shared prefetched API client/snapshot handed to every propose() call
 
     Returns:
-        response
+        the accepted decision, or the last failed one (None if no round ran)
 
     Key property:
       - Deterministic control flow owned by this function (trusted).
@@ -122,20 +230,43 @@ def main(task: InputTask, experience: ExperienceStore) -> OutputResponse:
       - execute_and_validate() is deterministic "trusted kernel".
     """
 
-    response = None
+    last = None
+    first_round = 1
+    if speculation is not None:
+        decision, failed = speculative_round(task, experience, speculation, llm_gate, client)
+        if decision is not None:
+            return decision
+        # Experience is updated in variant order, so the store evolves deterministically.
+        for failed_decision in failed:
+            experience.update_from(failed_decision.verification)
+            last = failed_decision
+        first_round = 2
+
     # Main Propose/Validate loop
-    for round_index in range(1, 5):
+    for round_index in range(first_round, max_rounds + 1):
         # 1) LLM propose -> plan
-        plan = propose(task, experience)
+        plan = gated_propose(task, experience, llm_gate, client=client)
 
         # 2) Deterministic validation
         decision = execute_and_validate(task, plan)
 
         if decision.ok:
-            return decision.response
+            return decision
 
         # 3) On failure: update experience + pass diagnostics back to next propose round
         experience.update_from(decision.verification)
-        response = decision.response
+        last = decision
 
-    return response
+    return last
+
+
+def main(
+        task: InputTask,
+        experience: ExperienceStore,
+        speculation: Optional[SpeculationPolicy] = None,
+) -> OutputResponse:
+    """
+    Solve one task and return its response (see solve()).
+    """
+    decision = solve(task, experience, speculation)
+    return decision.response if decision is not None else None
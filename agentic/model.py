@@ -264,6 +264,18 @@ class GrammarProfileRegistry(BaseModel):
     items: list[GrammarProfile] = Field(..., description="Active runtime grammar profiles.")
 
 
+class PrimitiveEffects(BaseModel):
+    """The declared read/write set of a primitive, used for runtime memoization and invalidation."""
+    reads: list[str] = Field(
+        default_factory=list,
+        description="Resources read, e.g. 'employees:{employee_id}'; placeholders are filled from node args.",
+    )
+    writes: list[str] = Field(
+        default_factory=list,
+        description="Resources written; a primitive with writes is never memoized and invalidates readers.",
+    )
+
+
 class PrimitiveIR(BaseModel):
     """A canonical primitive contract and binding descriptor."""
     id: str = Field(..., description="The stable primitive identifier.")
@@ -273,6 +285,9 @@ class PrimitiveIR(BaseModel):
     preconditions: list[str] = Field(..., description="Required preconditions.")
     postconditions: list[str] = Field(..., description="Guaranteed postconditions.")
     binding_name: str = Field(..., description="The deterministic binding name used by the executor.")
+    effects: PrimitiveEffects | None = Field(
+        None, description="Declared read/write set (read by MetaInterpreter.from_registry); None disables memoization."
+    )
 
 
 class PrimitiveCandidateIR(BaseModel):
@@ -382,6 +397,18 @@ class TraceEvent(BaseModel):
     cost_ms: int = Field(..., description="Execution cost in milliseconds.")
 
 
+class MemoStats(BaseModel):
+    """Primitive memoization counters for one executed flow."""
+    hits: int = Field(0, description="Read-only node results served from the run memo.")
+    misses: int = Field(0, description="Read-only node results computed and stored in the run memo.")
+    invalidated: int = Field(0, description="Memo entries dropped by write primitives.")
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
 class RunTrace(BaseModel):
     """Immutable runtime evidence for one executed flow plan."""
     id: str = Field(..., description="The stable run identifier.")
@@ -389,6 +416,7 @@ class RunTrace(BaseModel):
     events: list[TraceEvent] = Field(..., description="Recorded execution events.")
     success: bool = Field(..., description="Whether the run completed successfully.")
     final_score: float = Field(..., description="The final benchmark or task score for the run.")
+    memo: MemoStats = Field(default_factory=MemoStats, description="Primitive memoization statistics.")
 
 
 class DraftRunDistill(BaseModel):
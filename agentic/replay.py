@@ -0,0 +1,279 @@
+"""
+Deterministic FactQuery replay over a SQLite snapshot (Process C, DerivedFacts stage).
+
+Execution model:
+  - Facts run in topological order of `inputs` (ties keep plan order).
+  - A fact's SQL sees each input fact as a view named by its id, e.g.
+        FactQuery(id="leads", query="SELECT ...", inputs=[])
+        FactQuery(id="top", query="SELECT * FROM leads ORDER BY salary DESC LIMIT 1", inputs=["leads"])
+  - Queries run under an SQLite authorizer that denies writes, ATTACH and PRAGMA:
+    facts can only read the snapshot and their inputs.
+
+Caching (across propose rounds):
+  - Each fact result is keyed by (snapshot version, query, input ids + input result hashes),
+    so a fact is reused whenever its query and everything upstream produced the same data.
+  - Results are materialized once as temp tables (reused as inputs without re-running SQL);
+    the connection's statement cache keeps prepared statements of recurring query texts.
+  - Re-validating a slightly repaired plan only executes the facts downstream of the change
+    whose input data actually changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from abstract import FactQuery, Violation, ViolationKind
+
+# Authorizer actions allowed while a fact query runs (read-only SQL).
+_READ_ACTIONS = {
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+}
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class FactReplayError(ValueError):
+    """
+    A fact cannot be replayed (bad dependency, SQL error, non-read-only SQL).
+    """
+
+    def __init__(self, fact_id: str, message: str):
+        super().__init__(f"{fact_id}: {message}")
+        self.fact_id = fact_id
+
+
+class FactReplay(BaseModel):
+    """
+    Result of one replay: outputs per fact id plus cache accounting.
+    """
+    order: List[str] = Field(default_factory=list, description="Fact ids in execution order")
+    outputs: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="fact id -> {columns, rows}")
+    executed: List[str] = Field(default_factory=list, description="Facts whose SQL ran")
+    reused: List[str] = Field(default_factory=list, description="Facts served from the result cache")
+    errors: Dict[str, str] = Field(default_factory=dict, description="fact id -> error (dependents are skipped)")
+
+    def violations(self) -> List[Violation]:
+        return [
+            Violation(
+                kind=ViolationKind.derived_replay_fail,
+                message=error,
+                path=f"facts.{fact_id}",
+                details={"fact_id": fact_id},
+            )
+            for fact_id, error in self.errors.items()
+        ]
+
+
+def topological_order(facts: List[FactQuery]) -> List[FactQuery]:
+    """
+    Order facts so inputs come first; ties keep plan order. Raises FactReplayError on
+    unknown inputs, duplicate ids and cycles.
+    """
+    position: Dict[str, int] = {}
+    for index, fact in enumerate(facts):
+        if fact.id in position:
+            raise FactReplayError(fact.id, "duplicate fact id")
+        position[fact.id] = index
+
+    pending = {fact.id: set(fact.inputs) for fact in facts}
+    for fact in facts:
+        for name in fact.inputs:
+            if name not in position:
+                raise FactReplayError(fact.id, f"unknown input {name!r}")
+
+    ordered: List[FactQuery] = []
+    while pending:
+        ready = sorted((fact_id for fact_id, deps in pending.items() if not deps), key=position.get)
+        if not ready:
+            raise FactReplayError(min(pending, key=position.get), "dependency cycle")
+        fact_id = ready[0]
+        ordered.append(facts[position[fact_id]])
+        del pending[fact_id]
+        for deps in pending.values():
+            deps.discard(fact_id)
+    return ordered
+
+
+class FactReplayEngine:
+    """
+    Replays FactQuery lists against one snapshot with a shared result cache.
+
+    The snapshot is opened through a private read-only connection (usable from any worker thread);
+    materialized results live in that connection's temp schema. Pass the snapshot's path, e.g.
+    `SQLErc3Client.db_path`, never a live connection: the engine installs its authorizer and creates
+    temp tables on its connection, and a caller's connection may be writable or bound to one thread.
+    """
+
+    def __init__(
+            self,
+            database: Union[str, Path],
+            snapshot_version: Optional[str] = None,
+            max_cached_facts: int = 512,
+            max_rows: int = 100_000,
+    ):
+        if isinstance(database, sqlite3.Connection):
+            raise TypeError("FactReplayEngine needs the snapshot path (e.g. SQLErc3Client.db_path), not a connection")
+        uri = f"{Path(database).resolve().as_uri()}?mode=ro"
+        self.connection = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        self.max_cached_facts = max_cached_facts
+        self.max_rows = max_rows
+        self.snapshot_version = snapshot_version if snapshot_version is not None else self._snapshot_version()
+
+        # digest -> (temp table, output, result hash), in LRU order
+        self._results: OrderedDict[str, Tuple[str, Dict[str, Any], str]] = OrderedDict()
+        self._views: List[str] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _snapshot_version(self) -> str:
+        """
+        Digest of `snapshot_meta` (written by SQLErc3Client); empty when the table is absent.
+        """
+        try:
+            rows = self.connection.execute("SELECT key, value FROM snapshot_meta ORDER BY key").fetchall()
+        except sqlite3.OperationalError:
+            return ""
+        return _digest(rows)
+
+    # -----------------------------
+    # Replay
+    # -----------------------------
+
+    def replay(self, facts: List[FactQuery]) -> FactReplay:
+        """
+        Execute (or reuse) every fact; errors are recorded per fact and their dependents skipped.
+        """
+        result = FactReplay()
+        try:
+            ordered = topological_order(facts)
+        except FactReplayError as exc:
+            result.errors[exc.fact_id] = str(exc)
+            return result
+
+        with self._lock:
+            used: List[str] = []
+            hashes: Dict[str, str] = {}
+            tables: Dict[str, str] = {}
+            try:
+                for fact in ordered:
+                    result.order.append(fact.id)
+                    failed = [name for name in fact.inputs if name in result.errors or name not in hashes]
+                    if failed:
+                        result.errors[fact.id] = f"{fact.id}: input {failed[0]!r} failed"
+                        continue
+
+                    digest = _digest(
+                        self.snapshot_version, fact.query, sorted((name, hashes[name]) for name in fact.inputs)
+                    )
+                    try:
+                        table, output, result_hash = self._result(fact, digest, tables, result)
+                    except FactReplayError as exc:
+                        result.errors[fact.id] = str(exc)
+                        continue
+                    used.append(digest)
+                    tables[fact.id] = table
+                    hashes[fact.id] = result_hash
+                    result.outputs[fact.id] = output
+            finally:
+                self._drop_views()
+                self._evict(keep=set(used))
+        return result
+
+    def _result(
+            self, fact: FactQuery, digest: str, tables: Dict[str, str], replay: FactReplay
+    ) -> Tuple[str, Dict[str, Any], str]:
+        cached = self._results.get(digest)
+        if cached is not None:
+            self._results.move_to_end(digest)
+            self.hits += 1
+            replay.reused.append(fact.id)
+            return cached
+
+        self.misses += 1
+        self._bind_inputs(fact, tables)
+        columns, rows = self._execute(fact)
+        output = {"columns": columns, "rows": rows}
+        table = f"_fact_{digest[:24]}"
+        self._materialize(table, columns, rows)
+        entry = (table, output, _digest(columns, rows))
+        self._results[digest] = entry
+        replay.executed.append(fact.id)
+        return entry
+
+    def _execute(self, fact: FactQuery) -> Tuple[List[str], List[List[Any]]]:
+        self.connection.set_authorizer(
+            lambda action, *_: sqlite3.SQLITE_OK if action in _READ_ACTIONS else sqlite3.SQLITE_DENY
+        )
+        try:
+            cursor = self.connection.execute(fact.query)
+            rows = cursor.fetchmany(self.max_rows + 1)
+        except (sqlite3.Error, sqlite3.Warning) as exc:
+            raise FactReplayError(fact.id, str(exc)) from exc
+        finally:
+            self.connection.set_authorizer(None)
+        if cursor.description is None:
+            raise FactReplayError(fact.id, "query returns no result set")
+        if len(rows) > self.max_rows:
+            raise FactReplayError(fact.id, f"result exceeds max_rows={self.max_rows}")
+        return [column[0] for column in cursor.description], [list(row) for row in rows]
+
+    # -----------------------------
+    # Temp schema
+    # -----------------------------
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    def _materialize(self, table: str, columns: List[str], rows: List[List[Any]]) -> None:
+        # Result columns may repeat (SELECT a.id, b.id); temp table columns must be unique.
+        names: List[str] = []
+        for column in columns:
+            name, suffix = column, 1
+            while name in names:
+                suffix += 1
+                name = f"{column}_{suffix}"
+            names.append(name)
+        self.connection.execute(f"CREATE TEMP TABLE {table} ({', '.join(self._quote(n) for n in names)})")
+        if rows:
+            placeholders = ", ".join("?" for _ in names)
+            self.connection.executemany(f"INSERT INTO temp.{table} VALUES ({placeholders})", rows)
+
+    def _bind_inputs(self, fact: FactQuery, tables: Dict[str, str]) -> None:
+        """
+        Expose exactly the declared inputs as views, so the cache key covers every dependency.
+        """
+        self._drop_views()
+        for name in fact.inputs:
+            self.connection.execute(f"CREATE TEMP VIEW {self._quote(name)} AS SELECT * FROM temp.{tables[name]}")
+            self._views.append(name)
+
+    def _drop_views(self) -> None:
+        for fact_id in self._views:
+            self.connection.execute(f"DROP VIEW IF EXISTS temp.{self._quote(fact_id)}")
+        self._views = []
+
+    def _evict(self, keep: set) -> None:
+        while len(self._results) > self.max_cached_facts:
+            digest = next((d for d in self._results if d not in keep), None)
+            if digest is None:
+                return
+            table, _, _ = self._results.pop(digest)
+            self.connection.execute(f"DROP TABLE IF EXISTS temp.{table}")
@@ -0,0 +1,298 @@
+"""
+Budget-aware multi-task scheduler (benchmark session runner).
+
+Goal:
+  - Run all tasks of a session (erc3/rules/tasks.md) through solve() with maximal throughput.
+  - Share one prefetched snapshot and one pooled API transport across tasks.
+  - Enforce session-wide limits: worker count, concurrent LLM calls, LLM call budget, deadline.
+    The API request rate is limited by the shared transport (TransportPolicy.max_requests_per_second).
+
+Scheduling:
+  - First attempts run in task order; every task gets one attempt before any retry.
+  - Failed tasks are re-queued by failure class (SchedulerPolicy.retry_priority, lower first):
+    transient I/O errors are retried before validation failures, other errors last.
+  - Budget exhaustion is never retried; tasks left when the deadline passes are reported "skipped".
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from abstract import Decision, InputTask, OutputResponse
+from experience import ExperienceStore
+from main import SpeculationPolicy, solve
+
+FailureClass = Literal["transient", "validation", "error", "budget"]
+TaskOutcome = Literal["ok", "failed", "error", "skipped"]
+
+Solver = Callable[[InputTask, ExperienceStore, AbstractContextManager, Any], Optional[Decision]]
+
+TASKS_PATH = Path(__file__).resolve().parents[1] / "erc3" / "rules" / "tasks.md"
+
+
+# ============================================================
+# Configuration & tasks
+# ============================================================
+
+class SchedulerPolicy(BaseModel):
+    """
+    Session-wide limits for TaskScheduler.
+    """
+    max_workers: int = Field(8, ge=1, description="Tasks solved concurrently")
+    llm_concurrency: int = Field(4, ge=1, description="Concurrent propose() calls across all tasks")
+    max_attempts: int = Field(3, description="Attempts per task (first attempt + retries)")
+    max_rounds: int = Field(4, description="Propose/validate rounds per attempt")
+    retry_priority: Dict[str, int] = Field(
+        default_factory=lambda: {"transient": 0, "validation": 1, "error": 2},
+        description="Retry order by failure class (lower first); classes not listed are not retried",
+    )
+    llm_call_budget: Optional[int] = Field(None, description="Session-wide propose() budget (None = unlimited)")
+    deadline_seconds: Optional[float] = Field(None, description="No new attempts start after this (None = none)")
+    speculation: Optional[SpeculationPolicy] = Field(None, description="Speculative round-1 proposals per attempt")
+
+
+class BenchmarkTask(BaseModel):
+    """
+    One row of erc3/rules/tasks.md.
+    """
+    task_id: str
+    text: str
+    hint: str = ""
+
+
+def load_tasks(path: Path = TASKS_PATH) -> List[BenchmarkTask]:
+    """
+    Parse the markdown task table (| ID | Task | Hint | Runs |).
+    """
+    tasks: List[BenchmarkTask] = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        if len(cells) < 2 or not cells[0].startswith("t") or not cells[0][1:].isdigit():
+            continue
+        tasks.append(BenchmarkTask(task_id=cells[0], text=cells[1], hint=cells[2] if len(cells) > 2 else ""))
+    return tasks
+
+
+# ============================================================
+# Report
+# ============================================================
+
+class TaskReport(BaseModel):
+    """
+    Per-task latency/cost record.
+    """
+    task_id: str
+    outcome: TaskOutcome = "skipped"
+    failure_class: Optional[FailureClass] = None
+    attempts: int = 0
+    latency_s: float = Field(0.0, description="Wall time over all attempts")
+    llm_calls: int = 0
+    llm_s: float = Field(0.0, description="Time spent inside propose() calls")
+    llm_wait_s: float = Field(0.0, description="Time spent waiting for a global LLM slot")
+    response: Optional[OutputResponse] = None
+    error: Optional[str] = None
+
+
+class SessionReport(BaseModel):
+    """
+    Session summary: per-task reports in input order plus session totals.
+    """
+    tasks: List[TaskReport]
+    wall_s: float
+    llm_calls: int
+    api: Dict[str, Any] = Field(default_factory=dict, description="Shared transport metrics")
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for report in self.tasks:
+            counts[report.outcome] = counts.get(report.outcome, 0) + 1
+        return counts
+
+
+class BudgetExhausted(RuntimeError):
+    """
+    Raised inside an attempt when the session LLM budget is spent.
+    """
+
+
+# ============================================================
+# Scheduler
+# ============================================================
+
+class _LLMGate(AbstractContextManager):
+    """
+    Wraps one propose() call: budget check, global concurrency slot, per-task cost accounting.
+    Speculative variants of one attempt share the gate, so report counters change under the scheduler lock.
+    """
+
+    def __init__(self, scheduler: TaskScheduler, report: TaskReport):
+        self.scheduler = scheduler
+        self.report = report
+        self._started = 0.0
+
+    def __enter__(self) -> _LLMGate:
+        self.scheduler._reserve_llm_call()
+        waiting = time.monotonic()
+        self.scheduler._llm_slots.acquire()
+        started = time.monotonic()
+        with self.scheduler._lock:
+            self.report.llm_calls += 1
+            self.report.llm_wait_s += started - waiting
+        self._started = started
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        with self.scheduler._lock:
+            self.report.llm_s += time.monotonic() - self._started
+        self.scheduler._llm_slots.release()
+
+
+class TaskScheduler:
+    """
+    Runs many tasks on a bounded worker pool under session-wide limits.
+
+    Shared state:
+      - experience: one ExperienceStore, so what one task learns reaches later proposals.
+      - snapshot: prefetched client (e.g. MemoryErc3Client) passed to every solver call, so all
+        tasks read one snapshot and issue their API calls over one connection pool.
+      - transport: the PooledTransport behind every API client (default: the snapshot's own);
+        its metrics land in the report.
+
+    solver(task, experience, llm_gate, snapshot) must enter llm_gate around every LLM call;
+    the default runs solve() from main.py with `client=snapshot`.
+    """
+
+    def __init__(
+            self,
+            policy: Optional[SchedulerPolicy] = None,
+            experience: Optional[ExperienceStore] = None,
+            snapshot: Any = None,
+            transport: Any = None,
+            solver: Optional[Solver] = None,
+    ):
+        self.policy = policy or SchedulerPolicy()
+        self.experience = experience if experience is not None else ExperienceStore()
+        self.snapshot = snapshot
+        self.transport = transport if transport is not None else getattr(snapshot, "transport", None)
+        self.solver = solver or self._default_solver
+        self._llm_slots = threading.BoundedSemaphore(self.policy.llm_concurrency)
+        self._lock = threading.Lock()
+        self._llm_calls = 0
+
+    def _default_solver(
+            self, task: InputTask, experience: ExperienceStore, llm_gate: AbstractContextManager, snapshot: Any
+    ) -> Optional[Decision]:
+        return solve(task, experience, self.policy.speculation, llm_gate, self.policy.max_rounds, client=snapshot)
+
+    # -----------------------------
+    # Budgets
+    # -----------------------------
+
+    def _reserve_llm_call(self) -> None:
+        with self._lock:
+            budget = self.policy.llm_call_budget
+            if budget is not None and self._llm_calls >= budget:
+                raise BudgetExhausted(f"session LLM budget of {budget} calls spent")
+            self._llm_calls += 1
+
+    def _budget_left(self) -> bool:
+        budget = self.policy.llm_call_budget
+        with self._lock:
+            return budget is None or self._llm_calls < budget
+
+    def _past_deadline(self, started: float) -> bool:
+        deadline = self.policy.deadline_seconds
+        return deadline is not None and time.monotonic() - started >= deadline
+
+    # -----------------------------
+    # Attempts
+    # -----------------------------
+
+    @staticmethod
+    def classify(error: Optional[BaseException], decision: Optional[Decision]) -> Optional[FailureClass]:
+        """
+        Failure class of one attempt (None = solved).
+        """
+        if error is None:
+            return None if decision is not None and decision.ok else "validation"
+        if isinstance(error, BudgetExhausted):
+            return "budget"
+        if isinstance(error, (TimeoutError, ConnectionError, OSError)):
+            return "transient"
+        return "error"
+
+    def _attempt(self, task: BenchmarkTask, report: TaskReport) -> Optional[FailureClass]:
+        started = time.monotonic()
+        decision, error = None, None
+        try:
+            decision = self.solver(InputTask(text=task.text), self.experience, _LLMGate(self, report), self.snapshot)
+        except Exception as exc:  # classified below, never escapes the worker
+            error = exc
+        report.attempts += 1
+        report.latency_s += time.monotonic() - started
+
+        failure = self.classify(error, decision)
+        report.failure_class = failure
+        report.error = None if error is None else f"{type(error).__name__}: {error}"
+        if decision is not None:
+            report.response = decision.response
+        report.outcome = "ok" if failure is None else "failed" if failure == "validation" else "error"
+        return failure
+
+    def _retry_key(self, failure: Optional[FailureClass], report: TaskReport) -> Optional[int]:
+        """
+        Retry priority, or None when the task is done or must not be retried.
+        """
+        if failure is None or report.attempts >= self.policy.max_attempts or not self._budget_left():
+            return None
+        return self.policy.retry_priority.get(failure)
+
+    # -----------------------------
+    # Session
+    # -----------------------------
+
+    def run(self, tasks: Optional[List[BenchmarkTask]] = None) -> SessionReport:
+        """
+        Solve all tasks (default: erc3/rules/tasks.md) and return the session report.
+        """
+        tasks = load_tasks() if tasks is None else tasks
+        reports = [TaskReport(task_id=task.task_id) for task in tasks]
+        started = time.monotonic()
+
+        # Heap entries: (is_retry, priority, seq, task index); first attempts keep input order.
+        queue = [(0, 0, index, index) for index in range(len(tasks))]
+        seq = len(tasks)
+        running: Dict[Future, int] = {}
+
+        with ThreadPoolExecutor(max_workers=self.policy.max_workers) as pool:
+            while queue or running:
+                while queue and len(running) < self.policy.max_workers and not self._past_deadline(started):
+                    index = heapq.heappop(queue)[3]
+                    running[pool.submit(self._attempt, tasks[index], reports[index])] = index
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=running.get):
+                    index = running.pop(future)
+                    priority = self._retry_key(future.result(), reports[index])
+                    if priority is not None:
+                        heapq.heappush(queue, (1, priority, seq, index))
+                        seq += 1
+
+        with self._lock:
+            llm_calls = self._llm_calls
+        return SessionReport(
+            tasks=reports,
+            wall_s=time.monotonic() - started,
+            llm_calls=llm_calls,
+            api=self.transport.metrics() if self.transport is not None else {},
+        )
@@ -0,0 +1,39 @@
+"""Canonical hashing must not depend on set iteration order (PYTHONHASHSEED)."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from hashing import canonical_hash, response_hash, verify
+
+_SCRIPT = (
+    "from hashing import response_hash;"
+    "print(response_hash({'tags': frozenset({'alpha', 'beta', 'gamma', 'delta'}), 'ids': {3, 1, 2}}))"
+)
+
+
+def test_set_hash_is_independent_of_hash_seed():
+    digests = {
+        subprocess.run(
+            [sys.executable, "-c", _SCRIPT],
+            cwd=Path(__file__).parent,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(digests) == 1
+
+
+def test_sets_hash_like_sorted_lists():
+    assert canonical_hash({"ids": {3, 1, 2}}) == canonical_hash({"ids": [1, 2, 3]})
+
+
+def test_verify_sees_in_place_edits():
+    response = {"items": [{"id": "e1"}]}
+    digest = response_hash(response)
+    response["items"].append({"id": "e2"})
+    assert not verify(response, digest)
@@ -0,0 +1,54 @@
+"""MetaInterpreter.execute_flow scheduling tests (in-process bindings, no I/O)."""
+
+import threading
+
+from kernel import MetaInterpreter
+from spec import ExecutionSpec, FlowNode, FlowPlan
+
+SPEC = ExecutionSpec(stop_on_first_failure=False, record_all_events=True, enforce_policy_checks=False)
+
+
+def _plan(*nodes):
+    return FlowPlan(id="flow", profile_id="default", nodes=list(nodes), success_criteria=[], stop_conditions=[])
+
+
+def _node(node_id, primitive_id, depends_on=()):
+    return FlowNode(id=node_id, primitive_id=primitive_id, args={}, depends_on=list(depends_on))
+
+
+def _recording_bindings(calls):
+    lock = threading.Lock()
+
+    def binding(name):
+        def run(args, inputs):
+            with lock:
+                calls.append(name)
+            return name
+
+        return run
+
+    return {name: binding(name) for name in ("a", "b", "c")}
+
+
+def test_duplicate_dependency_runs_dependent_once():
+    calls = []
+    interpreter = MetaInterpreter(_recording_bindings(calls), max_workers=4)
+
+    trace = interpreter.execute_flow(_plan(_node("A", "a"), _node("B", "b", ["A", "A"])), SPEC)
+
+    assert calls == ["a", "b"]
+    assert [event.id for event in trace.events] == ["A", "B"]
+    assert trace.events[1].input_refs == ["flow/A"]
+    assert trace.success
+
+
+def test_duplicate_dependencies_in_diamond_run_each_node_once():
+    calls = []
+    interpreter = MetaInterpreter(_recording_bindings(calls), max_workers=4)
+
+    trace = interpreter.execute_flow(
+        _plan(_node("A", "a"), _node("B", "b", ["A", "A"]), _node("C", "c", ["B", "A", "B"])), SPEC
+    )
+
+    assert calls == ["a", "b", "c"]
+    assert [event.status for event in trace.events] == ["ok", "ok", "ok"]
@@ -0,0 +1,278 @@
+"""
+Staged validator pipeline for execute_and_validate() (Process C).
+
+Stages run in order; each stage fans its independent checks (per call, per fact, per commitment)
+out over a shared worker pool:
+  1. schema            plan-level structure (unique ids)                      fatal: SCHEMA_ERROR
+  2. trace_integrity   per APICall: executed, response hash matches            fatal: TRACE_INTEGRITY_FAIL
+  3. derived_facts     FactQuery replay (replay.py), fills FactQuery.output
+  4. policy            per commitment: claims grounded in facts + policy clauses
+  5. minimality        escape-hatch outcomes carry a minimality commitment
+
+Determinism:
+  - Violations are merged in stage order, then item order, then check order, independent of
+    which worker finishes first.
+  - A fatal violation stops the pipeline: later items of the same stage and all later stages are
+    skipped. Items before the fatal one are always awaited, so the reported list is stable.
+  - Per-stage timings are recorded in ValidationReport.timings.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from abstract import (
+    APICall,
+    Commitment,
+    CommitmentKind,
+    InputTask,
+    SolutionPlan,
+    Violation,
+    ViolationKind,
+)
+from hashing import verify
+from replay import FactReplayEngine
+
+FATAL_KINDS: FrozenSet[ViolationKind] = frozenset({ViolationKind.schema_error, ViolationKind.trace_integrity_fail})
+
+Check = Callable[[InputTask, SolutionPlan, Any], List[Violation]]
+
+
+# ============================================================
+# Pipeline
+# ============================================================
+
+class ValidationStage:
+    """
+    One pipeline stage: `check(task, plan, item)` is applied to every item of `items(plan)`.
+    Plan-level stages use the default single item (the plan itself).
+    """
+
+    def __init__(
+            self,
+            name: str,
+            check: Check,
+            items: Optional[Callable[[SolutionPlan], Sequence[Any]]] = None,
+    ):
+        self.name = name
+        self.check = check
+        self.items = items or (lambda plan: [plan])
+
+
+class StageTiming(BaseModel):
+    stage: str
+    seconds: float = 0.0
+    items: int = 0
+    skipped: bool = False
+
+
+class ValidationReport(BaseModel):
+    violations: List[Violation] = Field(default_factory=list)
+    timings: List[StageTiming] = Field(default_factory=list)
+    stopped_at: Optional[str] = Field(None, description="Stage whose fatal violation stopped the pipeline")
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+
+class ValidatorPipeline:
+    """
+    Runs stages in order with per-stage fan-out and fatal short-circuit.
+    """
+
+    def __init__(
+            self,
+            stages: Sequence[ValidationStage],
+            max_workers: int = 8,
+            fatal_kinds: FrozenSet[ViolationKind] = FATAL_KINDS,
+    ):
+        self.stages = list(stages)
+        self.fatal_kinds = fatal_kinds
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="validator")
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _fatal(self, violations: List[Violation]) -> bool:
+        return any(violation.kind in self.fatal_kinds for violation in violations)
+
+    def run(self, task: InputTask, plan: SolutionPlan) -> ValidationReport:
+        report = ValidationReport()
+        for stage in self.stages:
+            timing = StageTiming(stage=stage.name)
+            report.timings.append(timing)
+            if report.stopped_at is not None:
+                timing.skipped = True
+                continue
+
+            started = time.perf_counter()
+            items = list(stage.items(plan))
+            timing.items = len(items)
+            violations, fatal = self._run_stage(stage, task, plan, items)
+            timing.seconds = time.perf_counter() - started
+
+            report.violations.extend(violations)
+            if fatal:
+                report.stopped_at = stage.name
+        return report
+
+    def _run_stage(
+            self, stage: ValidationStage, task: InputTask, plan: SolutionPlan, items: List[Any]
+    ) -> Tuple[List[Violation], bool]:
+        if len(items) <= 1:
+            violations = [v for item in items for v in stage.check(task, plan, item)]
+            return violations, self._fatal(violations)
+
+        futures: List[Future] = [self._pool.submit(stage.check, task, plan, item) for item in items]
+        violations: List[Violation] = []
+        try:
+            for future in futures:
+                item_violations = future.result()
+                violations.extend(item_violations)
+                if self._fatal(item_violations):
+                    return violations, True
+            return violations, False
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+# ============================================================
+# Default stages
+# ============================================================
+
+def check_schema(task: InputTask, plan: SolutionPlan, _: Any) -> List[Violation]:
+    violations: List[Violation] = []
+    for label, ids in (
+            ("execution_trace.calls", [call.id for call in plan.execution_trace.calls]),
+            ("facts", [fact.id for fact in plan.facts]),
+            ("commitments", [commitment.id for commitment in plan.commitments]),
+    ):
+        seen: Set[str] = set()
+        for item_id in ids:
+            if item_id in seen:
+                violations.append(Violation(
+                    kind=ViolationKind.schema_error,
+                    message=f"duplicate id {item_id!r} in {label}",
+                    path=label,
+                    details={"id": item_id},
+                ))
+            seen.add(item_id)
+    return violations
+
+
+def check_call(task: InputTask, plan: SolutionPlan, call: APICall) -> List[Violation]:
+    path = f"execution_trace.calls.{call.id}"
+    details = {"tool": call.tool, "call_id": call.id}
+    if call.response is None:
+        if call.error is not None or plan.dry_run:
+            return []
+        return [Violation(kind=ViolationKind.missing_call, message="call was not executed", path=path, details=details)]
+    if call.response_hash is None:
+        return [Violation(
+            kind=ViolationKind.trace_integrity_fail, message="response recorded without hash", path=path, details=details
+        )]
+    try:
+        matches = verify(call.response, call.response_hash)
+    except ValueError as exc:
+        return [Violation(kind=ViolationKind.trace_integrity_fail, message=str(exc), path=path, details=details)]
+    if not matches:
+        return [Violation(
+            kind=ViolationKind.resp_hash_mismatch, message="response does not match its hash", path=path, details=details
+        )]
+    return []
+
+
+def replay_check(engine: FactReplayEngine) -> Check:
+    def check_facts(task: InputTask, plan: SolutionPlan, _: Any) -> List[Violation]:
+        replay = engine.replay(plan.facts)
+        for fact in plan.facts:
+            fact.output = replay.outputs.get(fact.id)
+        return replay.violations()
+
+    return check_facts
+
+
+def policy_check(known_rules: Optional[Set[str]]) -> Check:
+    def check_commitment(task: InputTask, plan: SolutionPlan, commitment: Commitment) -> List[Violation]:
+        fact_ids = {fact.id for fact in plan.facts}
+        path = f"commitments.{commitment.id}"
+        violations: List[Violation] = []
+        for index, claim in enumerate(commitment.claims):
+            claim_path = f"{path}.claims.{index}"
+            for ref in claim.fact_refs:
+                if ref not in fact_ids:
+                    violations.append(Violation(
+                        kind=ViolationKind.derived_replay_fail,
+                        message=f"claim references unknown fact {ref!r}",
+                        path=claim_path,
+                        details={"fact_id": ref},
+                    ))
+            rules = claim.policy_refs.rules_ids
+            if commitment.kind == CommitmentKind.policy_compliance and not rules:
+                violations.append(Violation(
+                    kind=ViolationKind.policy_clause_missing,
+                    message="policy compliance claim without policy clause",
+                    path=claim_path,
+                    details={"commitment": commitment.id},
+                ))
+            for rule_id in rules:
+                if known_rules is not None and rule_id not in known_rules:
+                    violations.append(Violation(
+                        kind=ViolationKind.policy_clause_missing,
+                        message=f"unknown policy clause {rule_id!r}",
+                        path=claim_path,
+                        details={"rule_id": rule_id},
+                    ))
+        return violations
+
+    return check_commitment
+
+
+def check_minimality(task: InputTask, plan: SolutionPlan, _: Any) -> List[Violation]:
+    outcome = plan.response_template.get("outcome")
+    if outcome is None or outcome == "ok_answer":
+        return []
+    commitments = [c for c in plan.commitments if c.kind == CommitmentKind.minimality]
+    if not commitments:
+        return [Violation(
+            kind=ViolationKind.minimality_missing,
+            message=f"outcome {outcome!r} without minimality commitment",
+            path="commitments",
+            details={"outcome": outcome},
+        )]
+    return [
+        Violation(
+            kind=ViolationKind.minimality_fail,
+            message="minimality commitment without claims",
+            path=f"commitments.{commitment.id}",
+            details={"outcome": outcome},
+        )
+        for commitment in commitments
+        if not commitment.claims
+    ]
+
+
+def default_stages(
+        replay: Optional[FactReplayEngine] = None,
+        known_rules: Optional[Set[str]] = None,
+) -> List[ValidationStage]:
+    """
+    Standard stage list; DerivedFacts replay is included when a replay engine is given.
+    """
+    stages = [
+        ValidationStage("schema", check_schema),
+        ValidationStage("trace_integrity", check_call, items=lambda plan: plan.execution_trace.calls),
+    ]
+    if replay is not None:
+        stages.append(ValidationStage("derived_facts", replay_check(replay)))
+    stages += [
+        ValidationStage("policy", policy_check(known_rules), items=lambda plan: plan.commitments),
+        ValidationStage("minimality", check_minimality),
+    ]
+    return stages
@@ -1,26 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
+import queue
 import shutil
+import signal
+import sqlite3
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, Callable, Generic, Optional, TypeVar
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
+_config_cache: dict[str, Any] = {}
+_config_lock = threading.Lock()
+
+
 def _load_config() -> dict[str, Any]:
+    """Parse `codex.yaml`, re-reading it only when its mtime changes."""
     config_path = _repo_root() / "codex.yaml"
+    mtime_ns = config_path.stat().st_mtime_ns
+    with _config_lock:
+        if _config_cache.get("mtime_ns") == mtime_ns:
+            return _config_cache["config"]
+
     with config_path.open("r", encoding="utf-8") as f:
         loaded = yaml.safe_load(f)
     if not isinstance(loaded, dict):
         raise ValueError("codex.yaml did not parse to a mapping")
+
+    with _config_lock:
+        _config_cache.update(mtime_ns=mtime_ns, config=loaded)
     return loaded
 
 
@@ -50,15 +72,54 @@ def _resolve_working_dir(config: dict[str, Any]) -> Path:
 
 T = TypeVar('T', bound=BaseModel)
 
+_schema_cache: dict[type, Path] = {}
+_schema_lock = threading.Lock()
 
-def run(prompt: str, return_type: type[T]) -> T:
-    config = _load_config()
 
-    schema_path = Path("result.schema.json")
-    schema_json = return_type.model_json_schema()
-    schema_path.write_text(json.dumps(schema_json, ensure_ascii=False, indent=2), encoding="utf-8")
+def _schema_dir() -> Path:
+    """Private (0o700) schema directory next to the response cache; refuses one that others can write."""
+    directory = _repo_root() / ".jbeval" / "codex-schemas"
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if os.name == "posix":
+        info = directory.lstat()
+        if directory.is_symlink() or info.st_uid != os.getuid() or info.st_mode & 0o022:
+            raise PermissionError(f"Schema directory is not private to this user: {directory}")
+    return directory
+
+
+def _has_content(path: Path, digest: str) -> bool:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest() == digest
+    except OSError:
+        return False
 
-    out_path = Path("result.json")
+
+def _schema_path(return_type: type[BaseModel]) -> Path:
+    """Content-addressed, read-only schema file for `return_type`, written once per process and shared.
+
+    An existing file is reused only when its content hashes to its name; otherwise it is replaced.
+    """
+    with _schema_lock:
+        path = _schema_cache.get(return_type)
+        if path is not None and path.exists():
+            return path
+
+        text = json.dumps(return_type.model_json_schema(), ensure_ascii=False, indent=2)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        directory = _schema_dir()
+        path = directory / f"{digest}.schema.json"
+        if not _has_content(path, digest):
+            # Write to a private temp file, then publish atomically: readers never see partial content.
+            fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.chmod(tmp_name, 0o444)
+            os.replace(tmp_name, path)
+        _schema_cache[return_type] = path
+        return path
+
+
+def _codex_command(prompt: str, schema_path: Path, out_path: Path) -> list[str]:
     cmd = ["codex", "exec", "--json",
            "--prompt", prompt,
            "--output-schema", str(schema_path),
@@ -72,29 +133,611 @@ def run(prompt: str, return_type: type[T]) -> T:
         cmd = ["cmd.exe", "/c", str(codex_executable_path), *cmd[1:]]
     else:
         cmd[0] = str(codex_executable_path)
+    return cmd
+
 
+def _timeout_seconds(config: dict[str, Any]) -> float:
     timeout_seconds = config.get("timeout_seconds")
     if not isinstance(timeout_seconds, (int, float)):
         timeout_seconds = 600
+    return timeout_seconds
 
-    working_dir = _resolve_working_dir(config)
-    try:
-        proc = subprocess.run(
-            cmd,
-            text=True,
-            capture_output=True,
-            check=True,
-            timeout=timeout_seconds,
-            env=os.environ.copy(),
-            cwd=str(working_dir),
+
+# ============================================================
+# Response cache
+# ============================================================
+
+_RESPONSE_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS response_cache (
+    digest TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access INTEGER NOT NULL
+)
+"""
+
+_FINGERPRINT_SKIP_DIRS = {".git", ".jbeval", "__pycache__", "node_modules", ".venv", "venv"}
+
+# working dir -> (computed at (monotonic), working dir mtime_ns, fingerprint)
+_fingerprint_cache: dict[Path, tuple[float, int, str]] = {}
+_fingerprint_lock = threading.Lock()
+
+
+def _working_dir_fingerprint(working_dir: Path, ttl_seconds: float = 0.0, refresh: bool = False) -> str:
+    """Fingerprint of the files Codex can read, reused for `ttl_seconds` within this process.
+
+    A reused fingerprint is dropped early when the working dir's own mtime changes (entries added,
+    removed or renamed at the top level); edits deeper in the tree are picked up once the TTL expires.
+    """
+    mtime_ns = working_dir.stat().st_mtime_ns
+    now = time.monotonic()
+    with _fingerprint_lock:
+        cached = _fingerprint_cache.get(working_dir)
+    if not refresh and cached is not None and now - cached[0] < ttl_seconds and cached[1] == mtime_ns:
+        return cached[2]
+
+    fingerprint = _scan_working_dir(working_dir)
+    with _fingerprint_lock:
+        _fingerprint_cache[working_dir] = (now, mtime_ns, fingerprint)
+    return fingerprint
+
+
+def _scan_working_dir(working_dir: Path) -> str:
+    """Cheap fingerprint of the files Codex can read: relative path, size and mtime of each file."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(working_dir):
+        dirs[:] = sorted(d for d in dirs if d not in _FINGERPRINT_SKIP_DIRS)
+        for name in sorted(files):
+            path = Path(root) / name
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest.update(f"{path.relative_to(working_dir).as_posix()}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _response_key(
+        prompt: str, schema_path: Path, config: dict[str, Any], working_dir: Path, refresh: bool = False
+) -> str:
+    settings = config.get("response_cache", {}) or {}
+    payload = {
+        "prompt": prompt,
+        "schema": schema_path.read_text(encoding="utf-8"),
+        "codex_cli": config.get("codex_cli", {}),
+        "working_dir": _working_dir_fingerprint(
+            working_dir, ttl_seconds=settings.get("fingerprint_ttl_seconds", 30.0), refresh=refresh
+        ),
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class ResponseCache:
+    """Persistent LRU cache of raw Codex JSON responses, bounded by entries, bytes and age.
+
+    Keys hash the prompt, the output schema, the `codex_cli` config and a working-dir fingerprint,
+    so any change to what Codex sees is a miss. The fingerprint is rescanned at most every
+    `response_cache.fingerprint_ttl_seconds` (default 30) per process, and on every bypassed call.
+    Cached responses are re-validated against the requested `return_type` on read; invalid ones are
+    dropped and count as misses.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            max_entries: int = 4096,
+            max_bytes: int = 64 * 1024 * 1024,
+            max_age_seconds: float = 7 * 24 * 3600,
+    ):
+        if max_entries <= 0 or max_bytes <= 0 or max_age_seconds <= 0:
+            raise ValueError("max_entries, max_bytes and max_age_seconds must be positive")
+        self.path = Path(path) if path is not None else _repo_root() / ".jbeval" / "codex-response-cache.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(_RESPONSE_CACHE_SCHEMA)
+        self._connection.commit()
+
+    def get(self, digest: str, return_type: type[T]) -> Optional[T]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM response_cache WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is not None and time.time() - row[1] > self.max_age_seconds:
+                self._connection.execute("DELETE FROM response_cache WHERE digest = ?", (digest,))
+                self._connection.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                result = return_type.model_validate_json(row[0])
+            except ValueError:
+                self._connection.execute("DELETE FROM response_cache WHERE digest = ?", (digest,))
+                self._connection.commit()
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE response_cache SET last_access = ? WHERE digest = ?", (self._next_access(), digest)
+            )
+            self._connection.commit()
+            self.hits += 1
+            return result
+
+    def put(self, digest: str, response: str) -> None:
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?, ?)",
+                (digest, response, size, time.time(), self._next_access()),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def clear(self) -> int:
+        with self._lock:
+            cursor = self._connection.execute("DELETE FROM response_cache")
+            self._connection.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _next_access(self) -> int:
+        row = self._connection.execute("SELECT COALESCE(MAX(last_access), 0) FROM response_cache").fetchone()
+        return int(row[0]) + 1
+
+    def _evict(self) -> None:
+        self._connection.execute(
+            "DELETE FROM response_cache WHERE created_at < ?", (time.time() - self.max_age_seconds,)
         )
-    except subprocess.TimeoutExpired as exc:
-        stderr_text = f"codex exec timed out after {timeout_seconds}s\n{exc}".strip()
-        raise ValueError(stderr_text)
+        while True:
+            count, total = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM response_cache"
+            ).fetchone()
+            if count <= self.max_entries and total <= self.max_bytes:
+                return
+            self._connection.execute(
+                "DELETE FROM response_cache WHERE digest = "
+                "(SELECT digest FROM response_cache ORDER BY last_access ASC LIMIT 1)"
+            )
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def response_cache(config: Optional[dict[str, Any]] = None) -> Optional[ResponseCache]:
+    """Process-wide response cache configured by `codex.yaml` `response_cache` (None when disabled)."""
+    global _response_cache
+    settings = (config if config is not None else _load_config()).get("response_cache", {}) or {}
+    if not settings.get("enabled", True):
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                path=settings.get("path"),
+                max_entries=settings.get("max_entries", 4096),
+                max_bytes=settings.get("max_bytes", 64 * 1024 * 1024),
+                max_age_seconds=settings.get("max_age_seconds", 7 * 24 * 3600),
+            )
+        return _response_cache
+
+
+class CodexCancelled(Exception):
+    """Raised when a queued or running Codex request is cancelled."""
+
+
+_CANCEL_POLL_SECONDS = 0.2
+
+
+def _kill(proc: subprocess.Popen, drain: bool = True) -> None:
+    """Kill `codex exec` together with its children so their pipes close."""
+    if os.name == "posix":
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        proc.kill()
+    if drain:
+        proc.communicate()
+    else:
+        proc.wait()  # pipes are drained by the stream readers
+
+
+class CodexBudgetExceeded(Exception):
+    """Raised when a streaming Codex run exceeds its wall-clock or token budget."""
+
+
+class CodexProgress(BaseModel):
+    """Progress snapshot surfaced for every event of a streaming run."""
+
+    event_type: str = Field(..., description="Type of the JSONL event just consumed")
+    elapsed_seconds: float = Field(..., description="Wall-clock seconds since process start")
+    input_tokens: int = Field(0, description="Input tokens reported so far")
+    output_tokens: int = Field(0, description="Output tokens reported so far")
+    agent_message: Optional[str] = Field(
+        None, description="Agent message carried by this event (intermediate drafts included; not the answer)"
+    )
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+class StreamOptions(BaseModel):
+    """Streaming mode: consume `--json` events incrementally and enforce budgets."""
+
+    max_seconds: Optional[float] = Field(None, description="Wall-clock budget; the process is killed when exceeded")
+    max_tokens: Optional[int] = Field(None, description="Input+output token budget; killed when exceeded")
+    on_progress: Optional[Callable[[CodexProgress], None]] = Field(None, description="Called for every event")
+
+
+def _event_type(event: dict[str, Any]) -> str:
+    msg = event.get("msg")
+    if isinstance(msg, dict):
+        return str(msg.get("type", ""))
+    return str(event.get("type", ""))
+
+
+def _event_usage(event: dict[str, Any]) -> Optional[tuple[int, int, bool]]:
+    """`(input_tokens, output_tokens, cumulative)` reported by an event, if any."""
+    usage = event.get("usage")
+    if isinstance(usage, dict):  # `turn.completed`: usage of one turn
+        return int(usage.get("input_tokens", 0)), int(usage.get("output_tokens", 0)), False
+    msg = event.get("msg")
+    if isinstance(msg, dict) and msg.get("type") == "token_count":
+        info = msg.get("info")
+        totals = info.get("total_token_usage") if isinstance(info, dict) else msg
+        if isinstance(totals, dict):
+            return int(totals.get("input_tokens", 0)), int(totals.get("output_tokens", 0)), True
+    return None
+
+
+def _event_message(event: dict[str, Any]) -> Optional[str]:
+    """Text of an agent message event, if the event carries one (may be an intermediate draft)."""
+    item = event.get("item")
+    if event.get("type") == "item.completed" and isinstance(item, dict):
+        if item.get("type") in ("agent_message", "assistant_message") and isinstance(item.get("text"), str):
+            return item["text"]
+    msg = event.get("msg")
+    if isinstance(msg, dict) and msg.get("type") == "agent_message" and isinstance(msg.get("message"), str):
+        return msg["message"]
+    return None
+
+
+def _final_message(event: dict[str, Any], last_message: Optional[str]) -> Optional[str]:
+    """Terminal answer carried by a completion event: `task_complete.last_agent_message`, or the last
+    agent message seen before `turn.completed`. None for every other event."""
+    msg = event.get("msg")
+    if isinstance(msg, dict) and msg.get("type") == "task_complete":
+        final = msg.get("last_agent_message")
+        return final if isinstance(final, str) else last_message
+    if event.get("type") == "turn.completed":
+        return last_message
+    return None
+
+
+def _spawn(cmd: list[str], working_dir: Path) -> subprocess.Popen:
+    return subprocess.Popen(
+        cmd,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=os.environ.copy(),
+        cwd=str(working_dir),
+        start_new_session=os.name == "posix",
+    )
+
+
+def _wait_blocking(
+        proc: subprocess.Popen,
+        cmd: list[str],
+        out_path: Path,
+        timeout_seconds: float,
+        cancel: Optional[threading.Event],
+) -> str:
+    waited = 0.0
+    while True:
+        if cancel is not None and cancel.is_set():
+            _kill(proc)
+            raise CodexCancelled("codex exec cancelled")
+        step = min(_CANCEL_POLL_SECONDS, timeout_seconds - waited)
+        try:
+            stdout_text, stderr_text = proc.communicate(timeout=max(step, 0.0))
+            break
+        except subprocess.TimeoutExpired as exc:
+            waited += step
+            if waited >= timeout_seconds:
+                _kill(proc)
+                raise ValueError(f"codex exec timed out after {timeout_seconds}s\n{exc}".strip())
 
     if proc.returncode != 0:
-        stdout_text = proc.stdout or ""
-        stderr_text = proc.stderr or ""
-        raise ValueError(stderr_text[-4000:], stdout_text[-4000:])
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout_text, stderr_text)
+    return out_path.read_text(encoding="utf-8")
+
+
+def _wait_streaming(
+        proc: subprocess.Popen,
+        cmd: list[str],
+        out_path: Path,
+        return_type: type[BaseModel],
+        timeout_seconds: float,
+        cancel: Optional[threading.Event],
+        options: StreamOptions,
+) -> str:
+    """Consume JSONL events; return the structured output as soon as the terminal message arrives.
+
+    Earlier agent messages are drafts: they are surfaced through `on_progress` only, because a later
+    message may correct them. Only the completion event's message is validated against `return_type`.
+    """
+    events: queue.Queue[Optional[str]] = queue.Queue()
+    stdout_lines: list[str] = []
+    stderr_chunks: list[str] = []
+
+    def pump_stdout() -> None:
+        for line in proc.stdout:
+            events.put(line)
+        events.put(None)
+
+    def pump_stderr() -> None:
+        stderr_chunks.append(proc.stderr.read())
+
+    readers = [threading.Thread(target=pump_stdout, daemon=True), threading.Thread(target=pump_stderr, daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    started = time.monotonic()
+    deadline = min(timeout_seconds, options.max_seconds if options.max_seconds is not None else timeout_seconds)
+    input_tokens = output_tokens = 0
+    turn_input = turn_output = 0
+    last_message: Optional[str] = None
+
+    while True:
+        if cancel is not None and cancel.is_set():
+            _kill(proc, drain=False)
+            raise CodexCancelled("codex exec cancelled")
+        elapsed = time.monotonic() - started
+        if elapsed >= deadline:
+            _kill(proc, drain=False)
+            if options.max_seconds is not None and deadline == options.max_seconds:
+                raise CodexBudgetExceeded(f"codex exec exceeded its {options.max_seconds}s wall-clock budget")
+            raise ValueError(f"codex exec timed out after {timeout_seconds}s")
+        try:
+            line = events.get(timeout=min(_CANCEL_POLL_SECONDS, deadline - elapsed))
+        except queue.Empty:
+            continue
+        if line is None:
+            break
+        stdout_lines.append(line)
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(event, dict):
+            continue
+
+        usage = _event_usage(event)
+        if usage is not None:
+            if usage[2]:
+                input_tokens, output_tokens = usage[0], usage[1]
+            else:
+                turn_input, turn_output = turn_input + usage[0], turn_output + usage[1]
+        total_in, total_out = max(input_tokens, turn_input), max(output_tokens, turn_output)
+        message = _event_message(event)
+        if message is not None:
+            last_message = message
+        if options.on_progress is not None:
+            options.on_progress(CodexProgress(
+                event_type=_event_type(event),
+                elapsed_seconds=time.monotonic() - started,
+                input_tokens=total_in,
+                output_tokens=total_out,
+                agent_message=message,
+            ))
+        if options.max_tokens is not None and total_in + total_out > options.max_tokens:
+            _kill(proc, drain=False)
+            raise CodexBudgetExceeded(f"codex exec exceeded its {options.max_tokens} token budget")
+
+        final = _final_message(event, last_message)
+        if final is not None:
+            try:
+                return_type.model_validate_json(final)
+            except ValueError:
+                continue  # let the process finish and fall back to the `-o` output file
+            # Structured output is complete: skip waiting for process teardown.
+            _kill(proc, drain=False)
+            return final
+
+    proc.wait()
+    for reader in readers:
+        reader.join()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, "".join(stdout_lines), "".join(stderr_chunks))
+    return out_path.read_text(encoding="utf-8")
+
+
+def _invoke(
+        prompt: str,
+        return_type: type[T],
+        timeout_seconds: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+        bypass_cache: bool = False,
+        stream: Optional[StreamOptions] = None,
+) -> T:
+    config = _load_config()
+    if timeout_seconds is None:
+        timeout_seconds = _timeout_seconds(config)
+    working_dir = _resolve_working_dir(config)
+
+    schema_path = _schema_path(return_type)
+
+    cache = response_cache(config)
+    cache_key: Optional[str] = None
+    if cache is not None:
+        cache_key = _response_key(prompt, schema_path, config, working_dir, refresh=bypass_cache)
+        if not bypass_cache:
+            cached = cache.get(cache_key, return_type)
+            if cached is not None:
+                return cached
+
+    # Each invocation writes its output into a private scratch dir, so concurrent calls never collide.
+    with tempfile.TemporaryDirectory(prefix="codex-run-") as scratch:
+        out_path = Path(scratch) / "result.json"
+        cmd = _codex_command(prompt, schema_path, out_path)
+        proc = _spawn(cmd, working_dir)
+        if stream is None:
+            response = _wait_blocking(proc, cmd, out_path, timeout_seconds, cancel)
+        else:
+            response = _wait_streaming(proc, cmd, out_path, return_type, timeout_seconds, cancel, stream)
+        result = return_type.model_validate_json(response)
+
+    if cache is not None:
+        cache.put(cache_key, response)
+    return result
+
+
+def run(
+        prompt: str,
+        return_type: type[T],
+        bypass_cache: bool = False,
+        cancel: Optional[threading.Event] = None,
+) -> T:
+    """Run one Codex request; setting `cancel` kills the process and raises `CodexCancelled`."""
+    return _invoke(prompt, return_type, cancel=cancel, bypass_cache=bypass_cache)
+
+
+def run_streaming(
+        prompt: str,
+        return_type: type[T],
+        max_seconds: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        on_progress: Optional[Callable[[CodexProgress], None]] = None,
+        bypass_cache: bool = False,
+        cancel: Optional[threading.Event] = None,
+) -> T:
+    """`run()` that reads the `--json` event stream incrementally.
+
+    Progress and token counts are reported through `on_progress`; the structured output is returned
+    as soon as a final message validates against `return_type`. Exceeding `max_seconds` or
+    `max_tokens` kills the process and raises `CodexBudgetExceeded`.
+    """
+    options = StreamOptions(max_seconds=max_seconds, max_tokens=max_tokens, on_progress=on_progress)
+    return _invoke(prompt, return_type, cancel=cancel, bypass_cache=bypass_cache, stream=options)
+
+
+async def run_async(prompt: str, return_type: type[T], bypass_cache: bool = False) -> T:
+    """`run()` for asyncio callers: the blocking call runs on a worker thread."""
+    return await asyncio.to_thread(_invoke, prompt, return_type, bypass_cache=bypass_cache)
+
+
+# ============================================================
+# Worker pool
+# ============================================================
+
+
+class CodexJob(Generic[T]):
+    """Handle for one queued Codex request."""
+
+    def __init__(
+            self,
+            prompt: str,
+            return_type: type[T],
+            timeout_seconds: Optional[float],
+            bypass_cache: bool,
+            stream: Optional[StreamOptions],
+    ):
+        self.prompt = prompt
+        self.return_type = return_type
+        self.timeout_seconds = timeout_seconds
+        self.bypass_cache = bypass_cache
+        self.stream = stream
+        self.future: Future = Future()
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Drop the request if still queued, or kill its `codex exec` process if running."""
+        self._cancel.set()
+        self.future.cancel()
+
+    def result(self, timeout: Optional[float] = None) -> T:
+        return self.future.result(timeout=timeout)
+
+
+class CodexPool:
+    """Long-lived worker threads that dispatch Codex requests from a queue.
+
+    Workers stay alive between requests, and `codex.yaml` and per-`return_type` schemas are cached
+    across them, so only the `codex exec` process itself is started per request. Invocations use
+    private scratch dirs, so workers run concurrently.
+    """
+
+    def __init__(self, workers: int = 2):
+        self._queue: queue.Queue[Optional[CodexJob]] = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"codex-worker-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> CodexPool:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def submit(
+            self,
+            prompt: str,
+            return_type: type[T],
+            timeout_seconds: Optional[float] = None,
+            bypass_cache: bool = False,
+            stream: Optional[StreamOptions] = None,
+    ) -> CodexJob[T]:
+        job = CodexJob(prompt, return_type, timeout_seconds, bypass_cache, stream)
+        self._queue.put(job)
+        return job
+
+    def close(self, cancel_pending: bool = False) -> None:
+        if cancel_pending:
+            while True:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None:
+                    job.cancel()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
 
-    return return_type.model_validate_json(out_path.read_text(encoding="utf-8"))
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = _invoke(
+                    job.prompt, job.return_type, job.timeout_seconds, job._cancel, job.bypass_cache, job.stream
+                )
+            except BaseException as exc:
+                job.future.set_exception(exc)
+            else:
+                job.future.set_result(result)